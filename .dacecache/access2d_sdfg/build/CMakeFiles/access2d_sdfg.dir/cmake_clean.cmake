@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/access2d_sdfg.dir/root/package/.dacecache/access2d_sdfg/src/cpu/access2d_sdfg.cpp.o"
+  "CMakeFiles/access2d_sdfg.dir/root/package/.dacecache/access2d_sdfg/src/cpu/access2d_sdfg.cpp.o.d"
+  "libaccess2d_sdfg.pdb"
+  "libaccess2d_sdfg.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/access2d_sdfg.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
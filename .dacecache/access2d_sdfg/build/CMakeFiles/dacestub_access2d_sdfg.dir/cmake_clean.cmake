@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_access2d_sdfg.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_access2d_sdfg.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_access2d_sdfg.pdb"
+  "libdacestub_access2d_sdfg.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_access2d_sdfg.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * access2d_sdfgHandle_t;
+extern "C" access2d_sdfgHandle_t __dace_init_access2d_sdfg();
+extern "C" int __dace_exit_access2d_sdfg(access2d_sdfgHandle_t handle);
+extern "C" void __program_access2d_sdfg(access2d_sdfgHandle_t handle, double * __restrict__ A);
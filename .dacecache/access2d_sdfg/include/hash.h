@@ -0,0 +1 @@
+#define __HASH_access2d_sdfg "2d114c451c6422b7c234c97788847a4b737b12f2664b4cca79203a2ca80ee929"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/access2d_sdfg.h"
+
+int main(int argc, char **argv) {
+    access2d_sdfgHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(8, sizeof(double));
+
+
+    handle = __dace_init_access2d_sdfg();
+    __program_access2d_sdfg(handle, A);
+    err = __dace_exit_access2d_sdfg(handle);
+
+    free(A);
+
+
+    return err;
+}
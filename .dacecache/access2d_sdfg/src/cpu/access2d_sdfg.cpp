@@ -0,0 +1,81 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct access2d_sdfg_state_t {
+
+};
+
+void __program_access2d_sdfg_internal(access2d_sdfg_state_t*__state, double * __restrict__ A)
+{
+
+
+    if ((A[3] < 0.5)) {
+        {
+
+            {
+                double a;
+
+                ///////////////////
+                // Tasklet code (assign)
+                a = 100.0;
+                ///////////////////
+
+                A[0] = a;
+            }
+
+        }
+
+    } else {
+        {
+
+            {
+                double a;
+
+                ///////////////////
+                // Tasklet code (assign)
+                a = -100.0;
+                ///////////////////
+
+                A[0] = a;
+            }
+
+        }
+
+    }
+
+}
+
+DACE_EXPORTED void __program_access2d_sdfg(access2d_sdfg_state_t *__state, double * __restrict__ A)
+{
+    __program_access2d_sdfg_internal(__state, A);
+}
+
+DACE_EXPORTED void __program_access2d_sdfg_repeat(access2d_sdfg_state_t *__state, long long __dace_repetitions, double * __restrict__ A)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_access2d_sdfg_internal(__state, A);
+    }
+}
+
+DACE_EXPORTED access2d_sdfg_state_t *__dace_init_access2d_sdfg()
+{
+    int __result = 0;
+    access2d_sdfg_state_t *__state = new access2d_sdfg_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_access2d_sdfg(access2d_sdfg_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/addone.dir/root/package/.dacecache/addone/src/cpu/addone.cpp.o"
+  "CMakeFiles/addone.dir/root/package/.dacecache/addone/src/cpu/addone.cpp.o.d"
+  "libaddone.pdb"
+  "libaddone.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/addone.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
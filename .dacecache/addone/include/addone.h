@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * addoneHandle_t;
+extern "C" addoneHandle_t __dace_init_addone(int N);
+extern "C" int __dace_exit_addone(addoneHandle_t handle);
+extern "C" void __program_addone(addoneHandle_t handle, double * __restrict__ __return, double * __restrict__ a, int N);
@@ -0,0 +1 @@
+#define __HASH_addone "d3a1f227c124ee1922d41e1178a08b0fb3b1e4e0e4dc38f284c26ff277524a2b"
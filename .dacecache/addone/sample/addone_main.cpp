@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/addone.h"
+
+int main(int argc, char **argv) {
+    addoneHandle_t handle;
+    int err;
+    int N = 42;
+    double * __restrict__ __return = (double*) calloc(N, sizeof(double));
+    double * __restrict__ a = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_addone(N);
+    __program_addone(handle, __return, a, N);
+    err = __dace_exit_addone(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
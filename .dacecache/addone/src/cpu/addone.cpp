@@ -0,0 +1,66 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct addone_state_t {
+
+};
+
+void __program_addone_internal(addone_state_t*__state, double * __restrict__ __return, double * __restrict__ a, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    double __in1 = a[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + dace::float64(1));
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_addone(addone_state_t *__state, double * __restrict__ __return, double * __restrict__ a, int N)
+{
+    __program_addone_internal(__state, __return, a, N);
+}
+
+DACE_EXPORTED void __program_addone_repeat(addone_state_t *__state, long long __dace_repetitions, double * __restrict__ __return, double * __restrict__ a, int N)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_addone_internal(__state, __return, a, N);
+    }
+}
+
+DACE_EXPORTED addone_state_t *__dace_init_addone(int N)
+{
+    int __result = 0;
+    addone_state_t *__state = new addone_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_addone(addone_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
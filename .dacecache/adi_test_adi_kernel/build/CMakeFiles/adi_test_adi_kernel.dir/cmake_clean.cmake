@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/adi_test_adi_kernel.dir/root/package/.dacecache/adi_test_adi_kernel/src/cpu/adi_test_adi_kernel.cpp.o"
+  "CMakeFiles/adi_test_adi_kernel.dir/root/package/.dacecache/adi_test_adi_kernel/src/cpu/adi_test_adi_kernel.cpp.o.d"
+  "libadi_test_adi_kernel.pdb"
+  "libadi_test_adi_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/adi_test_adi_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_adi_test_adi_kernel.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_adi_test_adi_kernel.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_adi_test_adi_kernel.pdb"
+  "libdacestub_adi_test_adi_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_adi_test_adi_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_adi_test_adi_kernel "489e0be308de426048eee2abda1f9ddcae639b5123cb6ead24791e27e36a2eb8"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_lifetime_test_perscal_1.dir/root/package/.dacecache/allocation_lifetime_test_perscal/src/cpu/allocation_lifetime_test_perscal_1.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_perscal_1.dir/root/package/.dacecache/allocation_lifetime_test_perscal/src/cpu/allocation_lifetime_test_perscal_1.cpp.o.d"
+  "liballocation_lifetime_test_perscal_1.pdb"
+  "liballocation_lifetime_test_perscal_1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_lifetime_test_perscal_1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
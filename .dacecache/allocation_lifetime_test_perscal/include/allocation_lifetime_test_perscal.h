@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * allocation_lifetime_test_perscalHandle_t;
+extern "C" allocation_lifetime_test_perscalHandle_t __dace_init_allocation_lifetime_test_perscal();
+extern "C" int __dace_exit_allocation_lifetime_test_perscal(allocation_lifetime_test_perscalHandle_t handle);
+extern "C" void __program_allocation_lifetime_test_perscal(allocation_lifetime_test_perscalHandle_t handle, double * __restrict__ __return, double * __restrict__ a);
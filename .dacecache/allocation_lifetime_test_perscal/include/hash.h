@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_perscal_1 "0d914261a19a378e2049fe553375f1e0d6d0ce280ff5f940f801c7e403d33ce3"
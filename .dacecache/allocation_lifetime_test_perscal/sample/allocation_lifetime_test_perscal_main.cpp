@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/allocation_lifetime_test_perscal.h"
+
+int main(int argc, char **argv) {
+    allocation_lifetime_test_perscalHandle_t handle;
+    int err;
+    double * __restrict__ __return = (double*) calloc(1, sizeof(double));
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_allocation_lifetime_test_perscal();
+    __program_allocation_lifetime_test_perscal(handle, __return, a);
+    err = __dace_exit_allocation_lifetime_test_perscal(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
@@ -0,0 +1,88 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_perscal_state_t {
+    double __0_tmp;
+};
+
+void __program_allocation_lifetime_test_perscal_internal(allocation_lifetime_test_perscal_state_t*__state, double * __restrict__ __return, double * __restrict__ a)
+{
+
+    {
+        double __tmp1;
+        double __tmp2;
+
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        a + 1, &__tmp1, 1);
+        {
+            double __in1 = __tmp1;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::float64(1));
+            ///////////////////
+
+            __tmp2 = __out;
+        }
+        {
+            double __inp = __tmp2;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_356_4)
+            __out = __inp;
+            ///////////////////
+
+            __state->__0_tmp = __out;
+        }
+        {
+            double __inp = __state->__0_tmp;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_357_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_perscal(allocation_lifetime_test_perscal_state_t *__state, double * __restrict__ __return, double * __restrict__ a)
+{
+    __program_allocation_lifetime_test_perscal_internal(__state, __return, a);
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_perscal_repeat(allocation_lifetime_test_perscal_state_t *__state, long long __dace_repetitions, double * __restrict__ __return, double * __restrict__ a)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_allocation_lifetime_test_perscal_internal(__state, __return, a);
+    }
+}
+
+DACE_EXPORTED allocation_lifetime_test_perscal_state_t *__dace_init_allocation_lifetime_test_perscal()
+{
+    int __result = 0;
+    allocation_lifetime_test_perscal_state_t *__state = new allocation_lifetime_test_perscal_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_perscal(allocation_lifetime_test_perscal_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
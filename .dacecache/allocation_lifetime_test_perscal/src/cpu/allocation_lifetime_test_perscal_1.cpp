@@ -0,0 +1,94 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_perscal_1_state_t {
+    int __0_tmp;
+    int __0_tmp2;
+};
+
+void __program_allocation_lifetime_test_perscal_1_internal(allocation_lifetime_test_perscal_1_state_t*__state, double * __restrict__ a)
+{
+
+    {
+
+        {
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_389_4)
+            __out = 1;
+            ///////////////////
+
+            __state->__0_tmp = __out;
+        }
+        {
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_390_4)
+            __out = 2;
+            ///////////////////
+
+            __state->__0_tmp2 = __out;
+        }
+        double __aa_value;
+        {
+            double aa;
+
+            ///////////////////
+            // Tasklet code (allocation_lifetime_392)
+            aa = 5;
+            ///////////////////
+
+            __aa_value = aa;
+        }
+        {
+            const double lookup = __aa_value;
+            int index___tmp1_0 = __state->__0_tmp2;
+            int index___tmp0_0 = __state->__0_tmp;
+            double* __ind_aa = a;
+
+            ///////////////////
+            // Tasklet code (Indirection)
+            __ind_aa[(index___tmp0_0 + index___tmp1_0)] = lookup;
+            ///////////////////
+
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_perscal_1(allocation_lifetime_test_perscal_1_state_t *__state, double * __restrict__ a)
+{
+    __program_allocation_lifetime_test_perscal_1_internal(__state, a);
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_perscal_1_repeat(allocation_lifetime_test_perscal_1_state_t *__state, long long __dace_repetitions, double * __restrict__ a)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_allocation_lifetime_test_perscal_1_internal(__state, a);
+    }
+}
+
+DACE_EXPORTED allocation_lifetime_test_perscal_1_state_t *__dace_init_allocation_lifetime_test_perscal_1()
+{
+    int __result = 0;
+    allocation_lifetime_test_perscal_1_state_t *__state = new allocation_lifetime_test_perscal_1_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_perscal_1(allocation_lifetime_test_perscal_1_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
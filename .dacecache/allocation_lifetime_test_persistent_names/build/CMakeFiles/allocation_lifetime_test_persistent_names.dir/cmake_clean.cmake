@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/allocation_lifetime_test_persistent_names.dir/root/package/.dacecache/allocation_lifetime_test_persistent_names/src/cpu/allocation_lifetime_test_persistent_names.cpp.o"
+  "CMakeFiles/allocation_lifetime_test_persistent_names.dir/root/package/.dacecache/allocation_lifetime_test_persistent_names/src/cpu/allocation_lifetime_test_persistent_names.cpp.o.d"
+  "liballocation_lifetime_test_persistent_names.pdb"
+  "liballocation_lifetime_test_persistent_names.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/allocation_lifetime_test_persistent_names.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_persistent_names "742dcb9c77b6f5de2cff873adb0e74ba13e66ebf48a70a123cf1031dd5c9e9d2"
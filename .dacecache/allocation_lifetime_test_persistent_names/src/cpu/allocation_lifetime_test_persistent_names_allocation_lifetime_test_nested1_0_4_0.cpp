@@ -0,0 +1,28 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+
+struct allocation_lifetime_test_persistent_names_state_t {
+
+};
+
+void allocation_lifetime_test_nested1_0_4_0(allocation_lifetime_test_persistent_names_state_t *__state, double* __restrict__ __tmp4, double* __restrict__ __tmp5) {
+
+
+
+    {
+
+
+        dace::CopyND<double, 1, false, 4>::template ConstDst<1>::Copy(
+        __tmp4, __2_B, 1);
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 4>::template ConstDst<1>::Copy(
+        __2_B, __tmp5, 1);
+
+    }
+    
+}
+
@@ -0,0 +1,53 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+
+struct allocation_lifetime_test_persistent_names_state_t {
+
+};
+
+void allocation_lifetime_test_nested2_0_2_0(allocation_lifetime_test_persistent_names_state_t *__state, double* __restrict__ __tmp2, double* __restrict__ __tmp3) {
+    double *__tmp1;
+    __tmp1 = new double DACE_ALIGN(64)[4];
+
+
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 2; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 2; __i1 += 1) {
+                    {
+                        double __in1 = __tmp2[((2 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (__in1 + dace::float64(1));
+                        ///////////////////
+
+                        __tmp1[((2 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 4>::template ConstDst<1>::Copy(
+        __tmp1, __1_B, 1);
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 4>::template ConstDst<1>::Copy(
+        __1_B, __tmp3, 1);
+
+    }
+    delete[] __tmp1;
+    
+}
+
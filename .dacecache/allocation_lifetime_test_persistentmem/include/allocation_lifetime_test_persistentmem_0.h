@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * allocation_lifetime_test_persistentmem_0Handle_t;
+extern "C" allocation_lifetime_test_persistentmem_0Handle_t __dace_init_allocation_lifetime_test_persistentmem_0();
+extern "C" int __dace_exit_allocation_lifetime_test_persistentmem_0(allocation_lifetime_test_persistentmem_0Handle_t handle);
+extern "C" void __program_allocation_lifetime_test_persistentmem_0(allocation_lifetime_test_persistentmem_0Handle_t handle, int * __restrict__ output);
@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_persistentmem "71efd261dc43b36aaa9bc00782d9c95618035f846762bcedccc78015efe9884d"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/allocation_lifetime_test_persistentmem.h"
+
+int main(int argc, char **argv) {
+    allocation_lifetime_test_persistentmemHandle_t handle;
+    int err;
+    int * __restrict__ output = (int*) calloc(2, sizeof(int));
+
+
+    handle = __dace_init_allocation_lifetime_test_persistentmem();
+    __program_allocation_lifetime_test_persistentmem(handle, output);
+    err = __dace_exit_allocation_lifetime_test_persistentmem(handle);
+
+    free(output);
+
+
+    return err;
+}
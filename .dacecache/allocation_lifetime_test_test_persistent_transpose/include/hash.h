@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_test_persistent_transpose "a6b7ddc159756a48e5c1f0928901d2a4f7838215cbeb64240d397a1c0b1ec26a"
@@ -0,0 +1,70 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_test_persistent_transpose_state_t {
+    dace::cuda::Context *gpu_context;
+    double * __restrict__ __0_gpu_A;
+    double * __restrict__ __0_gpu___return;
+};
+
+DACE_EXPORTED void __dace_runkernel_transpose_map_0_0_2(allocation_lifetime_test_test_persistent_transpose_state_t *__state, const double * __restrict__ gpu_A, double * __restrict__ gpu___return);
+void __program_allocation_lifetime_test_test_persistent_transpose_internal(allocation_lifetime_test_test_persistent_transpose_state_t*__state, double * __restrict__ A, double * __restrict__ __return)
+{
+
+    {
+
+        DACE_GPU_CHECK(cudaMemcpyAsync(__state->__0_gpu_A, A, 15 * sizeof(double), cudaMemcpyHostToDevice, __state->gpu_context->streams[0]));
+        __dace_runkernel_transpose_map_0_0_2(__state, __state->__0_gpu_A, __state->__0_gpu___return);
+        DACE_GPU_CHECK(cudaMemcpyAsync(__return, __state->__0_gpu___return, 15 * sizeof(double), cudaMemcpyDeviceToHost, __state->gpu_context->streams[0]));
+        DACE_GPU_CHECK(cudaStreamSynchronize(__state->gpu_context->streams[0]));
+
+
+    }
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_test_persistent_transpose(allocation_lifetime_test_test_persistent_transpose_state_t *__state, double * __restrict__ A, double * __restrict__ __return)
+{
+    __program_allocation_lifetime_test_test_persistent_transpose_internal(__state, A, __return);
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_test_persistent_transpose_repeat(allocation_lifetime_test_test_persistent_transpose_state_t *__state, long long __dace_repetitions, double * __restrict__ A, double * __restrict__ __return)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_allocation_lifetime_test_test_persistent_transpose_internal(__state, A, __return);
+    }
+}
+DACE_EXPORTED int __dace_init_cuda(allocation_lifetime_test_test_persistent_transpose_state_t *__state);
+DACE_EXPORTED int __dace_exit_cuda(allocation_lifetime_test_test_persistent_transpose_state_t *__state);
+
+DACE_EXPORTED allocation_lifetime_test_test_persistent_transpose_state_t *__dace_init_allocation_lifetime_test_test_persistent_transpose()
+{
+    int __result = 0;
+    allocation_lifetime_test_test_persistent_transpose_state_t *__state = new allocation_lifetime_test_test_persistent_transpose_state_t;
+
+
+    __result |= __dace_init_cuda(__state);
+    DACE_GPU_CHECK(cudaMalloc((void**)&__state->__0_gpu_A, 15 * sizeof(double)));
+    DACE_GPU_CHECK(cudaMalloc((void**)&__state->__0_gpu___return, 15 * sizeof(double)));
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_test_persistent_transpose(allocation_lifetime_test_test_persistent_transpose_state_t *__state)
+{
+    int __err = 0;
+    DACE_GPU_CHECK(cudaFree(__state->__0_gpu_A));
+    DACE_GPU_CHECK(cudaFree(__state->__0_gpu___return));
+
+    int __err_cuda = __dace_exit_cuda(__state);
+    if (__err_cuda) {
+        __err = __err_cuda;
+    }
+    delete __state;
+    return __err;
+}
+
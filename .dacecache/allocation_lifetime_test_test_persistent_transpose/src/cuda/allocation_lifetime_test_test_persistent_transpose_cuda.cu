@@ -0,0 +1,127 @@
+
+#include <cuda_runtime.h>
+#include <dace/dace.h>
+
+
+struct allocation_lifetime_test_test_persistent_transpose_state_t {
+    dace::cuda::Context *gpu_context;
+    double * __restrict__ __0_gpu_A;
+    double * __restrict__ __0_gpu___return;
+};
+
+
+
+DACE_EXPORTED int __dace_init_cuda(allocation_lifetime_test_test_persistent_transpose_state_t *__state);
+DACE_EXPORTED int __dace_exit_cuda(allocation_lifetime_test_test_persistent_transpose_state_t *__state);
+
+
+
+int __dace_init_cuda(allocation_lifetime_test_test_persistent_transpose_state_t *__state) {
+    int count;
+
+    // Check that we are able to run cuda code
+    if (cudaGetDeviceCount(&count) != cudaSuccess)
+    {
+        printf("ERROR: GPU drivers are not configured or cuda-capable device "
+               "not found\n");
+        return 1;
+    }
+    if (count == 0)
+    {
+        printf("ERROR: No cuda-capable devices found\n");
+        return 2;
+    }
+
+    // Initialize cuda before we run the application
+    float *dev_X;
+    DACE_GPU_CHECK(cudaMalloc((void **) &dev_X, 1));
+    DACE_GPU_CHECK(cudaFree(dev_X));
+
+    
+
+    __state->gpu_context = new dace::cuda::Context(1, 1);
+
+    // Create cuda streams and events
+    for(int i = 0; i < 1; ++i) {
+        DACE_GPU_CHECK(cudaStreamCreateWithFlags(&__state->gpu_context->internal_streams[i], cudaStreamNonBlocking));
+        __state->gpu_context->streams[i] = __state->gpu_context->internal_streams[i]; // Allow for externals to modify streams
+    }
+    for(int i = 0; i < 1; ++i) {
+        DACE_GPU_CHECK(cudaEventCreateWithFlags(&__state->gpu_context->events[i], cudaEventDisableTiming));
+    }
+
+    
+
+    return 0;
+}
+
+int __dace_exit_cuda(allocation_lifetime_test_test_persistent_transpose_state_t *__state) {
+    
+
+    // Synchronize and check for CUDA errors
+    int __err = static_cast<int>(__state->gpu_context->lasterror);
+    if (__err == 0)
+        __err = static_cast<int>(cudaDeviceSynchronize());
+
+    // Destroy cuda streams and events
+    for(int i = 0; i < 1; ++i) {
+        DACE_GPU_CHECK(cudaStreamDestroy(__state->gpu_context->internal_streams[i]));
+    }
+    for(int i = 0; i < 1; ++i) {
+        DACE_GPU_CHECK(cudaEventDestroy(__state->gpu_context->events[i]));
+    }
+
+    delete __state->gpu_context;
+    return __err;
+}
+
+DACE_EXPORTED bool __dace_gpu_set_stream(allocation_lifetime_test_test_persistent_transpose_state_t *__state, int streamid, gpuStream_t stream)
+{
+    if (streamid < 0 || streamid >= 1)
+        return false;
+
+    __state->gpu_context->streams[streamid] = stream;
+
+    return true;
+}
+
+DACE_EXPORTED void __dace_gpu_set_all_streams(allocation_lifetime_test_test_persistent_transpose_state_t *__state, gpuStream_t stream)
+{
+    for (int i = 0; i < 1; ++i)
+        __state->gpu_context->streams[i] = stream;
+}
+
+__global__ void __launch_bounds__(32) transpose_map_0_0_2(const double * __restrict__ gpu_A, double * __restrict__ gpu___return) {
+    {
+        {
+            int __i1 = (blockIdx.x * 32 + threadIdx.x);
+            int __i0 = (blockIdx.y * 1 + threadIdx.y);
+            if (__i1 < 3) {
+                {
+                    {
+                        double __inp = gpu_A[((3 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (transpose)
+                        __out = __inp;
+                        ///////////////////
+
+                        gpu___return[(__i0 + (5 * __i1))] = __out;
+                    }
+                }
+            }
+        }
+    }
+}
+
+
+DACE_EXPORTED void __dace_runkernel_transpose_map_0_0_2(allocation_lifetime_test_test_persistent_transpose_state_t *__state, const double * __restrict__ gpu_A, double * __restrict__ gpu___return);
+void __dace_runkernel_transpose_map_0_0_2(allocation_lifetime_test_test_persistent_transpose_state_t *__state, const double * __restrict__ gpu_A, double * __restrict__ gpu___return)
+{
+
+    void  *transpose_map_0_0_2_args[] = { (void *)&gpu_A, (void *)&gpu___return };
+    gpuError_t __err = cudaLaunchKernel((void*)transpose_map_0_0_2, dim3(1, 5, 1), dim3(32, 1, 1), transpose_map_0_0_2_args, 0, __state->gpu_context->streams[0]);
+    DACE_KERNEL_LAUNCH_CHECK(__err, "transpose_map_0_0_2", 1, 5, 1, 32, 1, 1);
+}
+
@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_top "cc7ea3266f3ff7be01ddbf1f1af3a9ff5a21f5bff764063c9a5657a7920c9c87"
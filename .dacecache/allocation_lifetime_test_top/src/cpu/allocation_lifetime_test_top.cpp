@@ -0,0 +1,95 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_top_state_t {
+    double * __restrict__ __0_tmp;
+};
+
+inline void allocation_lifetime_test_incall_0_2_0(allocation_lifetime_test_top_state_t *__state, double* __restrict__ b, double* __restrict__ __return, double* __restrict__ __tmp1) {
+    double* __tmp1_0;
+    __tmp1_0 = &__tmp1[0];
+    double* tmp;
+    tmp = &__tmp1_0[0];
+
+
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 10; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 2; __i1 += 1) {
+                    {
+                        double __in1 = tmp[((2 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (augassign_313_4)
+                        __out = (__in1 + 1);
+                        ///////////////////
+
+                        tmp[((2 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 20>::template ConstDst<1>::Copy(
+        tmp, __return, 1);
+
+    }
+    
+}
+
+void __program_allocation_lifetime_test_top_internal(allocation_lifetime_test_top_state_t*__state, double * __restrict__ __return, double * __restrict__ a)
+{
+
+
+
+    {
+
+        allocation_lifetime_test_incall_0_2_0(__state, &__state->__0_tmp[0], &__return[0], &a[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_top(allocation_lifetime_test_top_state_t *__state, double * __restrict__ __return, double * __restrict__ a)
+{
+    __program_allocation_lifetime_test_top_internal(__state, __return, a);
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_top_repeat(allocation_lifetime_test_top_state_t *__state, long long __dace_repetitions, double * __restrict__ __return, double * __restrict__ a)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_allocation_lifetime_test_top_internal(__state, __return, a);
+    }
+}
+
+DACE_EXPORTED allocation_lifetime_test_top_state_t *__dace_init_allocation_lifetime_test_top()
+{
+    int __result = 0;
+    allocation_lifetime_test_top_state_t *__state = new allocation_lifetime_test_top_state_t;
+
+
+    __state->__0_tmp = new double DACE_ALIGN(64)[20];
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_top(allocation_lifetime_test_top_state_t *__state)
+{
+    int __err = 0;
+    delete[] __state->__0_tmp;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1 @@
+#define __HASH_allocation_lifetime_test_toppers "8f55597dcf4f7227b063b7a97244d0459306d170721e2772e839bd7ec72e7aeb"
@@ -0,0 +1,88 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct allocation_lifetime_test_toppers_state_t {
+    double * __restrict__ __1___tmp1;
+};
+
+inline void allocation_lifetime_test_nestpers_0_1_0(allocation_lifetime_test_toppers_state_t *__state, double* __restrict__ __tmp2, double* __restrict__ __return) {
+
+
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                {
+                    double __in1 = __tmp2[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + dace::float64(1));
+                    ///////////////////
+
+                    __state->__1___tmp1[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 20>::template ConstDst<1>::Copy(
+        __state->__1___tmp1, __return, 1);
+
+    }
+    
+}
+
+void __program_allocation_lifetime_test_toppers_internal(allocation_lifetime_test_toppers_state_t*__state, double * __restrict__ __return, double * __restrict__ a)
+{
+
+
+    {
+
+        allocation_lifetime_test_nestpers_0_1_0(__state, &a[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_toppers(allocation_lifetime_test_toppers_state_t *__state, double * __restrict__ __return, double * __restrict__ a)
+{
+    __program_allocation_lifetime_test_toppers_internal(__state, __return, a);
+}
+
+DACE_EXPORTED void __program_allocation_lifetime_test_toppers_repeat(allocation_lifetime_test_toppers_state_t *__state, long long __dace_repetitions, double * __restrict__ __return, double * __restrict__ a)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_allocation_lifetime_test_toppers_internal(__state, __return, a);
+    }
+}
+
+DACE_EXPORTED allocation_lifetime_test_toppers_state_t *__dace_init_allocation_lifetime_test_toppers()
+{
+    int __result = 0;
+    allocation_lifetime_test_toppers_state_t *__state = new allocation_lifetime_test_toppers_state_t;
+
+
+    __state->__1___tmp1 = new double DACE_ALIGN(64)[20];
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_allocation_lifetime_test_toppers(allocation_lifetime_test_toppers_state_t *__state)
+{
+    int __err = 0;
+    delete[] __state->__1___tmp1;
+    delete __state;
+    return __err;
+}
+
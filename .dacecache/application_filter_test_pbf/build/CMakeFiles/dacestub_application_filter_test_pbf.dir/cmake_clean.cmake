@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_application_filter_test_pbf.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_application_filter_test_pbf.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_application_filter_test_pbf.pdb"
+  "libdacestub_application_filter_test_pbf.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_application_filter_test_pbf.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
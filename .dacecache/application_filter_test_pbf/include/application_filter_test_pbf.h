@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * application_filter_test_pbfHandle_t;
+extern "C" application_filter_test_pbfHandle_t __dace_init_application_filter_test_pbf(int N);
+extern "C" int __dace_exit_application_filter_test_pbf(application_filter_test_pbfHandle_t handle);
+extern "C" void __program_application_filter_test_pbf(application_filter_test_pbfHandle_t handle, float * __restrict__ A, float * __restrict__ out, unsigned int * __restrict__ outsz, int N, float ratio);
@@ -0,0 +1 @@
+#define __HASH_application_filter_test_pbf "4a8aef3e8ab27311aa562b83165b84b88b3dd6c4dd960f472c2f6eae06cce370"
@@ -0,0 +1,88 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct application_filter_test_pbf_state_t {
+
+};
+
+#include <arm_sve.h>
+#define __SVE_REGISTER_BYTES 64
+void __program_application_filter_test_pbf_internal(application_filter_test_pbf_state_t*__state, float * __restrict__ A, float * __restrict__ out, unsigned int * __restrict__ outsz, int N, float ratio)
+{
+
+    {
+        dace::ArrayStreamView<float> ostream (out);
+
+        {
+            int i = 0;
+            int __i_to = (N - 1);
+            svbool_t __pg_i = svwhilele_b32(i, __i_to);
+            while(svptest_any(svptrue_b32(), __pg_i)) {
+                {
+                    svfloat32_t a = svld1(__pg_i, A + i);
+                    float r = ratio;
+
+                    ///////////////////
+                    // Tasklet code (filter)
+                    // ==== If ===
+                    {
+                        svbool_t __pg_acc_1 = __pg_i;
+                        svbool_t __pg_test_1_1 = svcmpgt(__pg_acc_1, a, svdup_f32(r));
+                        __pg_acc_1 = svbic_z(__pg_acc_1, __pg_acc_1, __pg_test_1_1);
+                        // Case (a > r) { {
+
+                                // === Stream push ===
+                                float __tmp[__SVE_REGISTER_BYTES / 4];
+                                size_t __cnt = svcntp_b32(__pg_test_1_1, __pg_test_1_1);
+                                svst1(svwhilelt_b32(0, (int) __cnt), __tmp, svcompact(__pg_test_1_1, a));
+                                ostream.push(&__tmp[0], __cnt);
+                            }
+                            dace::wcr_fixed<dace::ReductionType::Sum, unsigned int>::reduce(outsz, svaddv(__pg_test_1_1, svdup_u32((unsigned int) 1)));
+                        }
+                    }
+                    // ==== End If ===
+                    ///////////////////
+
+                }
+                i += svcntw() * 1;
+                __pg_i = svwhilele_b32(i, __i_to);
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_application_filter_test_pbf(application_filter_test_pbf_state_t *__state, float * __restrict__ A, float * __restrict__ out, unsigned int * __restrict__ outsz, int N, float ratio)
+{
+    __program_application_filter_test_pbf_internal(__state, A, out, outsz, N, ratio);
+}
+
+DACE_EXPORTED void __program_application_filter_test_pbf_repeat(application_filter_test_pbf_state_t *__state, long long __dace_repetitions, float * __restrict__ A, float * __restrict__ out, unsigned int * __restrict__ outsz, int N, float ratio)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_application_filter_test_pbf_internal(__state, A, out, outsz, N, ratio);
+    }
+}
+
+DACE_EXPORTED application_filter_test_pbf_state_t *__dace_init_application_filter_test_pbf(int N)
+{
+    int __result = 0;
+    application_filter_test_pbf_state_t *__state = new application_filter_test_pbf_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_application_filter_test_pbf(application_filter_test_pbf_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
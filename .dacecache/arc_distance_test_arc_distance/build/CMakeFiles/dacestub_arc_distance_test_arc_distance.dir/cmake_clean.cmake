@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_arc_distance_test_arc_distance.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_arc_distance_test_arc_distance.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_arc_distance_test_arc_distance.pdb"
+  "libdacestub_arc_distance_test_arc_distance.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_arc_distance_test_arc_distance.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_arc_distance_test_arc_distance "378bc18d660dc8c3f05ff86f7f75434cf6a53966ca3c59525da935bec9002443"
@@ -0,0 +1,276 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct arc_distance_test_arc_distance_state_t {
+
+};
+
+void __program_arc_distance_test_arc_distance_internal(arc_distance_test_arc_distance_state_t*__state, double * __restrict__ __return, double * __restrict__ phi_1, double * __restrict__ phi_2, double * __restrict__ theta_1, double * __restrict__ theta_2, long long N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                double temp[1]  DACE_ALIGN(64);
+                double __s0_n12__out_n13IN___tmp7;
+                {
+                    double __in2 = phi_1[__i0];
+                    double __in1 = phi_2[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Sub_)
+                    __out = (__in1 - __in2);
+                    ///////////////////
+
+                    __s0_n12__out_n13IN___tmp7 = __out;
+                }
+                double __s0_n15__out_n16IN___tmp8;
+                {
+                    const double __in1 = __s0_n12__out_n13IN___tmp7;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Div_)
+                    __out = (__in1 / dace::float64(2));
+                    ///////////////////
+
+                    __s0_n15__out_n16IN___tmp8 = __out;
+                }
+                double __s0_n16__out_n17IN___tmp9;
+                {
+                    const double __in1 = __s0_n15__out_n16IN___tmp8;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_sin_)
+                    __out = sin(__in1);
+                    ///////////////////
+
+                    __s0_n16__out_n17IN___tmp9 = __out;
+                }
+                double __s0_n17__out_n18IN___tmp10;
+                {
+                    const double __in1 = __s0_n16__out_n17IN___tmp9;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __s0_n17__out_n18IN___tmp10 = __out;
+                }
+                double __s0_n10__out_n11IN___tmp5;
+                {
+                    double __in1 = theta_2[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_cos_)
+                    __out = cos(__in1);
+                    ///////////////////
+
+                    __s0_n10__out_n11IN___tmp5 = __out;
+                }
+                double __s0_n8__out_n9IN___tmp4;
+                {
+                    double __in1 = theta_1[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_cos_)
+                    __out = cos(__in1);
+                    ///////////////////
+
+                    __s0_n8__out_n9IN___tmp4 = __out;
+                }
+                double __s0_n10__out_n11IN___tmp6;
+                {
+                    const double __in1 = __s0_n8__out_n9IN___tmp4;
+                    const double __in2 = __s0_n10__out_n11IN___tmp5;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * __in2);
+                    ///////////////////
+
+                    __s0_n10__out_n11IN___tmp6 = __out;
+                }
+                double __s0_n17__out_n18IN___tmp11;
+                {
+                    const double __in1 = __s0_n10__out_n11IN___tmp6;
+                    const double __in2 = __s0_n17__out_n18IN___tmp10;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * __in2);
+                    ///////////////////
+
+                    __s0_n17__out_n18IN___tmp11 = __out;
+                }
+                double __s0_n1__out_n2IN___tmp0;
+                {
+                    double __in2 = theta_1[__i0];
+                    double __in1 = theta_2[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Sub_)
+                    __out = (__in1 - __in2);
+                    ///////////////////
+
+                    __s0_n1__out_n2IN___tmp0 = __out;
+                }
+                double __s0_n4__out_n5IN___tmp1;
+                {
+                    const double __in1 = __s0_n1__out_n2IN___tmp0;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Div_)
+                    __out = (__in1 / dace::float64(2));
+                    ///////////////////
+
+                    __s0_n4__out_n5IN___tmp1 = __out;
+                }
+                double __s0_n5__out_n6IN___tmp2;
+                {
+                    const double __in1 = __s0_n4__out_n5IN___tmp1;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_sin_)
+                    __out = sin(__in1);
+                    ///////////////////
+
+                    __s0_n5__out_n6IN___tmp2 = __out;
+                }
+                double __s0_n6__out_n7IN___tmp3;
+                {
+                    const double __in1 = __s0_n5__out_n6IN___tmp2;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __s0_n6__out_n7IN___tmp3 = __out;
+                }
+                {
+                    const double __in1 = __s0_n6__out_n7IN___tmp3;
+                    const double __in2 = __s0_n17__out_n18IN___tmp11;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    temp[0] = __out;
+                }
+                double __s0_n23__out_n24IN___tmp14;
+                {
+                    double __in2 = temp[0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Sub_)
+                    __out = (dace::float64(1) - __in2);
+                    ///////////////////
+
+                    __s0_n23__out_n24IN___tmp14 = __out;
+                }
+                double __s0_n24__out_n25IN___tmp15;
+                {
+                    const double __in1 = __s0_n23__out_n24IN___tmp14;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_sqrt_)
+                    __out = sqrt(__in1);
+                    ///////////////////
+
+                    __s0_n24__out_n25IN___tmp15 = __out;
+                }
+                double __s0_n21__out_n22IN___tmp13;
+                {
+                    double __in1 = temp[0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_sqrt_)
+                    __out = sqrt(__in1);
+                    ///////////////////
+
+                    __s0_n21__out_n22IN___tmp13 = __out;
+                }
+                double __s0_n24__out_n25IN___tmp16;
+                {
+                    const double __in1 = __s0_n21__out_n22IN___tmp13;
+                    const double __in2 = __s0_n24__out_n25IN___tmp15;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_arctan2_)
+                    __out = atan2(__in1, __in2);
+                    ///////////////////
+
+                    __s0_n24__out_n25IN___tmp16 = __out;
+                }
+                {
+                    const double __in2 = __s0_n24__out_n25IN___tmp16;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (dace::float64(2) * __in2);
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_arc_distance_test_arc_distance(arc_distance_test_arc_distance_state_t *__state, double * __restrict__ __return, double * __restrict__ phi_1, double * __restrict__ phi_2, double * __restrict__ theta_1, double * __restrict__ theta_2, long long N)
+{
+    __program_arc_distance_test_arc_distance_internal(__state, __return, phi_1, phi_2, theta_1, theta_2, N);
+}
+
+DACE_EXPORTED void __program_arc_distance_test_arc_distance_repeat(arc_distance_test_arc_distance_state_t *__state, long long __dace_repetitions, double * __restrict__ __return, double * __restrict__ phi_1, double * __restrict__ phi_2, double * __restrict__ theta_1, double * __restrict__ theta_2, long long N)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_arc_distance_test_arc_distance_internal(__state, __return, phi_1, phi_2, theta_1, theta_2, N);
+    }
+}
+
+DACE_EXPORTED arc_distance_test_arc_distance_state_t *__dace_init_arc_distance_test_arc_distance(long long N)
+{
+    int __result = 0;
+    arc_distance_test_arc_distance_state_t *__state = new arc_distance_test_arc_distance_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_arc_distance_test_arc_distance(arc_distance_test_arc_distance_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
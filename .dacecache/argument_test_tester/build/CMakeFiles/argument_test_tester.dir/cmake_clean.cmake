@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/argument_test_tester.dir/root/package/.dacecache/argument_test_tester/src/cpu/argument_test_tester.cpp.o"
+  "CMakeFiles/argument_test_tester.dir/root/package/.dacecache/argument_test_tester/src/cpu/argument_test_tester.cpp.o.d"
+  "libargument_test_tester.pdb"
+  "libargument_test_tester.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/argument_test_tester.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
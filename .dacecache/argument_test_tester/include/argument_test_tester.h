@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * argument_test_testerHandle_t;
+extern "C" argument_test_testerHandle_t __dace_init_argument_test_tester();
+extern "C" int __dace_exit_argument_test_tester(argument_test_testerHandle_t handle);
+extern "C" void __program_argument_test_tester(argument_test_testerHandle_t handle, double * __restrict__ x);
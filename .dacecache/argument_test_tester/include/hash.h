@@ -0,0 +1 @@
+#define __HASH_argument_test_tester "01a9211ea8879e5bce86c09528a4e741cbf3f9f589a845262ef4c4967f370abb"
@@ -0,0 +1,149 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct argument_test_tester_state_t {
+
+};
+
+inline void argument_test_nester_23_4_0_1_4(argument_test_tester_state_t *__state, double* __restrict__ __tmp_30_24_r, double&  __tmp_32_8_w, long long __tmp2) {
+    double elem;
+    long long ii;
+
+    {
+
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_27_8)
+            __out = 0;
+            ///////////////////
+
+            elem = __out;
+        }
+
+    }
+
+
+    for (ii = 0; (ii < min(__tmp2, 6)); ii = (ii + 1)) {
+
+        if (((ii % 2) == 0)) {
+            {
+
+                {
+                    double __in1 = elem;
+                    double __in2 = __tmp_30_24_r[ii];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (augassign_30_16)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    elem = __out;
+                }
+
+            }
+
+        }
+
+
+    }
+    {
+
+        {
+            double __inp = elem;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_32_8)
+            __out = __inp;
+            ///////////////////
+
+            __tmp_32_8_w = __out;
+        }
+
+    }
+    
+}
+
+void __program_argument_test_tester_internal(argument_test_tester_state_t*__state, double * __restrict__ x)
+{
+    double *gdx;
+    gdx = new double DACE_ALIGN(64)[10];
+    long long T;
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 10; __i0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_full_)
+                    __out = 1.0;
+                    ///////////////////
+
+                    gdx[__i0] = __out;
+                }
+            }
+        }
+
+    }
+
+
+    for (T = 0; (T < 2); T = (T + 1)) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto i = 0; i < 20; i += 1) {
+                    for (auto j = 0; j < 20; j += 1) {
+                        argument_test_nester_23_4_0_1_4(__state, &gdx[0], x[(i + (20 * j))], T);
+                    }
+                }
+            }
+
+        }
+
+    }
+
+    delete[] gdx;
+}
+
+DACE_EXPORTED void __program_argument_test_tester(argument_test_tester_state_t *__state, double * __restrict__ x)
+{
+    __program_argument_test_tester_internal(__state, x);
+}
+
+DACE_EXPORTED void __program_argument_test_tester_repeat(argument_test_tester_state_t *__state, long long __dace_repetitions, double * __restrict__ x)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_argument_test_tester_internal(__state, x);
+    }
+}
+
+DACE_EXPORTED argument_test_tester_state_t *__dace_init_argument_test_tester()
+{
+    int __result = 0;
+    argument_test_tester_state_t *__state = new argument_test_tester_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_argument_test_tester(argument_test_tester_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
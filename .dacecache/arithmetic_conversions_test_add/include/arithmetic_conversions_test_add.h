@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * arithmetic_conversions_test_addHandle_t;
+extern "C" arithmetic_conversions_test_addHandle_t __dace_init_arithmetic_conversions_test_add();
+extern "C" int __dace_exit_arithmetic_conversions_test_add(arithmetic_conversions_test_addHandle_t handle);
+extern "C" void __program_arithmetic_conversions_test_add(arithmetic_conversions_test_addHandle_t handle, dace::complex64 * __restrict__ A, double * __restrict__ B, dace::complex128 * __restrict__ __return);
@@ -0,0 +1 @@
+#define __HASH_arithmetic_conversions_test_add "683cab8c5ef880937073f55354acf9f7c15a0813063920aedd4c9820b89aadd5"
@@ -0,0 +1,69 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct arithmetic_conversions_test_add_state_t {
+
+};
+
+void __program_arithmetic_conversions_test_add_internal(arithmetic_conversions_test_add_state_t*__state, dace::complex64 * __restrict__ A, double * __restrict__ B, dace::complex128 * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        dace::complex64 __in1 = A[((5 * __i0) + __i1)];
+                        double __in2 = B[((5 * __i0) + __i1)];
+                        dace::complex128 __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (dace::complex128(__in1) + dace::complex128(__in2));
+                        ///////////////////
+
+                        __return[((5 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_arithmetic_conversions_test_add(arithmetic_conversions_test_add_state_t *__state, dace::complex64 * __restrict__ A, double * __restrict__ B, dace::complex128 * __restrict__ __return)
+{
+    __program_arithmetic_conversions_test_add_internal(__state, A, B, __return);
+}
+
+DACE_EXPORTED void __program_arithmetic_conversions_test_add_repeat(arithmetic_conversions_test_add_state_t *__state, long long __dace_repetitions, dace::complex64 * __restrict__ A, double * __restrict__ B, dace::complex128 * __restrict__ __return)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_arithmetic_conversions_test_add_internal(__state, A, B, __return);
+    }
+}
+
+DACE_EXPORTED arithmetic_conversions_test_add_state_t *__dace_init_arithmetic_conversions_test_add()
+{
+    int __result = 0;
+    arithmetic_conversions_test_add_state_t *__state = new arithmetic_conversions_test_add_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_arithmetic_conversions_test_add(arithmetic_conversions_test_add_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/arithmetic_conversions_test_complex_conversion.dir/root/package/.dacecache/arithmetic_conversions_test_complex_conversion/src/cpu/arithmetic_conversions_test_complex_conversion.cpp.o"
+  "CMakeFiles/arithmetic_conversions_test_complex_conversion.dir/root/package/.dacecache/arithmetic_conversions_test_complex_conversion/src/cpu/arithmetic_conversions_test_complex_conversion.cpp.o.d"
+  "libarithmetic_conversions_test_complex_conversion.pdb"
+  "libarithmetic_conversions_test_complex_conversion.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/arithmetic_conversions_test_complex_conversion.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * arithmetic_conversions_test_complex_conversionHandle_t;
+extern "C" arithmetic_conversions_test_complex_conversionHandle_t __dace_init_arithmetic_conversions_test_complex_conversion();
+extern "C" int __dace_exit_arithmetic_conversions_test_complex_conversion(arithmetic_conversions_test_complex_conversionHandle_t handle);
+extern "C" void __program_arithmetic_conversions_test_complex_conversion(arithmetic_conversions_test_complex_conversionHandle_t handle, dace::complex128 * __restrict__ __return, dace::complex128 * __restrict__ a, int b);
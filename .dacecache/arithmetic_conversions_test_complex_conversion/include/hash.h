@@ -0,0 +1 @@
+#define __HASH_arithmetic_conversions_test_complex_conversion "cce2171883283e0e9b5bff160557d3b91fcd05051a308abdaa3f9937e9d10067"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/arithmetic_conversions_test_float_conversion.dir/root/package/.dacecache/arithmetic_conversions_test_float_conversion/src/cpu/arithmetic_conversions_test_float_conversion.cpp.o"
+  "CMakeFiles/arithmetic_conversions_test_float_conversion.dir/root/package/.dacecache/arithmetic_conversions_test_float_conversion/src/cpu/arithmetic_conversions_test_float_conversion.cpp.o.d"
+  "libarithmetic_conversions_test_float_conversion.pdb"
+  "libarithmetic_conversions_test_float_conversion.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/arithmetic_conversions_test_float_conversion.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
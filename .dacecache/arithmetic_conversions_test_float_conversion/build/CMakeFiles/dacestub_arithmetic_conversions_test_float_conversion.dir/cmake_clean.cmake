@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_arithmetic_conversions_test_float_conversion.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_arithmetic_conversions_test_float_conversion.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_arithmetic_conversions_test_float_conversion.pdb"
+  "libdacestub_arithmetic_conversions_test_float_conversion.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_arithmetic_conversions_test_float_conversion.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
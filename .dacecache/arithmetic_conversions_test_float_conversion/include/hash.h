@@ -0,0 +1 @@
+#define __HASH_arithmetic_conversions_test_float_conversion "9ca8ea2bc5d332a5b423a5f4f34347837f25d6656e9d3cad6c042a7caac61bdf"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/arithmetic_conversions_test_float_conversion.h"
+
+int main(int argc, char **argv) {
+    arithmetic_conversions_test_float_conversionHandle_t handle;
+    int err;
+    float a = 42;
+    long long b = 42;
+    double * __restrict__ __return = (double*) calloc(1, sizeof(double));
+
+
+    handle = __dace_init_arithmetic_conversions_test_float_conversion();
+    __program_arithmetic_conversions_test_float_conversion(handle, __return, a, b);
+    err = __dace_exit_arithmetic_conversions_test_float_conversion(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * array_copy_outside_scopeHandle_t;
+extern "C" array_copy_outside_scopeHandle_t __dace_init_array_copy_outside_scope();
+extern "C" int __dace_exit_array_copy_outside_scope(array_copy_outside_scopeHandle_t handle);
+extern "C" void __program_array_copy_outside_scope(array_copy_outside_scopeHandle_t handle, int * __restrict__ inp, int * __restrict__ out);
@@ -0,0 +1 @@
+#define __HASH_array_copy_outside_scope "abdbcde7cf91c2cc00bce9d84a84e3fdfc8da6228444ae16b389341233b30d13"
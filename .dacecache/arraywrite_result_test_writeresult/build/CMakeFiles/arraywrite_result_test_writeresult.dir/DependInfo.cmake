@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.dacecache/arraywrite_result_test_writeresult/src/cpu/arraywrite_result_test_writeresult.cpp" "CMakeFiles/arraywrite_result_test_writeresult.dir/root/package/.dacecache/arraywrite_result_test_writeresult/src/cpu/arraywrite_result_test_writeresult.cpp.o" "gcc" "CMakeFiles/arraywrite_result_test_writeresult.dir/root/package/.dacecache/arraywrite_result_test_writeresult/src/cpu/arraywrite_result_test_writeresult.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/arraywrite_result_test_writeresult.dir/root/package/.dacecache/arraywrite_result_test_writeresult/src/cpu/arraywrite_result_test_writeresult.cpp.o"
+  "CMakeFiles/arraywrite_result_test_writeresult.dir/root/package/.dacecache/arraywrite_result_test_writeresult/src/cpu/arraywrite_result_test_writeresult.cpp.o.d"
+  "libarraywrite_result_test_writeresult.pdb"
+  "libarraywrite_result_test_writeresult.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/arraywrite_result_test_writeresult.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_arraywrite_result_test_writeresult "3b1986413c87ffdd1470af05f31f93230fd12f3ab8ae7b8ab1c5c7b67d973866"
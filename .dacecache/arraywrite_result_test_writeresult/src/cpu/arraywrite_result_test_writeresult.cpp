@@ -0,0 +1,66 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct arraywrite_result_test_writeresult_state_t {
+
+};
+
+void __program_arraywrite_result_test_writeresult_internal(arraywrite_result_test_writeresult_state_t*__state, double * __restrict__ output, double * __restrict__ values, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                {
+                    double* o = output;
+                    double v;
+
+                    ///////////////////
+                    // Tasklet code (arraywrite_result_test_writeresult_11)
+                    v = dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(output + 5, 1);;
+                    ///////////////////
+
+                    values[i] = v;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_arraywrite_result_test_writeresult(arraywrite_result_test_writeresult_state_t *__state, double * __restrict__ output, double * __restrict__ values, int N)
+{
+    __program_arraywrite_result_test_writeresult_internal(__state, output, values, N);
+}
+
+DACE_EXPORTED void __program_arraywrite_result_test_writeresult_repeat(arraywrite_result_test_writeresult_state_t *__state, long long __dace_repetitions, double * __restrict__ output, double * __restrict__ values, int N)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_arraywrite_result_test_writeresult_internal(__state, output, values, N);
+    }
+}
+
+DACE_EXPORTED arraywrite_result_test_writeresult_state_t *__dace_init_arraywrite_result_test_writeresult(int N)
+{
+    int __result = 0;
+    arraywrite_result_test_writeresult_state_t *__state = new arraywrite_result_test_writeresult_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_arraywrite_result_test_writeresult(arraywrite_result_test_writeresult_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1 @@
+#define __HASH_arraywrite_result_test_writeresult2 "44952c6261ffd92c18c0f54f705964712071c0da3351e1df7cfb946670ded04e"
@@ -0,0 +1,66 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct arraywrite_result_test_writeresult2_state_t {
+
+};
+
+void __program_arraywrite_result_test_writeresult2_internal(arraywrite_result_test_writeresult2_state_t*__state, double * __restrict__ output, double * __restrict__ values, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                {
+                    double v = values[i];
+                    double* o = output;
+
+                    ///////////////////
+                    // Tasklet code (arraywrite_result_test_writeresult2_30)
+                    dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(output + 0, v);
+                    dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(output + 1, (2 * v));
+                    ///////////////////
+
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_arraywrite_result_test_writeresult2(arraywrite_result_test_writeresult2_state_t *__state, double * __restrict__ output, double * __restrict__ values, int N)
+{
+    __program_arraywrite_result_test_writeresult2_internal(__state, output, values, N);
+}
+
+DACE_EXPORTED void __program_arraywrite_result_test_writeresult2_repeat(arraywrite_result_test_writeresult2_state_t *__state, long long __dace_repetitions, double * __restrict__ output, double * __restrict__ values, int N)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_arraywrite_result_test_writeresult2_internal(__state, output, values, N);
+    }
+}
+
+DACE_EXPORTED arraywrite_result_test_writeresult2_state_t *__dace_init_arraywrite_result_test_writeresult2(int N)
+{
+    int __result = 0;
+    arraywrite_result_test_writeresult2_state_t *__state = new arraywrite_result_test_writeresult2_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_arraywrite_result_test_writeresult2(arraywrite_result_test_writeresult2_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_assert_test_prog_runtime.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_assert_test_prog_runtime.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_assert_test_prog_runtime.pdb"
+  "libdacestub_assert_test_prog_runtime.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_assert_test_prog_runtime.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assert_test_prog_runtimeHandle_t;
+extern "C" assert_test_prog_runtimeHandle_t __dace_init_assert_test_prog_runtime();
+extern "C" int __dace_exit_assert_test_prog_runtime(assert_test_prog_runtimeHandle_t handle);
+extern "C" void __program_assert_test_prog_runtime(assert_test_prog_runtimeHandle_t handle, double * __restrict__ A);
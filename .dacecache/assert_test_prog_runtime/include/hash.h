@@ -0,0 +1 @@
+#define __HASH_assert_test_prog_runtime "ec04665164cbf91675b5eb2f3db589403d3cbfc5cd3c0b0a1b2371260035ee72"
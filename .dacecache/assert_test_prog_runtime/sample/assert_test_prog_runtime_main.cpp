@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/assert_test_prog_runtime.h"
+
+int main(int argc, char **argv) {
+    assert_test_prog_runtimeHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_assert_test_prog_runtime();
+    __program_assert_test_prog_runtime(handle, A);
+    err = __dace_exit_assert_test_prog_runtime(handle);
+
+    free(A);
+
+
+    return err;
+}
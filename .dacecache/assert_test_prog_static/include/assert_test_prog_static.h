@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assert_test_prog_staticHandle_t;
+extern "C" assert_test_prog_staticHandle_t __dace_init_assert_test_prog_static();
+extern "C" int __dace_exit_assert_test_prog_static(assert_test_prog_staticHandle_t handle);
+extern "C" void __program_assert_test_prog_static(assert_test_prog_staticHandle_t handle, double * __restrict__ A);
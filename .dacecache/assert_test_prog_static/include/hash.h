@@ -0,0 +1 @@
+#define __HASH_assert_test_prog_static "58610899e21cdc132e0c5d883e4f53fb8e1bb1bca68e902f51ef3330c1ae817f"
@@ -0,0 +1,47 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assert_test_prog_static_state_t {
+
+};
+
+void __program_assert_test_prog_static_internal(assert_test_prog_static_state_t*__state, double * __restrict__ A)
+{
+
+
+}
+
+DACE_EXPORTED void __program_assert_test_prog_static(assert_test_prog_static_state_t *__state, double * __restrict__ A)
+{
+    __program_assert_test_prog_static_internal(__state, A);
+}
+
+DACE_EXPORTED void __program_assert_test_prog_static_repeat(assert_test_prog_static_state_t *__state, long long __dace_repetitions, double * __restrict__ A)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_assert_test_prog_static_internal(__state, A);
+    }
+}
+
+DACE_EXPORTED assert_test_prog_static_state_t *__dace_init_assert_test_prog_static()
+{
+    int __result = 0;
+    assert_test_prog_static_state_t *__state = new assert_test_prog_static_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assert_test_prog_static(assert_test_prog_static_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
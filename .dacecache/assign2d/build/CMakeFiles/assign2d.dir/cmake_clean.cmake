@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assign2d.dir/root/package/.dacecache/assign2d/src/cpu/assign2d.cpp.o"
+  "CMakeFiles/assign2d.dir/root/package/.dacecache/assign2d/src/cpu/assign2d.cpp.o.d"
+  "libassign2d.pdb"
+  "libassign2d.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assign2d.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
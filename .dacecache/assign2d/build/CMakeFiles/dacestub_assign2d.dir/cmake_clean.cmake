@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_assign2d.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_assign2d.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_assign2d.pdb"
+  "libdacestub_assign2d.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_assign2d.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assign2dHandle_t;
+extern "C" assign2dHandle_t __dace_init_assign2d();
+extern "C" int __dace_exit_assign2d(assign2dHandle_t handle);
+extern "C" void __program_assign2d(assign2dHandle_t handle, double * __restrict__ A);
@@ -0,0 +1 @@
+#define __HASH_assign2d "3f41b66930826594caa2765030cdd0c76132912eaf696760fceb94cc9cf547fa"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/assign2d.h"
+
+int main(int argc, char **argv) {
+    assign2dHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(8, sizeof(double));
+
+
+    handle = __dace_init_assign2d();
+    __program_assign2d(handle, A);
+    err = __dace_exit_assign2d(handle);
+
+    free(A);
+
+
+    return err;
+}
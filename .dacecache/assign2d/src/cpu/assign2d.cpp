@@ -0,0 +1,63 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assign2d_state_t {
+
+};
+
+void __program_assign2d_internal(assign2d_state_t*__state, double * __restrict__ A)
+{
+    double i;
+
+
+    i = A[3];
+    {
+
+        {
+            double a;
+
+            ///////////////////
+            // Tasklet code (assign)
+            a = i;
+            ///////////////////
+
+            A[0] = a;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_assign2d(assign2d_state_t *__state, double * __restrict__ A)
+{
+    __program_assign2d_internal(__state, A);
+}
+
+DACE_EXPORTED void __program_assign2d_repeat(assign2d_state_t *__state, long long __dace_repetitions, double * __restrict__ A)
+{
+    while (__dace_repetitions-- > 0) {
+        __program_assign2d_internal(__state, A);
+    }
+}
+
+DACE_EXPORTED assign2d_state_t *__dace_init_assign2d()
+{
+    int __result = 0;
+    assign2d_state_t *__state = new assign2d_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assign2d(assign2d_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
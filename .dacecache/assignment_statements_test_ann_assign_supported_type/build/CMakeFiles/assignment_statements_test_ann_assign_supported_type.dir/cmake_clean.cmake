@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_statements_test_ann_assign_supported_type.dir/root/package/.dacecache/assignment_statements_test_ann_assign_supported_type/src/cpu/assignment_statements_test_ann_assign_supported_type.cpp.o"
+  "CMakeFiles/assignment_statements_test_ann_assign_supported_type.dir/root/package/.dacecache/assignment_statements_test_ann_assign_supported_type/src/cpu/assignment_statements_test_ann_assign_supported_type.cpp.o.d"
+  "libassignment_statements_test_ann_assign_supported_type.pdb"
+  "libassignment_statements_test_ann_assign_supported_type.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_statements_test_ann_assign_supported_type.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_statements_test_ann_assign_supported_typeHandle_t;
+extern "C" assignment_statements_test_ann_assign_supported_typeHandle_t __dace_init_assignment_statements_test_ann_assign_supported_type();
+extern "C" int __dace_exit_assignment_statements_test_ann_assign_supported_type(assignment_statements_test_ann_assign_supported_typeHandle_t handle);
+extern "C" void __program_assignment_statements_test_ann_assign_supported_type(assignment_statements_test_ann_assign_supported_typeHandle_t handle, unsigned short * __restrict__ __return);
@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_ann_assign_supported_type "4b69a70b1f6448b863bf39c96819c948b648bd99b301c61e1ed09d35be54f1c8"
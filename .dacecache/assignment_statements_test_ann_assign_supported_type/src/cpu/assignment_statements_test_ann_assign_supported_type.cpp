@@ -0,0 +1,60 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_statements_test_ann_assign_supported_type_state_t {
+
+};
+
+void __program_assignment_statements_test_ann_assign_supported_type_internal(assignment_statements_test_ann_assign_supported_type_state_t*__state, unsigned short * __restrict__ __return)
+{
+
+    {
+
+        {
+            unsigned short __out;
+
+            ///////////////////
+            // Tasklet code (assign_108_4)
+            __out = 5;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_statements_test_ann_assign_supported_type(assignment_statements_test_ann_assign_supported_type_state_t *__state, unsigned short * __restrict__ __return)
+{
+    __program_assignment_statements_test_ann_assign_supported_type_internal(__state, __return);
+}
+
+DACE_EXPORTED void __program_assignment_statements_test_ann_assign_supported_type_repeat(assignment_statements_test_ann_assign_supported_type_state_t *__state, long long __dace_repetitions, unsigned short * __restrict__ __return)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_assignment_statements_test_ann_assign_supported_type_internal(__state, __return);
+    }
+}
+
+DACE_EXPORTED assignment_statements_test_ann_assign_supported_type_state_t *__dace_init_assignment_statements_test_ann_assign_supported_type()
+{
+    int __result = 0;
+    assignment_statements_test_ann_assign_supported_type_state_t *__state = new assignment_statements_test_ann_assign_supported_type_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_statements_test_ann_assign_supported_type(assignment_statements_test_ann_assign_supported_type_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/assignment_statements_test_assign_symbols.dir/root/package/.dacecache/assignment_statements_test_assign_symbols/src/cpu/assignment_statements_test_assign_symbols.cpp.o"
+  "CMakeFiles/assignment_statements_test_assign_symbols.dir/root/package/.dacecache/assignment_statements_test_assign_symbols/src/cpu/assignment_statements_test_assign_symbols.cpp.o.d"
+  "libassignment_statements_test_assign_symbols.pdb"
+  "libassignment_statements_test_assign_symbols.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/assignment_statements_test_assign_symbols.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_assign_symbols "709051be8eee58403402196b1522722e091804d8802bbcc2bbeb2e17d78e008b"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/assignment_statements_test_assign_symbols.h"
+
+int main(int argc, char **argv) {
+    assignment_statements_test_assign_symbolsHandle_t handle;
+    int err;
+    long long * __restrict__ __return_0 = (long long*) calloc(1, sizeof(long long));
+    long long * __restrict__ __return_1 = (long long*) calloc(1, sizeof(long long));
+
+
+    handle = __dace_init_assignment_statements_test_assign_symbols();
+    __program_assignment_statements_test_assign_symbols(handle, __return_0, __return_1);
+    err = __dace_exit_assignment_statements_test_assign_symbols(handle);
+
+    free(__return_0);
+    free(__return_1);
+
+
+    return err;
+}
@@ -0,0 +1,84 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_statements_test_assign_symbols_state_t {
+
+};
+
+void __program_assignment_statements_test_assign_symbols_internal(assignment_statements_test_assign_symbols_state_t*__state, long long * __restrict__ __return_0, long long * __restrict__ __return_1)
+{
+    long long a;
+    long long i;
+
+
+    a = 6;
+    i = 0;
+
+    while ((i < 10)) {
+
+        a = 5;
+        i = (i + 1);
+
+    }
+
+    a = (a - 1);
+    {
+
+        {
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_134_4)
+            __out = i;
+            ///////////////////
+
+            __return_0[0] = __out;
+        }
+        {
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_134_4_0)
+            __out = a;
+            ///////////////////
+
+            __return_1[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_statements_test_assign_symbols(assignment_statements_test_assign_symbols_state_t *__state, long long * __restrict__ __return_0, long long * __restrict__ __return_1)
+{
+    __program_assignment_statements_test_assign_symbols_internal(__state, __return_0, __return_1);
+}
+
+DACE_EXPORTED void __program_assignment_statements_test_assign_symbols_repeat(assignment_statements_test_assign_symbols_state_t *__state, long long __dace_repetitions, long long * __restrict__ __return_0, long long * __restrict__ __return_1)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_assignment_statements_test_assign_symbols_internal(__state, __return_0, __return_1);
+    }
+}
+
+DACE_EXPORTED assignment_statements_test_assign_symbols_state_t *__dace_init_assignment_statements_test_assign_symbols()
+{
+    int __result = 0;
+    assignment_statements_test_assign_symbols_state_t *__state = new assignment_statements_test_assign_symbols_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_statements_test_assign_symbols(assignment_statements_test_assign_symbols_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_statements_test_multiple_targetsHandle_t;
+extern "C" assignment_statements_test_multiple_targetsHandle_t __dace_init_assignment_statements_test_multiple_targets();
+extern "C" int __dace_exit_assignment_statements_test_multiple_targets(assignment_statements_test_multiple_targetsHandle_t handle);
+extern "C" void __program_assignment_statements_test_multiple_targets(assignment_statements_test_multiple_targetsHandle_t handle, float * __restrict__ __return_0, float * __restrict__ __return_1, float * __restrict__ a);
@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_multiple_targets "a93a7cbfa9d56c2053ded2dd3d2f7670cb5b115ecaf26e87a0fd21e16f98ca6a"
@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_multiple_targets_parentheses "65bdc90859dcc0bd652b3647aaf0d0dd49ebb144c5a80ff25754997e08aa9722"
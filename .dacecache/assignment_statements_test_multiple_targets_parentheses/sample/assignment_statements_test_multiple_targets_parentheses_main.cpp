@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/assignment_statements_test_multiple_targets_parentheses.h"
+
+int main(int argc, char **argv) {
+    assignment_statements_test_multiple_targets_parenthesesHandle_t handle;
+    int err;
+    float * __restrict__ __return_0 = (float*) calloc(1, sizeof(float));
+    float * __restrict__ __return_1 = (float*) calloc(1, sizeof(float));
+    float * __restrict__ a = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_assignment_statements_test_multiple_targets_parentheses();
+    __program_assignment_statements_test_multiple_targets_parentheses(handle, __return_0, __return_1, a);
+    err = __dace_exit_assignment_statements_test_multiple_targets_parentheses(handle);
+
+    free(__return_0);
+    free(__return_1);
+    free(a);
+
+
+    return err;
+}
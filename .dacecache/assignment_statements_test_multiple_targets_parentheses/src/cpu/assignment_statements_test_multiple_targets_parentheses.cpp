@@ -0,0 +1,64 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct assignment_statements_test_multiple_targets_parentheses_state_t {
+
+};
+
+void __program_assignment_statements_test_multiple_targets_parentheses_internal(assignment_statements_test_multiple_targets_parentheses_state_t*__state, float * __restrict__ __return_0, float * __restrict__ __return_1, float * __restrict__ a)
+{
+
+    {
+
+        {
+            float __in2 = a[0];
+            float __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (dace::float32(2) * __in2);
+            ///////////////////
+
+            __return_1[0] = __out;
+        }
+
+        dace::CopyND<float, 1, false, 1>::template ConstDst<1>::Copy(
+        a, __return_0, 1);
+
+    }
+}
+
+DACE_EXPORTED void __program_assignment_statements_test_multiple_targets_parentheses(assignment_statements_test_multiple_targets_parentheses_state_t *__state, float * __restrict__ __return_0, float * __restrict__ __return_1, float * __restrict__ a)
+{
+    __program_assignment_statements_test_multiple_targets_parentheses_internal(__state, __return_0, __return_1, a);
+}
+
+DACE_EXPORTED void __program_assignment_statements_test_multiple_targets_parentheses_repeat(assignment_statements_test_multiple_targets_parentheses_state_t *__state, long long __dace_repetitions, float * __restrict__ __return_0, float * __restrict__ __return_1, float * __restrict__ a)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_assignment_statements_test_multiple_targets_parentheses_internal(__state, __return_0, __return_1, a);
+    }
+}
+
+DACE_EXPORTED assignment_statements_test_multiple_targets_parentheses_state_t *__dace_init_assignment_statements_test_multiple_targets_parentheses()
+{
+    int __result = 0;
+    assignment_statements_test_multiple_targets_parentheses_state_t *__state = new assignment_statements_test_multiple_targets_parentheses_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_assignment_statements_test_multiple_targets_parentheses(assignment_statements_test_multiple_targets_parentheses_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
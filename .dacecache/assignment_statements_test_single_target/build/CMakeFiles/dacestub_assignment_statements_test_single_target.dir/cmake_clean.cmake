@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_assignment_statements_test_single_target.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_assignment_statements_test_single_target.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_assignment_statements_test_single_target.pdb"
+  "libdacestub_assignment_statements_test_single_target.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_assignment_statements_test_single_target.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * assignment_statements_test_single_targetHandle_t;
+extern "C" assignment_statements_test_single_targetHandle_t __dace_init_assignment_statements_test_single_target();
+extern "C" int __dace_exit_assignment_statements_test_single_target(assignment_statements_test_single_targetHandle_t handle);
+extern "C" void __program_assignment_statements_test_single_target(assignment_statements_test_single_targetHandle_t handle, float * __restrict__ __return, float * __restrict__ a);
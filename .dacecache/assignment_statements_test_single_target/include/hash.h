@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_single_target "053a3b164fc328933d25c24b62589494bd92d31c413bac6b72e07dc0591d2d43"
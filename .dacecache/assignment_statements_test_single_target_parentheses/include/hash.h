@@ -0,0 +1 @@
+#define __HASH_assignment_statements_test_single_target_parentheses "1e86b119f676c1229e2c6b419eb66260cf8de85745fba73b6d073e7f2294c4b5"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/atax_test_kernel.dir/root/package/.dacecache/atax_test_kernel/src/cpu/atax_test_kernel.cpp.o"
+  "CMakeFiles/atax_test_kernel.dir/root/package/.dacecache/atax_test_kernel/src/cpu/atax_test_kernel.cpp.o.d"
+  "libatax_test_kernel.pdb"
+  "libatax_test_kernel.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/atax_test_kernel.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * atax_test_kernelHandle_t;
+extern "C" atax_test_kernelHandle_t __dace_init_atax_test_kernel(int M, int N);
+extern "C" int __dace_exit_atax_test_kernel(atax_test_kernelHandle_t handle);
+extern "C" void __program_atax_test_kernel(atax_test_kernelHandle_t handle, float * __restrict__ A, float * __restrict__ __return, float * __restrict__ x, int M, int N);
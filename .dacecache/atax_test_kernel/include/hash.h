@@ -0,0 +1 @@
+#define __HASH_atax_test_kernel "a5ac2af544b9ba396871007c0962d95434a7ff779d37a8a8fd0a2e3945f359f1"
@@ -0,0 +1,148 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct atax_test_kernel_state_t {
+    float * __restrict__ __0___tmp0;
+};
+
+inline void _MatMult_gemv_sdfg_0_0_4(atax_test_kernel_state_t *__state, float* __restrict__ _A, float* __restrict__ _x, float* __restrict__ _y, int M, int N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < M; _o0 += 1) {
+                {
+                    float out;
+
+                    ///////////////////
+                    // Tasklet code (gemv_init)
+                    out = 0;
+                    ///////////////////
+
+                    _y[_o0] = out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < M; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < N; __i1 += 1) {
+                    {
+                        float __A = _A[((N * __i0) + __i1)];
+                        float __x = _x[__i1];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_GEMV_)
+                        __out = ((1 * __A) * __x);
+                        ///////////////////
+
+                        dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_y + __i0, __out);
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemvt_sdfg_0_0_5(atax_test_kernel_state_t *__state, float* __restrict__ _A, float* __restrict__ _x, float* __restrict__ _y, int M, int N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < N; _o0 += 1) {
+                {
+                    float out;
+
+                    ///////////////////
+                    // Tasklet code (gemv_init)
+                    out = 0;
+                    ///////////////////
+
+                    _y[_o0] = out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < M; __i1 += 1) {
+                    {
+                        float __A = _A[((N * __i1) + __i0)];
+                        float __x = _x[__i1];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_GEMV_)
+                        __out = ((1 * __A) * __x);
+                        ///////////////////
+
+                        dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_y + __i0, __out);
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_atax_test_kernel_internal(atax_test_kernel_state_t*__state, float * __restrict__ A, float * __restrict__ __return, float * __restrict__ x, int M, int N)
+{
+
+    {
+
+        _MatMult_gemv_sdfg_0_0_4(__state, &A[0], &x[0], &__state->__0___tmp0[0], M, N);
+        _MatMult_gemvt_sdfg_0_0_5(__state, &A[0], &__state->__0___tmp0[0], &__return[0], M, N);
+
+    }
+}
+
+DACE_EXPORTED void __program_atax_test_kernel(atax_test_kernel_state_t *__state, float * __restrict__ A, float * __restrict__ __return, float * __restrict__ x, int M, int N)
+{
+    __program_atax_test_kernel_internal(__state, A, __return, x, M, N);
+}
+
+DACE_EXPORTED void __program_atax_test_kernel_repeat(atax_test_kernel_state_t *__state, long long __dace_repetitions, float * __restrict__ A, float * __restrict__ __return, float * __restrict__ x, int M, int N)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_atax_test_kernel_internal(__state, A, __return, x, M, N);
+    }
+}
+
+DACE_EXPORTED atax_test_kernel_state_t *__dace_init_atax_test_kernel(int M, int N)
+{
+    int __result = 0;
+    atax_test_kernel_state_t *__state = new atax_test_kernel_state_t;
+
+
+    __state->__0___tmp0 = new float DACE_ALIGN(64)[M];
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_atax_test_kernel(atax_test_kernel_state_t *__state)
+{
+    int __err = 0;
+    delete[] __state->__0___tmp0;
+    delete __state;
+    return __err;
+}
+
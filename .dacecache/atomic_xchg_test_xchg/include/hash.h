@@ -0,0 +1 @@
+#define __HASH_atomic_xchg_test_xchg "fe06eaa912a1efd7ea07b3049f2da2e8c02c9b52363ce2c4a934a2598ab9c3b6"
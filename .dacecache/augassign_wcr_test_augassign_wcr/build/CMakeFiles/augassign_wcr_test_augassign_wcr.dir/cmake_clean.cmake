@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_wcr_test_augassign_wcr.dir/root/package/.dacecache/augassign_wcr_test_augassign_wcr/src/cpu/augassign_wcr_test_augassign_wcr.cpp.o"
+  "CMakeFiles/augassign_wcr_test_augassign_wcr.dir/root/package/.dacecache/augassign_wcr_test_augassign_wcr/src/cpu/augassign_wcr_test_augassign_wcr.cpp.o.d"
+  "libaugassign_wcr_test_augassign_wcr.pdb"
+  "libaugassign_wcr_test_augassign_wcr.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_wcr_test_augassign_wcr.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_augassign_wcr "8f38c70674ff3284f06ad012bdabb3603e8b5deebb81d9cdda9c023ce92ba582"
@@ -0,0 +1,24 @@
+#include <cstdlib>
+#include "../include/augassign_wcr_test_augassign_wcr.h"
+
+int main(int argc, char **argv) {
+    augassign_wcr_test_augassign_wcrHandle_t handle;
+    int err;
+    int * __restrict__ A = (int*) calloc(1000, sizeof(int));
+    int * __restrict__ B = (int*) calloc(10, sizeof(int));
+    bool * __restrict__ W = (bool*) calloc(10, sizeof(bool));
+    long long * __restrict__ __return = (long long*) calloc(1, sizeof(long long));
+
+
+    handle = __dace_init_augassign_wcr_test_augassign_wcr();
+    __program_augassign_wcr_test_augassign_wcr(handle, A, B, W, __return);
+    err = __dace_exit_augassign_wcr_test_augassign_wcr(handle);
+
+    free(A);
+    free(B);
+    free(W);
+    free(__return);
+
+
+    return err;
+}
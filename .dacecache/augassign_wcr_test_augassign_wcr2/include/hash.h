@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_augassign_wcr2 "2b67077efeac710c042e885a0ec9b73e6e834669cccc378d534d5cb10e53cac4"
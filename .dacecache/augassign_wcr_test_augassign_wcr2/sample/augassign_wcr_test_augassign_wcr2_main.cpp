@@ -0,0 +1,24 @@
+#include <cstdlib>
+#include "../include/augassign_wcr_test_augassign_wcr2.h"
+
+int main(int argc, char **argv) {
+    augassign_wcr_test_augassign_wcr2Handle_t handle;
+    int err;
+    int * __restrict__ A = (int*) calloc(1000, sizeof(int));
+    int * __restrict__ B = (int*) calloc(10, sizeof(int));
+    bool * __restrict__ W = (bool*) calloc(1000, sizeof(bool));
+    long long * __restrict__ __return = (long long*) calloc(1, sizeof(long long));
+
+
+    handle = __dace_init_augassign_wcr_test_augassign_wcr2();
+    __program_augassign_wcr_test_augassign_wcr2(handle, A, B, W, __return);
+    err = __dace_exit_augassign_wcr_test_augassign_wcr2(handle);
+
+    free(A);
+    free(B);
+    free(W);
+    free(__return);
+
+
+    return err;
+}
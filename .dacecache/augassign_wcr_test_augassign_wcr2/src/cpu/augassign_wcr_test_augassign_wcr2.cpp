@@ -0,0 +1,157 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_augassign_wcr2_state_t {
+
+};
+
+inline void augassign_wcr_test_augassign_wcr2_24_4_0_3_2(augassign_wcr_test_augassign_wcr2_state_t *__state, const bool&  __tmp_25_11_r, const int&  __tmp_27_20_r, long long&  __tmp_26_12_w, int&  __tmp_27_12_w) {
+
+
+
+    if (__tmp_25_11_r) {
+
+        {
+
+            {
+                long long __out;
+
+                ///////////////////
+                // Tasklet code (assign_26_12)
+                __out = 1;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, long long>::reduce_atomic(&__tmp_26_12_w, __out);
+            }
+
+        }
+        {
+
+            {
+                int __inp = __tmp_27_20_r;
+                int __out;
+
+                ///////////////////
+                // Tasklet code (assign_27_12)
+                __out = __inp;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, int>::reduce_atomic(&__tmp_27_12_w, __out);
+            }
+
+        }
+        if (true) {
+            goto __state_1_endif_25;
+        }
+        goto __state_exit_1;
+
+    }
+    __state_1_endif_25:;
+
+    __state_exit_1:;
+    
+}
+
+void __program_augassign_wcr_test_augassign_wcr2_internal(augassign_wcr_test_augassign_wcr2_state_t*__state, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return)
+{
+    long long count;
+
+
+    {
+
+        {
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_22_4)
+            __out = 0;
+            ///////////////////
+
+            count = __out;
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 10; __i0 += 1) {
+                {
+                    int __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_23_4)
+                    __out = 0;
+                    ///////////////////
+
+                    B[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 10; i += 1) {
+                for (auto j = 0; j < 10; j += 1) {
+                    for (auto k = 0; k < 10; k += 1) {
+                        augassign_wcr_test_augassign_wcr2_24_4_0_3_2(__state, W[(((100 * i) + (10 * j)) + k)], A[(((100 * i) + (10 * j)) + k)], count, B[i]);
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            long long __inp = count;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_29_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_augassign_wcr2(augassign_wcr_test_augassign_wcr2_state_t *__state, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return)
+{
+    __program_augassign_wcr_test_augassign_wcr2_internal(__state, A, B, W, __return);
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_augassign_wcr2_repeat(augassign_wcr_test_augassign_wcr2_state_t *__state, long long __dace_repetitions, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_augassign_wcr_test_augassign_wcr2_internal(__state, A, B, W, __return);
+    }
+}
+
+DACE_EXPORTED augassign_wcr_test_augassign_wcr2_state_t *__dace_init_augassign_wcr_test_augassign_wcr2()
+{
+    int __result = 0;
+    augassign_wcr_test_augassign_wcr2_state_t *__state = new augassign_wcr_test_augassign_wcr2_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_augassign_wcr2(augassign_wcr_test_augassign_wcr2_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
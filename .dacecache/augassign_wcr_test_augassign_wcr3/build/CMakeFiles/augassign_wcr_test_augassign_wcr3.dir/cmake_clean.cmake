@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_wcr_test_augassign_wcr3.dir/root/package/.dacecache/augassign_wcr_test_augassign_wcr3/src/cpu/augassign_wcr_test_augassign_wcr3.cpp.o"
+  "CMakeFiles/augassign_wcr_test_augassign_wcr3.dir/root/package/.dacecache/augassign_wcr_test_augassign_wcr3/src/cpu/augassign_wcr_test_augassign_wcr3.cpp.o.d"
+  "libaugassign_wcr_test_augassign_wcr3.pdb"
+  "libaugassign_wcr_test_augassign_wcr3.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_wcr_test_augassign_wcr3.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
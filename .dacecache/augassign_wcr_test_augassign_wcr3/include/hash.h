@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_augassign_wcr3 "9fad951c5dffeb8e82a7d8377e733a87f5950176288e47d2b8ec33550123e71d"
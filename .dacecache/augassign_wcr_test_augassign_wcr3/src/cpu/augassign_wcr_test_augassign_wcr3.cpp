@@ -0,0 +1,160 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_augassign_wcr3_state_t {
+
+};
+
+inline void augassign_wcr_test_augassign_wcr3_36_4_0_3_2(augassign_wcr_test_augassign_wcr3_state_t *__state, const bool&  __tmp_37_11_r, const int&  __tmp_39_14_r, const int&  __tmp_39_25_r, long long&  __tmp_38_12_w, int* __restrict__ __tmp_39_12_w) {
+    int __sym___tmp_39_14_r;
+
+
+
+    if (__tmp_37_11_r) {
+
+        {
+
+            {
+                long long __out;
+
+                ///////////////////
+                // Tasklet code (assign_38_12)
+                __out = 1;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, long long>::reduce_atomic(&__tmp_38_12_w, __out);
+            }
+
+        }
+        __sym___tmp_39_14_r = __tmp_39_14_r;
+
+        {
+
+            {
+                int __inp = __tmp_39_25_r;
+                int __out;
+
+                ///////////////////
+                // Tasklet code (assign_39_12)
+                __out = __inp;
+                ///////////////////
+
+                dace::wcr_fixed<dace::ReductionType::Sum, int>::reduce_atomic(__tmp_39_12_w + __sym___tmp_39_14_r, __out);
+            }
+
+        }
+        if (true) {
+            goto __state_1_endif_37;
+        }
+        goto __state_exit_1;
+
+    }
+    __state_1_endif_37:;
+
+    __state_exit_1:;
+    
+}
+
+void __program_augassign_wcr_test_augassign_wcr3_internal(augassign_wcr_test_augassign_wcr3_state_t*__state, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return, int * __restrict__ ind)
+{
+    long long count;
+
+
+    {
+
+        {
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_34_4)
+            __out = 0;
+            ///////////////////
+
+            count = __out;
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 10; __i0 += 1) {
+                {
+                    int __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_35_4)
+                    __out = 0;
+                    ///////////////////
+
+                    B[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 10; i += 1) {
+                for (auto j = 0; j < 10; j += 1) {
+                    for (auto k = 0; k < 10; k += 1) {
+                        augassign_wcr_test_augassign_wcr3_36_4_0_3_2(__state, W[(((100 * i) + (10 * j)) + k)], ind[i], A[(((100 * i) + (10 * j)) + k)], count, &B[0]);
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            long long __inp = count;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_41_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_augassign_wcr3(augassign_wcr_test_augassign_wcr3_state_t *__state, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return, int * __restrict__ ind)
+{
+    __program_augassign_wcr_test_augassign_wcr3_internal(__state, A, B, W, __return, ind);
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_augassign_wcr3_repeat(augassign_wcr_test_augassign_wcr3_state_t *__state, long long __dace_repetitions, int * __restrict__ A, int * __restrict__ B, bool * __restrict__ W, long long * __restrict__ __return, int * __restrict__ ind)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_augassign_wcr_test_augassign_wcr3_internal(__state, A, B, W, __return, ind);
+    }
+}
+
+DACE_EXPORTED augassign_wcr_test_augassign_wcr3_state_t *__dace_init_augassign_wcr_test_augassign_wcr3()
+{
+    int __result = 0;
+    augassign_wcr_test_augassign_wcr3_state_t *__state = new augassign_wcr_test_augassign_wcr3_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_augassign_wcr3(augassign_wcr_test_augassign_wcr3_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_wcr_test_augassign_wcr4.dir/root/package/.dacecache/augassign_wcr_test_augassign_wcr4/src/cpu/augassign_wcr_test_augassign_wcr4.cpp.o"
+  "CMakeFiles/augassign_wcr_test_augassign_wcr4.dir/root/package/.dacecache/augassign_wcr_test_augassign_wcr4/src/cpu/augassign_wcr_test_augassign_wcr4.cpp.o.d"
+  "libaugassign_wcr_test_augassign_wcr4.pdb"
+  "libaugassign_wcr_test_augassign_wcr4.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_wcr_test_augassign_wcr4.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
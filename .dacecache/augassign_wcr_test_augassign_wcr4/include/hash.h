@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_augassign_wcr4 "6830a72ec34db1ec36a17f8c4ebe0af22bcb60b50e4b87f561a71612e85428f0"
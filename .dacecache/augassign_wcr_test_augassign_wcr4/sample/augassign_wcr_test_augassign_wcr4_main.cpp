@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/augassign_wcr_test_augassign_wcr4.h"
+
+int main(int argc, char **argv) {
+    augassign_wcr_test_augassign_wcr4Handle_t handle;
+    int err;
+    double * __restrict__ __return = (double*) calloc(10, sizeof(double));
+
+
+    handle = __dace_init_augassign_wcr_test_augassign_wcr4();
+    __program_augassign_wcr_test_augassign_wcr4(handle, __return);
+    err = __dace_exit_augassign_wcr_test_augassign_wcr4(handle);
+
+    free(__return);
+
+
+    return err;
+}
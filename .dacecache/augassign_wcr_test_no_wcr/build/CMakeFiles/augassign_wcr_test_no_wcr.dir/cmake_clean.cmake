@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/augassign_wcr_test_no_wcr.dir/root/package/.dacecache/augassign_wcr_test_no_wcr/src/cpu/augassign_wcr_test_no_wcr.cpp.o"
+  "CMakeFiles/augassign_wcr_test_no_wcr.dir/root/package/.dacecache/augassign_wcr_test_no_wcr/src/cpu/augassign_wcr_test_no_wcr.cpp.o.d"
+  "libaugassign_wcr_test_no_wcr.pdb"
+  "libaugassign_wcr_test_no_wcr.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/augassign_wcr_test_no_wcr.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
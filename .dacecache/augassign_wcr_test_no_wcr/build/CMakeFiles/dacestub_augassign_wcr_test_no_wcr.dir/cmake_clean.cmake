@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_augassign_wcr_test_no_wcr.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_augassign_wcr_test_no_wcr.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_augassign_wcr_test_no_wcr.pdb"
+  "libdacestub_augassign_wcr_test_no_wcr.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_augassign_wcr_test_no_wcr.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
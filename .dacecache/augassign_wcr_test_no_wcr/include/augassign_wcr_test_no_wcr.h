@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * augassign_wcr_test_no_wcrHandle_t;
+extern "C" augassign_wcr_test_no_wcrHandle_t __dace_init_augassign_wcr_test_no_wcr();
+extern "C" int __dace_exit_augassign_wcr_test_no_wcr(augassign_wcr_test_no_wcrHandle_t handle);
+extern "C" void __program_augassign_wcr_test_no_wcr(augassign_wcr_test_no_wcrHandle_t handle, int * __restrict__ A);
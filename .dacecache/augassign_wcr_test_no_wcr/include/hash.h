@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_no_wcr "3ae24f73f690efdcd9010f9bac7c33ed4ffe025caddf34307b06cd52d82cf531"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/augassign_wcr_test_no_wcr.h"
+
+int main(int argc, char **argv) {
+    augassign_wcr_test_no_wcrHandle_t handle;
+    int err;
+    int * __restrict__ A = (int*) calloc(125, sizeof(int));
+
+
+    handle = __dace_init_augassign_wcr_test_no_wcr();
+    __program_augassign_wcr_test_no_wcr(handle, A);
+    err = __dace_exit_augassign_wcr_test_no_wcr(handle);
+
+    free(A);
+
+
+    return err;
+}
@@ -0,0 +1,71 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_no_wcr_state_t {
+
+};
+
+void __program_augassign_wcr_test_no_wcr_internal(augassign_wcr_test_no_wcr_state_t*__state, int * __restrict__ A)
+{
+
+
+
+    {
+        int* A_0;
+        A_0 = &A[59];
+
+        {
+            #pragma omp parallel for
+            for (auto __i2 = 0; __i2 < 3; __i2 += 1) {
+                {
+                    int __in1 = A[(__i2 + 66)];
+                    int __in2 = A_0[(25 * __i2)];
+                    int __out;
+
+                    ///////////////////
+                    // Tasklet code (augassign_143_4)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    A[(__i2 + 66)] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_no_wcr(augassign_wcr_test_no_wcr_state_t *__state, int * __restrict__ A)
+{
+    __program_augassign_wcr_test_no_wcr_internal(__state, A);
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_no_wcr_repeat(augassign_wcr_test_no_wcr_state_t *__state, long long __dace_repetitions, int * __restrict__ A)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_augassign_wcr_test_no_wcr_internal(__state, A);
+    }
+}
+
+DACE_EXPORTED augassign_wcr_test_no_wcr_state_t *__dace_init_augassign_wcr_test_no_wcr()
+{
+    int __result = 0;
+    augassign_wcr_test_no_wcr_state_t *__state = new augassign_wcr_test_no_wcr_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_no_wcr(augassign_wcr_test_no_wcr_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
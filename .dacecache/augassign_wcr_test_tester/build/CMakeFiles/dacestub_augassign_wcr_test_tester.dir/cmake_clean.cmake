@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_augassign_wcr_test_tester.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_augassign_wcr_test_tester.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_augassign_wcr_test_tester.pdb"
+  "libdacestub_augassign_wcr_test_tester.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_augassign_wcr_test_tester.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * augassign_wcr_test_testerHandle_t;
+extern "C" augassign_wcr_test_testerHandle_t __dace_init_augassign_wcr_test_tester();
+extern "C" int __dace_exit_augassign_wcr_test_tester(augassign_wcr_test_testerHandle_t handle);
+extern "C" void __program_augassign_wcr_test_tester(augassign_wcr_test_testerHandle_t handle, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c);
@@ -0,0 +1 @@
+#define __HASH_augassign_wcr_test_tester "bf1e608ec4645ec81819c9e880a8c91e9263f9547c212338b25851347c8c684e"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/augassign_wcr_test_tester.h"
+
+int main(int argc, char **argv) {
+    augassign_wcr_test_testerHandle_t handle;
+    int err;
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+    double * __restrict__ b = (double*) calloc(40, sizeof(double));
+    double * __restrict__ c = (double*) calloc(40, sizeof(double));
+
+
+    handle = __dace_init_augassign_wcr_test_tester();
+    __program_augassign_wcr_test_tester(handle, a, b, c);
+    err = __dace_exit_augassign_wcr_test_tester(handle);
+
+    free(a);
+    free(b);
+    free(c);
+
+
+    return err;
+}
@@ -0,0 +1,154 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct augassign_wcr_test_tester_state_t {
+
+};
+
+inline void augassign_wcr_test_tester_170_4_0_0_2(augassign_wcr_test_tester_state_t *__state, const double&  __tmp_173_19_r, const double&  __tmp_173_29_r, const double&  __tmp_175_19_r, const double&  __tmp_175_29_r, double&  __tmp_176_8_w, long long i) {
+    double tmp;
+
+    {
+
+        {
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_171_8)
+            __out = 0;
+            ///////////////////
+
+            tmp = __out;
+        }
+
+    }
+    if (((i % 2) == 0)) {
+        {
+            double __tmp2;
+
+            {
+                double __in1 = __tmp_173_19_r;
+                double __in2 = __tmp_173_29_r;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __tmp2 = __out;
+            }
+            {
+                double __in1 = tmp;
+                double __in2 = __tmp2;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (augassign_173_12)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                tmp = __out;
+            }
+
+        }
+
+    } else {
+        {
+            double __tmp3;
+
+            {
+                double __in1 = __tmp_175_19_r;
+                double __in2 = __tmp_175_29_r;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __tmp3 = __out;
+            }
+            {
+                double __in1 = tmp;
+                double __in2 = __tmp3;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (augassign_175_12)
+                __out = (__in1 + __in2);
+                ///////////////////
+
+                tmp = __out;
+            }
+
+        }
+
+    }
+    {
+
+        {
+            double __inp = tmp;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_176_8)
+            __out = __inp;
+            ///////////////////
+
+            __tmp_176_8_w = __out;
+        }
+
+    }
+    
+}
+
+void __program_augassign_wcr_test_tester_internal(augassign_wcr_test_tester_state_t*__state, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 20; i += 1) {
+                augassign_wcr_test_tester_170_4_0_0_2(__state, b[(2 * i)], c[(2 * i)], b[((2 * i) + 1)], c[((2 * i) + 1)], a[i], i);
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_tester(augassign_wcr_test_tester_state_t *__state, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c)
+{
+    __program_augassign_wcr_test_tester_internal(__state, a, b, c);
+}
+
+DACE_EXPORTED void __program_augassign_wcr_test_tester_repeat(augassign_wcr_test_tester_state_t *__state, long long __dace_repetitions, double * __restrict__ a, double * __restrict__ b, double * __restrict__ c)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_augassign_wcr_test_tester_internal(__state, a, b, c);
+    }
+}
+
+DACE_EXPORTED augassign_wcr_test_tester_state_t *__dace_init_augassign_wcr_test_tester()
+{
+    int __result = 0;
+    augassign_wcr_test_tester_state_t *__state = new augassign_wcr_test_tester_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_augassign_wcr_test_tester(augassign_wcr_test_tester_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_axpy.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_axpy.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_axpy.pdb"
+  "libdacestub_axpy.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_axpy.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * axpyHandle_t;
+extern "C" axpyHandle_t __dace_init_axpy(int N);
+extern "C" int __dace_exit_axpy(axpyHandle_t handle);
+extern "C" void __program_axpy(axpyHandle_t handle, double * __restrict__ x, double * __restrict__ y, int N, double a);
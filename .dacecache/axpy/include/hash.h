@@ -0,0 +1 @@
+#define __HASH_axpy "4130a2a542ad300b50f458ffdb3cea0f8e525b23007972b4bdaf7c0321283d60"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/azimint_hist_test_dace_azimint_hist.dir/root/package/.dacecache/azimint_hist_test_dace_azimint_hist/src/cpu/azimint_hist_test_dace_azimint_hist.cpp.o"
+  "CMakeFiles/azimint_hist_test_dace_azimint_hist.dir/root/package/.dacecache/azimint_hist_test_dace_azimint_hist/src/cpu/azimint_hist_test_dace_azimint_hist.cpp.o.d"
+  "libazimint_hist_test_dace_azimint_hist.pdb"
+  "libazimint_hist_test_dace_azimint_hist.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/azimint_hist_test_dace_azimint_hist.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
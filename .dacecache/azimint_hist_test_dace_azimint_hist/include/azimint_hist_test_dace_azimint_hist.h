@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * azimint_hist_test_dace_azimint_histHandle_t;
+extern "C" azimint_hist_test_dace_azimint_histHandle_t __dace_init_azimint_hist_test_dace_azimint_hist(long long N, long long npt);
+extern "C" int __dace_exit_azimint_hist_test_dace_azimint_hist(azimint_hist_test_dace_azimint_histHandle_t handle);
+extern "C" void __program_azimint_hist_test_dace_azimint_hist(azimint_hist_test_dace_azimint_histHandle_t handle, double * __restrict__ __return, double * __restrict__ data, double * __restrict__ radius, long long N, long long npt);
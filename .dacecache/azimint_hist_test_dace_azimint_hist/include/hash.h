@@ -0,0 +1 @@
+#define __HASH_azimint_hist_test_dace_azimint_hist "f7eab6519c7470115a2b6b9e28440447d67c95c224546f6e44c30320180a8bb0"
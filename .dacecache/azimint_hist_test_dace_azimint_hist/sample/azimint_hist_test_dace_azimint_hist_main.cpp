@@ -0,0 +1,24 @@
+#include <cstdlib>
+#include "../include/azimint_hist_test_dace_azimint_hist.h"
+
+int main(int argc, char **argv) {
+    azimint_hist_test_dace_azimint_histHandle_t handle;
+    int err;
+    long long N = 42;
+    long long npt = 42;
+    double * __restrict__ __return = (double*) calloc(npt, sizeof(double));
+    double * __restrict__ data = (double*) calloc(N, sizeof(double));
+    double * __restrict__ radius = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_azimint_hist_test_dace_azimint_hist(N, npt);
+    __program_azimint_hist_test_dace_azimint_hist(handle, __return, data, radius, N, npt);
+    err = __dace_exit_azimint_hist_test_dace_azimint_hist(handle);
+
+    free(__return);
+    free(data);
+    free(radius);
+
+
+    return err;
+}
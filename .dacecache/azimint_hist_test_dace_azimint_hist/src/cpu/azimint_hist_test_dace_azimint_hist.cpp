@@ -0,0 +1,615 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct azimint_hist_test_dace_azimint_hist_state_t {
+    long long * __restrict__ __0_histu;
+    double * __restrict__ __0_histw;
+    double * __restrict__ __1_bin_edges;
+    double __1_a_min;
+    double __1_a_max;
+    double __1___tmp2;
+    double __1_delta;
+    double * __restrict__ __5_bin_edges;
+    double __5_a_min;
+    double __5_a_max;
+    double __5_delta;
+    double __5___tmp9;
+};
+
+inline void reduce_1_0_20(azimint_hist_test_dace_azimint_hist_state_t *__state, double* __restrict__ _in, double* __restrict__ _out, long long N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 1; _o0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (reduce_init)
+                    __out = 1.7976931348623157e+308;
+                    ///////////////////
+
+                    _out[_o0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < N; _i0 += 1) {
+                {
+                    double __inp = _in[_i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (identity)
+                    __out = __inp;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Min, double>::reduce_atomic(_out, __out);
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void reduce_1_0_21(azimint_hist_test_dace_azimint_hist_state_t *__state, double* __restrict__ _in, double* __restrict__ _out, long long N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 1; _o0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (reduce_init)
+                    __out = -1.7976931348623157e+308;
+                    ///////////////////
+
+                    _out[_o0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < N; _i0 += 1) {
+                {
+                    double __inp = _in[_i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (identity)
+                    __out = __inp;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Max, double>::reduce_atomic(_out, __out);
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void azimint_hist_test_histogram_46_4_1_1_2(azimint_hist_test_dace_azimint_hist_state_t *__state, const double&  __tmp_47_30_r, double* __restrict__ __tmp_47_36_r, long long* __restrict__ __tmp_48_8_w, long long bins) {
+    long long azimint_hist_test_compute_bin_ret_0[1]  DACE_ALIGN(64);
+    long long bin;
+
+    {
+        double a_min;
+        double a_max;
+        double __tmp10;
+        double __tmp11;
+        double __tmp12;
+        double __tmp13;
+        long long __tmp14;
+
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        __tmp_47_36_r, &a_min, 1);
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        __tmp_47_36_r + bins, &a_max, 1);
+        {
+            double __in1 = a_max;
+            double __in2 = a_min;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Sub_)
+            __out = (__in1 - __in2);
+            ///////////////////
+
+            __tmp12 = __out;
+        }
+        {
+            double __in1 = __tmp_47_30_r;
+            double __in2 = a_min;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Sub_)
+            __out = (__in1 - __in2);
+            ///////////////////
+
+            __tmp10 = __out;
+        }
+        {
+            double __in2 = __tmp10;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (dace::float64(bins) * __in2);
+            ///////////////////
+
+            __tmp11 = __out;
+        }
+        {
+            double __in1 = __tmp11;
+            double __in2 = __tmp12;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / __in2);
+            ///////////////////
+
+            __tmp13 = __out;
+        }
+        {
+            double __inp = __tmp13;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (_convert_to_int64_)
+            __out = dace::int64(__inp);
+            ///////////////////
+
+            __tmp14 = __out;
+        }
+        {
+            long long __inp = __tmp14;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_37_4)
+            __out = __inp;
+            ///////////////////
+
+            azimint_hist_test_compute_bin_ret_0[0] = __out;
+        }
+
+    }
+    bin = min(azimint_hist_test_compute_bin_ret_0[0], (bins - 1));
+    {
+
+        {
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_48_8)
+            __out = 1;
+            ///////////////////
+
+            dace::wcr_fixed<dace::ReductionType::Sum, long long>::reduce_atomic(__tmp_48_8_w + bin, __out);
+        }
+
+    }
+    
+}
+
+inline void azimint_hist_test_histogram_0_0_0(azimint_hist_test_dace_azimint_hist_state_t *__state, double* __restrict__ a, long long* __restrict__ __return, long long N, long long bins) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < bins; __i0 += 1) {
+                {
+                    long long __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_43_4)
+                    __out = 0;
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+        reduce_1_0_20(__state, &a[0], &__state->__1_a_min, N);
+        reduce_1_0_21(__state, &a[0], &__state->__1_a_max, N);
+        {
+            double __in1 = __state->__1_a_max;
+            double __in2 = __state->__1_a_min;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Sub_)
+            __out = (__in1 - __in2);
+            ///////////////////
+
+            __state->__1___tmp2 = __out;
+        }
+        {
+            double __in1 = __state->__1___tmp2;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / dace::float64(bins));
+            ///////////////////
+
+            __state->__1_delta = __out;
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < bins; i += 1) {
+                double __tmp5;
+                double __tmp6;
+                {
+                    double __in2 = __state->__1_delta;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (dace::float64(i) * __in2);
+                    ///////////////////
+
+                    __tmp5 = __out;
+                }
+                {
+                    double __in2 = __tmp5;
+                    double __in1 = __state->__1_a_min;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __tmp6 = __out;
+                }
+                {
+                    double __inp = __tmp6;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_27_8)
+                    __out = __inp;
+                    ///////////////////
+
+                    __state->__1_bin_edges[i] = __out;
+                }
+            }
+        }
+        {
+            double __inp = __state->__1_a_max;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_29_4)
+            __out = __inp;
+            ///////////////////
+
+            __state->__1_bin_edges[bins] = __out;
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                azimint_hist_test_histogram_46_4_1_1_2(__state, a[i], &__state->__1_bin_edges[0], &__return[0], bins);
+            }
+        }
+
+    }
+    
+}
+
+inline void azimint_hist_test_histogram_weights_59_4_5_1_2(azimint_hist_test_dace_azimint_hist_state_t *__state, const double&  __tmp_60_30_r, double* __restrict__ __tmp_60_36_r, const double&  __tmp_61_21_r, double* __restrict__ __tmp_61_8_w, long long bins) {
+    long long azimint_hist_test_compute_bin_ret_0[1]  DACE_ALIGN(64);
+    long long bin;
+
+    {
+        double a_min;
+        double a_max;
+        double __tmp10;
+        double __tmp11;
+        double __tmp12;
+        double __tmp13;
+        long long __tmp14;
+
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        __tmp_60_36_r, &a_min, 1);
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        __tmp_60_36_r + bins, &a_max, 1);
+        {
+            double __in1 = a_max;
+            double __in2 = a_min;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Sub_)
+            __out = (__in1 - __in2);
+            ///////////////////
+
+            __tmp12 = __out;
+        }
+        {
+            double __in1 = __tmp_60_30_r;
+            double __in2 = a_min;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Sub_)
+            __out = (__in1 - __in2);
+            ///////////////////
+
+            __tmp10 = __out;
+        }
+        {
+            double __in2 = __tmp10;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (dace::float64(bins) * __in2);
+            ///////////////////
+
+            __tmp11 = __out;
+        }
+        {
+            double __in1 = __tmp11;
+            double __in2 = __tmp12;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / __in2);
+            ///////////////////
+
+            __tmp13 = __out;
+        }
+        {
+            double __inp = __tmp13;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (_convert_to_int64_)
+            __out = dace::int64(__inp);
+            ///////////////////
+
+            __tmp14 = __out;
+        }
+        {
+            long long __inp = __tmp14;
+            long long __out;
+
+            ///////////////////
+            // Tasklet code (assign_37_4)
+            __out = __inp;
+            ///////////////////
+
+            azimint_hist_test_compute_bin_ret_0[0] = __out;
+        }
+
+    }
+    bin = min(azimint_hist_test_compute_bin_ret_0[0], (bins - 1));
+    {
+
+        {
+            double __inp = __tmp_61_21_r;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_61_8)
+            __out = __inp;
+            ///////////////////
+
+            dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(__tmp_61_8_w + bin, __out);
+        }
+
+    }
+    
+}
+
+inline void azimint_hist_test_histogram_weights_0_0_3(azimint_hist_test_dace_azimint_hist_state_t *__state, double* __restrict__ a, double* __restrict__ weights, double* __restrict__ __return, long long N, long long bins) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < bins; __i0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_56_4)
+                    __out = 0;
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+        reduce_1_0_20(__state, &a[0], &__state->__5_a_min, N);
+        reduce_1_0_21(__state, &a[0], &__state->__5_a_max, N);
+        {
+            double __in1 = __state->__5_a_max;
+            double __in2 = __state->__5_a_min;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Sub_)
+            __out = (__in1 - __in2);
+            ///////////////////
+
+            __state->__5___tmp9 = __out;
+        }
+        {
+            double __in1 = __state->__5___tmp9;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / dace::float64(bins));
+            ///////////////////
+
+            __state->__5_delta = __out;
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < bins; i += 1) {
+                double __tmp10;
+                double __tmp11;
+                {
+                    double __in2 = __state->__5_delta;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (dace::float64(i) * __in2);
+                    ///////////////////
+
+                    __tmp10 = __out;
+                }
+                {
+                    double __in2 = __tmp10;
+                    double __in1 = __state->__5_a_min;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __tmp11 = __out;
+                }
+                {
+                    double __inp = __tmp11;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_27_8)
+                    __out = __inp;
+                    ///////////////////
+
+                    __state->__5_bin_edges[i] = __out;
+                }
+            }
+        }
+        {
+            double __inp = __state->__5_a_max;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_29_4)
+            __out = __inp;
+            ///////////////////
+
+            __state->__5_bin_edges[bins] = __out;
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < N; i += 1) {
+                azimint_hist_test_histogram_weights_59_4_5_1_2(__state, a[i], &__state->__5_bin_edges[0], weights[i], &__return[0], bins);
+            }
+        }
+
+    }
+    
+}
+
+void __program_azimint_hist_test_dace_azimint_hist_internal(azimint_hist_test_dace_azimint_hist_state_t*__state, double * __restrict__ __return, double * __restrict__ data, double * __restrict__ radius, long long N, long long npt)
+{
+
+    {
+
+        azimint_hist_test_histogram_0_0_0(__state, &radius[0], &__state->__0_histu[0], N, npt);
+        azimint_hist_test_histogram_weights_0_0_3(__state, &radius[0], &data[0], &__state->__0_histw[0], N, npt);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < npt; __i0 += 1) {
+                {
+                    double __in1 = __state->__0_histw[__i0];
+                    long long __in2 = __state->__0_histu[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Div_)
+                    __out = (__in1 / dace::float64(__in2));
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_azimint_hist_test_dace_azimint_hist(azimint_hist_test_dace_azimint_hist_state_t *__state, double * __restrict__ __return, double * __restrict__ data, double * __restrict__ radius, long long N, long long npt)
+{
+    __program_azimint_hist_test_dace_azimint_hist_internal(__state, __return, data, radius, N, npt);
+}
+
+DACE_EXPORTED void __program_azimint_hist_test_dace_azimint_hist_repeat(azimint_hist_test_dace_azimint_hist_state_t *__state, long long __dace_repetitions, double * __restrict__ __return, double * __restrict__ data, double * __restrict__ radius, long long N, long long npt)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_azimint_hist_test_dace_azimint_hist_internal(__state, __return, data, radius, N, npt);
+    }
+}
+
+DACE_EXPORTED azimint_hist_test_dace_azimint_hist_state_t *__dace_init_azimint_hist_test_dace_azimint_hist(long long N, long long npt)
+{
+    int __result = 0;
+    azimint_hist_test_dace_azimint_hist_state_t *__state = new azimint_hist_test_dace_azimint_hist_state_t;
+
+
+    __state->__0_histu = new long long DACE_ALIGN(64)[npt];
+    __state->__0_histw = new double DACE_ALIGN(64)[npt];
+    __state->__1_bin_edges = new double DACE_ALIGN(64)[(npt + 1)];
+    __state->__5_bin_edges = new double DACE_ALIGN(64)[(npt + 1)];
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_azimint_hist_test_dace_azimint_hist(azimint_hist_test_dace_azimint_hist_state_t *__state)
+{
+    int __err = 0;
+    delete[] __state->__0_histu;
+    delete[] __state->__0_histw;
+    delete[] __state->__1_bin_edges;
+    delete[] __state->__5_bin_edges;
+    delete __state;
+    return __err;
+}
+
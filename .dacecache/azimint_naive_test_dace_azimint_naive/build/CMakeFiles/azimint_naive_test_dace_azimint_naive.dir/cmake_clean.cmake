@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/azimint_naive_test_dace_azimint_naive.dir/root/package/.dacecache/azimint_naive_test_dace_azimint_naive/src/cpu/azimint_naive_test_dace_azimint_naive.cpp.o"
+  "CMakeFiles/azimint_naive_test_dace_azimint_naive.dir/root/package/.dacecache/azimint_naive_test_dace_azimint_naive/src/cpu/azimint_naive_test_dace_azimint_naive.cpp.o.d"
+  "libazimint_naive_test_dace_azimint_naive.pdb"
+  "libazimint_naive_test_dace_azimint_naive.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/azimint_naive_test_dace_azimint_naive.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
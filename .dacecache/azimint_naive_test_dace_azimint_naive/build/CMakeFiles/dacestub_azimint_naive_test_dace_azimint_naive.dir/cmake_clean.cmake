@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_azimint_naive_test_dace_azimint_naive.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_azimint_naive_test_dace_azimint_naive.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_azimint_naive_test_dace_azimint_naive.pdb"
+  "libdacestub_azimint_naive_test_dace_azimint_naive.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_azimint_naive_test_dace_azimint_naive.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
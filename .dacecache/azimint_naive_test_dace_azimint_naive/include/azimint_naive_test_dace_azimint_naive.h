@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * azimint_naive_test_dace_azimint_naiveHandle_t;
+extern "C" azimint_naive_test_dace_azimint_naiveHandle_t __dace_init_azimint_naive_test_dace_azimint_naive(long long N, long long npt);
+extern "C" int __dace_exit_azimint_naive_test_dace_azimint_naive(azimint_naive_test_dace_azimint_naiveHandle_t handle);
+extern "C" void __program_azimint_naive_test_dace_azimint_naive(azimint_naive_test_dace_azimint_naiveHandle_t handle, double * __restrict__ __return, double * __restrict__ data, double * __restrict__ radius, long long N, long long npt);
@@ -0,0 +1 @@
+#define __HASH_azimint_naive_test_dace_azimint_naive "39a9a1fd2a3aa9f19acf3c4aef682b7569553e17a11371944cfb5216248a672b"
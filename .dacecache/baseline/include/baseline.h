@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * baselineHandle_t;
+extern "C" baselineHandle_t __dace_init_baseline(int N);
+extern "C" int __dace_exit_baseline(baselineHandle_t handle);
+extern "C" void __program_baseline(baselineHandle_t handle, double * __restrict__ A, double * __restrict__ B, int N);
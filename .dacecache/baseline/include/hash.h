@@ -0,0 +1 @@
+#define __HASH_baseline "e5f3e06c895353f6955aacdf5995556d7b16920002d1a4acd2d000cd0fec0644"
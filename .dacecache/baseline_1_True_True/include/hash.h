@@ -0,0 +1 @@
+#define __HASH_baseline_1_True_True "a9e42b5451fb4d495f72a8df667a02c47078ccd8717802812dcf77fd3e8519ef"
@@ -0,0 +1 @@
+#define __HASH_baseline_8_False_True "5fa13bc7f3fc3a8f13c06c13ab8531687d0e0ec92706ceb1f1eca7846bdfd8e2"
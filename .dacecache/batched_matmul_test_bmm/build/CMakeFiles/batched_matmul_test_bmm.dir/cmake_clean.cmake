@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/batched_matmul_test_bmm.dir/root/package/.dacecache/batched_matmul_test_bmm/src/cpu/batched_matmul_test_bmm.cpp.o"
+  "CMakeFiles/batched_matmul_test_bmm.dir/root/package/.dacecache/batched_matmul_test_bmm/src/cpu/batched_matmul_test_bmm.cpp.o.d"
+  "libbatched_matmul_test_bmm.pdb"
+  "libbatched_matmul_test_bmm.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/batched_matmul_test_bmm.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
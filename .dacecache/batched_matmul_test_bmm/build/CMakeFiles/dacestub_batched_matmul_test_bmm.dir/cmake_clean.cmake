@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_batched_matmul_test_bmm.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_batched_matmul_test_bmm.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_batched_matmul_test_bmm.pdb"
+  "libdacestub_batched_matmul_test_bmm.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_batched_matmul_test_bmm.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * batched_matmul_test_bmmHandle_t;
+extern "C" batched_matmul_test_bmmHandle_t __dace_init_batched_matmul_test_bmm(int b, int k, int m, int n);
+extern "C" int __dace_exit_batched_matmul_test_bmm(batched_matmul_test_bmmHandle_t handle);
+extern "C" void __program_batched_matmul_test_bmm(batched_matmul_test_bmmHandle_t handle, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C, int b, int k, int m, int n);
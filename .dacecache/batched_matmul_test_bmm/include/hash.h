@@ -0,0 +1 @@
+#define __HASH_batched_matmul_test_bmm "aa0fc4902bf04eb939f58ff82b131fa4a4fbbb0c21c6ecb13127f74a33f95d5e"
@@ -0,0 +1,26 @@
+#include <cstdlib>
+#include "../include/batched_matmul_test_bmm.h"
+
+int main(int argc, char **argv) {
+    batched_matmul_test_bmmHandle_t handle;
+    int err;
+    int b = 42;
+    int k = 42;
+    int m = 42;
+    int n = 42;
+    double * __restrict__ A = (double*) calloc(((b * k) * m), sizeof(double));
+    double * __restrict__ B = (double*) calloc(((b * k) * n), sizeof(double));
+    double * __restrict__ C = (double*) calloc(((b * m) * n), sizeof(double));
+
+
+    handle = __dace_init_batched_matmul_test_bmm(b, k, m, n);
+    __program_batched_matmul_test_bmm(handle, A, B, C, b, k, m, n);
+    err = __dace_exit_batched_matmul_test_bmm(handle);
+
+    free(A);
+    free(B);
+    free(C);
+
+
+    return err;
+}
@@ -0,0 +1,106 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct batched_matmul_test_bmm_state_t {
+
+};
+
+inline void _MatMult_bmm_sdfg_0_0_3(batched_matmul_test_bmm_state_t *__state, double* __restrict__ _a, double* __restrict__ _b, double* __restrict__ _c, int b, long long k, long long m, long long n) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < b; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < m; _o1 += 1) {
+                    for (auto _o2 = 0; _o2 < n; _o2 += 1) {
+                        {
+                            double out;
+
+                            ///////////////////
+                            // Tasklet code (batched_matmul_init)
+                            out = 0;
+                            ///////////////////
+
+                            _c[((((_o0 * m) * n) + (_o1 * n)) + _o2)] = out;
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < b; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < m; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < n; __i2 += 1) {
+                        for (auto __i3 = 0; __i3 < k; __i3 += 1) {
+                            {
+                                double __a = _a[((((__i0 * k) * m) + (__i1 * k)) + __i3)];
+                                double __b = _b[((((__i0 * k) * n) + __i2) + (__i3 * n))];
+                                double __c;
+
+                                ///////////////////
+                                // Tasklet code (_BatchedBatchedMatMult_)
+                                __c = (__a * __b);
+                                ///////////////////
+
+                                dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(_c + ((((__i0 * m) * n) + (__i1 * n)) + __i2), __c);
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_batched_matmul_test_bmm_internal(batched_matmul_test_bmm_state_t*__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C, int b, int k, int m, int n)
+{
+
+    {
+
+        _MatMult_bmm_sdfg_0_0_3(__state, &A[0], &B[0], &C[0], b, k, m, n);
+
+    }
+}
+
+DACE_EXPORTED void __program_batched_matmul_test_bmm(batched_matmul_test_bmm_state_t *__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C, int b, int k, int m, int n)
+{
+    __program_batched_matmul_test_bmm_internal(__state, A, B, C, b, k, m, n);
+}
+
+DACE_EXPORTED void __program_batched_matmul_test_bmm_repeat(batched_matmul_test_bmm_state_t *__state, long long __dace_repetitions, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C, int b, int k, int m, int n)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_batched_matmul_test_bmm_internal(__state, A, B, C, b, k, m, n);
+    }
+}
+
+DACE_EXPORTED batched_matmul_test_bmm_state_t *__dace_init_batched_matmul_test_bmm(int b, int k, int m, int n)
+{
+    int __result = 0;
+    batched_matmul_test_bmm_state_t *__state = new batched_matmul_test_bmm_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_batched_matmul_test_bmm(batched_matmul_test_bmm_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_array1_array.dir/root/package/.dacecache/binop_replacements_test_array1_array/src/cpu/binop_replacements_test_array1_array.cpp.o"
+  "CMakeFiles/binop_replacements_test_array1_array.dir/root/package/.dacecache/binop_replacements_test_array1_array/src/cpu/binop_replacements_test_array1_array.cpp.o.d"
+  "libbinop_replacements_test_array1_array.pdb"
+  "libbinop_replacements_test_array1_array.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_array1_array.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array1_array "af5dd42c49eed054c878d1557c13814db173a6b16e38df40e04a2587312d5d0e"
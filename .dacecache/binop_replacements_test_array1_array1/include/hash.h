@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array1_array1 "7198fd372c2629dc1cc3048c271a31d547734228eac81ad3d6142bb8d97520cb"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_array1_array1.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_array1_array1Handle_t handle;
+    int err;
+    int * __restrict__ A = (int*) calloc(1, sizeof(int));
+    int * __restrict__ B = (int*) calloc(1, sizeof(int));
+    int * __restrict__ __return = (int*) calloc(1, sizeof(int));
+
+
+    handle = __dace_init_binop_replacements_test_array1_array1();
+    __program_binop_replacements_test_array1_array1(handle, A, B, __return);
+    err = __dace_exit_binop_replacements_test_array1_array1(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array_array "b66098c482112c307a228317d7f19bf6b18eb447af6c5537974bde60e4bfa419"
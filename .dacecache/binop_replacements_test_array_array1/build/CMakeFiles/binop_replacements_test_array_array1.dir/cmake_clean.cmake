@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_array_array1.dir/root/package/.dacecache/binop_replacements_test_array_array1/src/cpu/binop_replacements_test_array_array1.cpp.o"
+  "CMakeFiles/binop_replacements_test_array_array1.dir/root/package/.dacecache/binop_replacements_test_array_array1/src/cpu/binop_replacements_test_array_array1.cpp.o.d"
+  "libbinop_replacements_test_array_array1.pdb"
+  "libbinop_replacements_test_array_array1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_array_array1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_array_array1Handle_t;
+extern "C" binop_replacements_test_array_array1Handle_t __dace_init_binop_replacements_test_array_array1(int N);
+extern "C" int __dace_exit_binop_replacements_test_array_array1(binop_replacements_test_array_array1Handle_t handle);
+extern "C" void __program_binop_replacements_test_array_array1(binop_replacements_test_array_array1Handle_t handle, int * __restrict__ A, int * __restrict__ B, int * __restrict__ __return, int N);
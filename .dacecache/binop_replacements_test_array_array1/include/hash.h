@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array_array1 "9deab0a462c8e766539420d568cf3e350afde271253fcc3a43b889073d58cbdd"
@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_array_array1.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_array_array1Handle_t handle;
+    int err;
+    int N = 42;
+    int * __restrict__ A = (int*) calloc(N, sizeof(int));
+    int * __restrict__ B = (int*) calloc(1, sizeof(int));
+    int * __restrict__ __return = (int*) calloc(N, sizeof(int));
+
+
+    handle = __dace_init_binop_replacements_test_array_array1(N);
+    __program_binop_replacements_test_array_array1(handle, A, B, __return, N);
+    err = __dace_exit_binop_replacements_test_array_array1(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,67 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct binop_replacements_test_array_array1_state_t {
+
+};
+
+void __program_binop_replacements_test_array_array1_internal(binop_replacements_test_array_array1_state_t*__state, int * __restrict__ A, int * __restrict__ B, int * __restrict__ __return, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    int __in1 = A[__i0];
+                    int __in2 = B[0];
+                    int __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_array_array1(binop_replacements_test_array_array1_state_t *__state, int * __restrict__ A, int * __restrict__ B, int * __restrict__ __return, int N)
+{
+    __program_binop_replacements_test_array_array1_internal(__state, A, B, __return, N);
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_array_array1_repeat(binop_replacements_test_array_array1_state_t *__state, long long __dace_repetitions, int * __restrict__ A, int * __restrict__ B, int * __restrict__ __return, int N)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_binop_replacements_test_array_array1_internal(__state, A, B, __return, N);
+    }
+}
+
+DACE_EXPORTED binop_replacements_test_array_array1_state_t *__dace_init_binop_replacements_test_array_array1(int N)
+{
+    int __result = 0;
+    binop_replacements_test_array_array1_state_t *__state = new binop_replacements_test_array_array1_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_binop_replacements_test_array_array1(binop_replacements_test_array_array1_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
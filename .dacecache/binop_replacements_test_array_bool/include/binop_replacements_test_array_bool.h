@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_array_boolHandle_t;
+extern "C" binop_replacements_test_array_boolHandle_t __dace_init_binop_replacements_test_array_bool(int N);
+extern "C" int __dace_exit_binop_replacements_test_array_bool(binop_replacements_test_array_boolHandle_t handle);
+extern "C" void __program_binop_replacements_test_array_bool(binop_replacements_test_array_boolHandle_t handle, bool * __restrict__ A, bool * __restrict__ __return, int N);
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array_bool "4e33baa0b431c961e6db18272d58ff29c82ee758273c745df8b00e445a452f0e"
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_array_bool.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_array_boolHandle_t handle;
+    int err;
+    int N = 42;
+    bool * __restrict__ A = (bool*) calloc(N, sizeof(bool));
+    bool * __restrict__ __return = (bool*) calloc(N, sizeof(bool));
+
+
+    handle = __dace_init_binop_replacements_test_array_bool(N);
+    __program_binop_replacements_test_array_bool(handle, A, __return, N);
+    err = __dace_exit_binop_replacements_test_array_bool(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
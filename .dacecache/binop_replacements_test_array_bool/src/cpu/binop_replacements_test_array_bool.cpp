@@ -0,0 +1,66 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct binop_replacements_test_array_bool_state_t {
+
+};
+
+void __program_binop_replacements_test_array_bool_internal(binop_replacements_test_array_bool_state_t*__state, bool * __restrict__ A, bool * __restrict__ __return, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    bool __in1 = A[__i0];
+                    bool __out;
+
+                    ///////////////////
+                    // Tasklet code (_And_)
+                    __out = (__in1 && true);
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_array_bool(binop_replacements_test_array_bool_state_t *__state, bool * __restrict__ A, bool * __restrict__ __return, int N)
+{
+    __program_binop_replacements_test_array_bool_internal(__state, A, __return, N);
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_array_bool_repeat(binop_replacements_test_array_bool_state_t *__state, long long __dace_repetitions, bool * __restrict__ A, bool * __restrict__ __return, int N)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_binop_replacements_test_array_bool_internal(__state, A, __return, N);
+    }
+}
+
+DACE_EXPORTED binop_replacements_test_array_bool_state_t *__dace_init_binop_replacements_test_array_bool(int N)
+{
+    int __result = 0;
+    binop_replacements_test_array_bool_state_t *__state = new binop_replacements_test_array_bool_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_binop_replacements_test_array_bool(binop_replacements_test_array_bool_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_array_numHandle_t;
+extern "C" binop_replacements_test_array_numHandle_t __dace_init_binop_replacements_test_array_num(int N);
+extern "C" int __dace_exit_binop_replacements_test_array_num(binop_replacements_test_array_numHandle_t handle);
+extern "C" void __program_binop_replacements_test_array_num(binop_replacements_test_array_numHandle_t handle, long long * __restrict__ A, long long * __restrict__ __return, int N);
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array_num "552c603439b4cf9bf60f839699c19cb66b48f3b42f512383c60fa174c568c6ec"
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_array_num.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_array_numHandle_t handle;
+    int err;
+    int N = 42;
+    long long * __restrict__ A = (long long*) calloc(N, sizeof(long long));
+    long long * __restrict__ __return = (long long*) calloc(N, sizeof(long long));
+
+
+    handle = __dace_init_binop_replacements_test_array_num(N);
+    __program_binop_replacements_test_array_num(handle, A, __return, N);
+    err = __dace_exit_binop_replacements_test_array_num(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_array_scalar.dir/root/package/.dacecache/binop_replacements_test_array_scalar/src/cpu/binop_replacements_test_array_scalar.cpp.o"
+  "CMakeFiles/binop_replacements_test_array_scalar.dir/root/package/.dacecache/binop_replacements_test_array_scalar/src/cpu/binop_replacements_test_array_scalar.cpp.o.d"
+  "libbinop_replacements_test_array_scalar.pdb"
+  "libbinop_replacements_test_array_scalar.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_array_scalar.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array_scalar "475d5ef1d00f382ccb36324a5922f557a3e9659001ed5301a4260222fe30c080"
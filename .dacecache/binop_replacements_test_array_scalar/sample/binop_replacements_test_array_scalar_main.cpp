@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_array_scalar.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_array_scalarHandle_t handle;
+    int err;
+    int B = 42;
+    int N = 42;
+    int * __restrict__ A = (int*) calloc(N, sizeof(int));
+    int * __restrict__ __return = (int*) calloc(N, sizeof(int));
+
+
+    handle = __dace_init_binop_replacements_test_array_scalar(N);
+    __program_binop_replacements_test_array_scalar(handle, A, __return, B, N);
+    err = __dace_exit_binop_replacements_test_array_scalar(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_array_symHandle_t;
+extern "C" binop_replacements_test_array_symHandle_t __dace_init_binop_replacements_test_array_sym(int N);
+extern "C" int __dace_exit_binop_replacements_test_array_sym(binop_replacements_test_array_symHandle_t handle);
+extern "C" void __program_binop_replacements_test_array_sym(binop_replacements_test_array_symHandle_t handle, long long * __restrict__ A, long long * __restrict__ __return, int N);
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array_sym "922230f10b6c0efa8ec3b307aba83d96628c139f245e2b8f40b6282a5b3453e4"
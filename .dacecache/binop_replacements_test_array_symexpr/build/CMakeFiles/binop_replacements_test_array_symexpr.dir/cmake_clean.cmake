@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_array_symexpr.dir/root/package/.dacecache/binop_replacements_test_array_symexpr/src/cpu/binop_replacements_test_array_symexpr.cpp.o"
+  "CMakeFiles/binop_replacements_test_array_symexpr.dir/root/package/.dacecache/binop_replacements_test_array_symexpr/src/cpu/binop_replacements_test_array_symexpr.cpp.o.d"
+  "libbinop_replacements_test_array_symexpr.pdb"
+  "libbinop_replacements_test_array_symexpr.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_array_symexpr.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_array_symexpr "cebff75822d1328e6bf4f574a7b3049fc4f693981477b485a082d5a8e4409bfc"
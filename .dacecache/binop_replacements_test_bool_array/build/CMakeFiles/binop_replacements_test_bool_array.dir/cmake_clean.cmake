@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_bool_array.dir/root/package/.dacecache/binop_replacements_test_bool_array/src/cpu/binop_replacements_test_bool_array.cpp.o"
+  "CMakeFiles/binop_replacements_test_bool_array.dir/root/package/.dacecache/binop_replacements_test_bool_array/src/cpu/binop_replacements_test_bool_array.cpp.o.d"
+  "libbinop_replacements_test_bool_array.pdb"
+  "libbinop_replacements_test_bool_array.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_bool_array.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
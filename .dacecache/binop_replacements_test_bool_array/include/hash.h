@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_bool_array "14207401bb184cd3514c2c069751b88ae0d479947d8d12e6f71073ed4f0e79bd"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_bool_bool.dir/root/package/.dacecache/binop_replacements_test_bool_bool/src/cpu/binop_replacements_test_bool_bool.cpp.o"
+  "CMakeFiles/binop_replacements_test_bool_bool.dir/root/package/.dacecache/binop_replacements_test_bool_bool/src/cpu/binop_replacements_test_bool_bool.cpp.o.d"
+  "libbinop_replacements_test_bool_bool.pdb"
+  "libbinop_replacements_test_bool_bool.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_bool_bool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_bool_bool "35cf6e45afc964c8eed8541d51855c6b53488b6e5331e70107a272b91d5823a4"
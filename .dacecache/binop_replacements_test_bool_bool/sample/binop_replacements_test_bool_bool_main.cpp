@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_bool_bool.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_bool_boolHandle_t handle;
+    int err;
+    bool * __restrict__ __return = (bool*) calloc(1, sizeof(bool));
+
+
+    handle = __dace_init_binop_replacements_test_bool_bool();
+    __program_binop_replacements_test_bool_bool(handle, __return);
+    err = __dace_exit_binop_replacements_test_bool_bool(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_bool_scal "57a8b5b04b397076d46af205738c713cf249b5608de8124128c4d99a934fa67c"
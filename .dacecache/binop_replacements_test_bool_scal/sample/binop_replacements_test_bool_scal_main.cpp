@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_bool_scal.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_bool_scalHandle_t handle;
+    int err;
+    bool A = 42;
+    bool * __restrict__ __return = (bool*) calloc(1, sizeof(bool));
+
+
+    handle = __dace_init_binop_replacements_test_bool_scal();
+    __program_binop_replacements_test_bool_scal(handle, __return, A);
+    err = __dace_exit_binop_replacements_test_bool_scal(handle);
+
+    free(__return);
+
+
+    return err;
+}
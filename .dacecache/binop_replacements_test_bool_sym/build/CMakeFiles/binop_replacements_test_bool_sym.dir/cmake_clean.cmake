@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_bool_sym.dir/root/package/.dacecache/binop_replacements_test_bool_sym/src/cpu/binop_replacements_test_bool_sym.cpp.o"
+  "CMakeFiles/binop_replacements_test_bool_sym.dir/root/package/.dacecache/binop_replacements_test_bool_sym/src/cpu/binop_replacements_test_bool_sym.cpp.o.d"
+  "libbinop_replacements_test_bool_sym.pdb"
+  "libbinop_replacements_test_bool_sym.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_bool_sym.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
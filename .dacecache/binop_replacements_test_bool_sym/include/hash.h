@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_bool_sym "742658193b0df8d65a9c19c29abce467f3ad6fb98bcf1ab304252c38d47928dc"
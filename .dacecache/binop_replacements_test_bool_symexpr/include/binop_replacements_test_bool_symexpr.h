@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_bool_symexprHandle_t;
+extern "C" binop_replacements_test_bool_symexprHandle_t __dace_init_binop_replacements_test_bool_symexpr(int N);
+extern "C" int __dace_exit_binop_replacements_test_bool_symexpr(binop_replacements_test_bool_symexprHandle_t handle);
+extern "C" void __program_binop_replacements_test_bool_symexpr(binop_replacements_test_bool_symexprHandle_t handle, long long * __restrict__ __return, long long * __restrict__ tmp, int N);
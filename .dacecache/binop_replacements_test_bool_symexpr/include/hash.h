@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_bool_symexpr "43634ce255ccad84fa5a6b0385a31ffcb3a5281fbd9898b5c919541063aefca4"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_mixed.dir/root/package/.dacecache/binop_replacements_test_mixed/src/cpu/binop_replacements_test_mixed.cpp.o"
+  "CMakeFiles/binop_replacements_test_mixed.dir/root/package/.dacecache/binop_replacements_test_mixed/src/cpu/binop_replacements_test_mixed.cpp.o.d"
+  "libbinop_replacements_test_mixed.pdb"
+  "libbinop_replacements_test_mixed.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_mixed.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_mixedHandle_t;
+extern "C" binop_replacements_test_mixedHandle_t __dace_init_binop_replacements_test_mixed(int M, int N);
+extern "C" int __dace_exit_binop_replacements_test_mixed(binop_replacements_test_mixedHandle_t handle);
+extern "C" void __program_binop_replacements_test_mixed(binop_replacements_test_mixedHandle_t handle, long long * __restrict__ A, dace::complex128 * __restrict__ __return, long long B, int M, int N);
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_mixed "f6ce794bb0f625d89d302c4105c1712247c4f28c635799b761746cb81f8f87bb"
@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_mixed.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_mixedHandle_t handle;
+    int err;
+    long long B = 42;
+    int M = 42;
+    int N = 42;
+    long long * __restrict__ A = (long long*) calloc((M * N), sizeof(long long));
+    dace::complex128 * __restrict__ __return = (dace::complex128*) calloc(1, sizeof(dace::complex128));
+
+
+    handle = __dace_init_binop_replacements_test_mixed(M, N);
+    __program_binop_replacements_test_mixed(handle, A, __return, B, M, N);
+    err = __dace_exit_binop_replacements_test_mixed(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,177 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct binop_replacements_test_mixed_state_t {
+
+};
+
+void __program_binop_replacements_test_mixed_internal(binop_replacements_test_mixed_state_t*__state, long long * __restrict__ A, dace::complex128 * __restrict__ __return, long long B, int M, int N)
+{
+    dace::complex128 __tmp1;
+    long long __tmp2;
+    long long __tmp5;
+
+    {
+        dace::complex64 __tmp0;
+
+        {
+            dace::complex64 __out;
+
+            ///////////////////
+            // Tasklet code (_convert_to_complex64_)
+            __out = dace::complex64(M);
+            ///////////////////
+
+            __tmp0 = __out;
+        }
+        {
+            dace::complex64 __in2 = __tmp0;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (dace::complex128(0, 5) + dace::complex128(__in2));
+            ///////////////////
+
+            __tmp1 = __out;
+        }
+
+    }
+    __tmp2 = A[0];
+    __tmp5 = A[1];
+    {
+        dace::complex128 __tmp3;
+        dace::complex128 __tmp4;
+        dace::complex128 __tmp6;
+        dace::complex128 __tmp7;
+        dace::complex128 __tmp8;
+        dace::complex128 __tmp9;
+        dace::complex128 __tmp10;
+
+        {
+            dace::complex128 __in1 = __tmp1;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::complex128(__tmp2));
+            ///////////////////
+
+            __tmp3 = __out;
+        }
+        {
+            dace::complex128 __in1 = __tmp3;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::complex128(32));
+            ///////////////////
+
+            __tmp4 = __out;
+        }
+        {
+            dace::complex128 __in1 = __tmp4;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::complex128(__tmp5));
+            ///////////////////
+
+            __tmp6 = __out;
+        }
+        {
+            long long __in2 = B;
+            dace::complex128 __in1 = __tmp6;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::complex128(__in2));
+            ///////////////////
+
+            __tmp7 = __out;
+        }
+        {
+            dace::complex128 __in1 = __tmp7;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::complex128(2));
+            ///////////////////
+
+            __tmp8 = __out;
+        }
+        {
+            dace::complex128 __in1 = __tmp8;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::complex128(M));
+            ///////////////////
+
+            __tmp9 = __out;
+        }
+        {
+            dace::complex128 __in1 = __tmp9;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + dace::complex128(N));
+            ///////////////////
+
+            __tmp10 = __out;
+        }
+        {
+            dace::complex128 __inp = __tmp10;
+            dace::complex128 __out;
+
+            ///////////////////
+            // Tasklet code (assign_397_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_mixed(binop_replacements_test_mixed_state_t *__state, long long * __restrict__ A, dace::complex128 * __restrict__ __return, long long B, int M, int N)
+{
+    __program_binop_replacements_test_mixed_internal(__state, A, __return, B, M, N);
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_mixed_repeat(binop_replacements_test_mixed_state_t *__state, long long __dace_repetitions, long long * __restrict__ A, dace::complex128 * __restrict__ __return, long long B, int M, int N)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_binop_replacements_test_mixed_internal(__state, A, __return, B, M, N);
+    }
+}
+
+DACE_EXPORTED binop_replacements_test_mixed_state_t *__dace_init_binop_replacements_test_mixed(int M, int N)
+{
+    int __result = 0;
+    binop_replacements_test_mixed_state_t *__state = new binop_replacements_test_mixed_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_binop_replacements_test_mixed(binop_replacements_test_mixed_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_num_num "dcf0583deada1e47f22d6401b116b04277722a924c02296562cbc54fed7cbc90"
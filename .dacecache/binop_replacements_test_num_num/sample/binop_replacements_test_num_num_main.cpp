@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_num_num.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_num_numHandle_t handle;
+    int err;
+    long long * __restrict__ __return = (long long*) calloc(1, sizeof(long long));
+
+
+    handle = __dace_init_binop_replacements_test_num_num();
+    __program_binop_replacements_test_num_num(handle, __return);
+    err = __dace_exit_binop_replacements_test_num_num(handle);
+
+    free(__return);
+
+
+    return err;
+}
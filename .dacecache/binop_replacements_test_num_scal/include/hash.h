@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_num_scal "5eefb8e9a1be12ffce2aee36da87aa47ad8a3022680b7250b422e24dc5cb6ec1"
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_num_scal.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_num_scalHandle_t handle;
+    int err;
+    long long A = 42;
+    long long * __restrict__ __return = (long long*) calloc(1, sizeof(long long));
+
+
+    handle = __dace_init_binop_replacements_test_num_scal();
+    __program_binop_replacements_test_num_scal(handle, __return, A);
+    err = __dace_exit_binop_replacements_test_num_scal(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_num_sym.dir/root/package/.dacecache/binop_replacements_test_num_sym/src/cpu/binop_replacements_test_num_sym.cpp.o"
+  "CMakeFiles/binop_replacements_test_num_sym.dir/root/package/.dacecache/binop_replacements_test_num_sym/src/cpu/binop_replacements_test_num_sym.cpp.o.d"
+  "libbinop_replacements_test_num_sym.pdb"
+  "libbinop_replacements_test_num_sym.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_num_sym.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
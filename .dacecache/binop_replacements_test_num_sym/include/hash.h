@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_num_sym "a6136ea5a9d22625a92244ea1540ee9edb96f3c25d91a637e98bf6bf06cffad1"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_num_symexpr.dir/root/package/.dacecache/binop_replacements_test_num_symexpr/src/cpu/binop_replacements_test_num_symexpr.cpp.o"
+  "CMakeFiles/binop_replacements_test_num_symexpr.dir/root/package/.dacecache/binop_replacements_test_num_symexpr/src/cpu/binop_replacements_test_num_symexpr.cpp.o.d"
+  "libbinop_replacements_test_num_symexpr.pdb"
+  "libbinop_replacements_test_num_symexpr.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_num_symexpr.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
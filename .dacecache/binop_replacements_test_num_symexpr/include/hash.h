@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_num_symexpr "714438acfc8449c3a33251aa4467fcb7db926955b29b31e68b89df2c05e5695b"
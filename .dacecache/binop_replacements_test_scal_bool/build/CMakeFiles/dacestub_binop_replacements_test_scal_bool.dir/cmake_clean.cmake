@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_binop_replacements_test_scal_bool.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_binop_replacements_test_scal_bool.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_binop_replacements_test_scal_bool.pdb"
+  "libdacestub_binop_replacements_test_scal_bool.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_binop_replacements_test_scal_bool.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
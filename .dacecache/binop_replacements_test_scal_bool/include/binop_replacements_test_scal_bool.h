@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_scal_boolHandle_t;
+extern "C" binop_replacements_test_scal_boolHandle_t __dace_init_binop_replacements_test_scal_bool();
+extern "C" int __dace_exit_binop_replacements_test_scal_bool(binop_replacements_test_scal_boolHandle_t handle);
+extern "C" void __program_binop_replacements_test_scal_bool(binop_replacements_test_scal_boolHandle_t handle, bool * __restrict__ __return, bool A);
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_scal_bool "df2fb747e53c78eec03dae1345564d9abc8a4236be2f2a59401facec2a76295c"
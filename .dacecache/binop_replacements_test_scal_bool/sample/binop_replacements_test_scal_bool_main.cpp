@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_scal_bool.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_scal_boolHandle_t handle;
+    int err;
+    bool A = 42;
+    bool * __restrict__ __return = (bool*) calloc(1, sizeof(bool));
+
+
+    handle = __dace_init_binop_replacements_test_scal_bool();
+    __program_binop_replacements_test_scal_bool(handle, __return, A);
+    err = __dace_exit_binop_replacements_test_scal_bool(handle);
+
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_scal_num.dir/root/package/.dacecache/binop_replacements_test_scal_num/src/cpu/binop_replacements_test_scal_num.cpp.o"
+  "CMakeFiles/binop_replacements_test_scal_num.dir/root/package/.dacecache/binop_replacements_test_scal_num/src/cpu/binop_replacements_test_scal_num.cpp.o.d"
+  "libbinop_replacements_test_scal_num.pdb"
+  "libbinop_replacements_test_scal_num.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_scal_num.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
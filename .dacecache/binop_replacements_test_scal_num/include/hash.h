@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_scal_num "670f9a3999b160148ec77e15c26bdb27c421dd652d45d651545a3cda408eb2aa"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_scal_scalHandle_t;
+extern "C" binop_replacements_test_scal_scalHandle_t __dace_init_binop_replacements_test_scal_scal();
+extern "C" int __dace_exit_binop_replacements_test_scal_scal(binop_replacements_test_scal_scalHandle_t handle);
+extern "C" void __program_binop_replacements_test_scal_scal(binop_replacements_test_scal_scalHandle_t handle, int * __restrict__ __return, int A, int B);
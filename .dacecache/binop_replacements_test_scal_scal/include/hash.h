@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_scal_scal "9f4bf901e29bf5ae319198f47eb15f14f7f8f9581113916e699c44dd02187074"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_scal_scal.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_scal_scalHandle_t handle;
+    int err;
+    int A = 42;
+    int B = 42;
+    int * __restrict__ __return = (int*) calloc(1, sizeof(int));
+
+
+    handle = __dace_init_binop_replacements_test_scal_scal();
+    __program_binop_replacements_test_scal_scal(handle, __return, A, B);
+    err = __dace_exit_binop_replacements_test_scal_scal(handle);
+
+    free(__return);
+
+
+    return err;
+}
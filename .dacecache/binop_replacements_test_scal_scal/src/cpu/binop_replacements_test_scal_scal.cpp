@@ -0,0 +1,63 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct binop_replacements_test_scal_scal_state_t {
+
+};
+
+void __program_binop_replacements_test_scal_scal_internal(binop_replacements_test_scal_scal_state_t*__state, int * __restrict__ __return, int A, int B)
+{
+    int __tmp0;
+
+
+    __tmp0 = (A + B);
+    {
+
+        {
+            int __out;
+
+            ///////////////////
+            // Tasklet code (assign_174_4)
+            __out = __tmp0;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_scal_scal(binop_replacements_test_scal_scal_state_t *__state, int * __restrict__ __return, int A, int B)
+{
+    __program_binop_replacements_test_scal_scal_internal(__state, __return, A, B);
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_scal_scal_repeat(binop_replacements_test_scal_scal_state_t *__state, long long __dace_repetitions, int * __restrict__ __return, int A, int B)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_binop_replacements_test_scal_scal_internal(__state, __return, A, B);
+    }
+}
+
+DACE_EXPORTED binop_replacements_test_scal_scal_state_t *__dace_init_binop_replacements_test_scal_scal()
+{
+    int __result = 0;
+    binop_replacements_test_scal_scal_state_t *__state = new binop_replacements_test_scal_scal_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_binop_replacements_test_scal_scal(binop_replacements_test_scal_scal_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
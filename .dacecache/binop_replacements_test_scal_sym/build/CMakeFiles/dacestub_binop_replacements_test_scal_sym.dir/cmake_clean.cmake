@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_binop_replacements_test_scal_sym.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_binop_replacements_test_scal_sym.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_binop_replacements_test_scal_sym.pdb"
+  "libdacestub_binop_replacements_test_scal_sym.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_binop_replacements_test_scal_sym.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_scal_sym "2db0fd0a3d6cb2ec36590fda8e38343f6edb2b8c7ac648bf2ee5ad5f3799215d"
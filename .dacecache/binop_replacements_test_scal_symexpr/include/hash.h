@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_scal_symexpr "1f00cd584fe1945cd1c89398706d046f90e06752a088567be174933f7ec21686"
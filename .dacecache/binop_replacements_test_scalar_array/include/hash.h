@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_scalar_array "3c2af0c10871d23beee05e683bb3ad886a4e3f952e8370972e301e004bc2bcf0"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_scalar_array.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_scalar_arrayHandle_t handle;
+    int err;
+    int A = 42;
+    int N = 42;
+    int * __restrict__ B = (int*) calloc(N, sizeof(int));
+    int * __restrict__ __return = (int*) calloc(N, sizeof(int));
+
+
+    handle = __dace_init_binop_replacements_test_scalar_array(N);
+    __program_binop_replacements_test_scalar_array(handle, B, __return, A, N);
+    err = __dace_exit_binop_replacements_test_scalar_array(handle);
+
+    free(B);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_sym_arrayHandle_t;
+extern "C" binop_replacements_test_sym_arrayHandle_t __dace_init_binop_replacements_test_sym_array(int N);
+extern "C" int __dace_exit_binop_replacements_test_sym_array(binop_replacements_test_sym_arrayHandle_t handle);
+extern "C" void __program_binop_replacements_test_sym_array(binop_replacements_test_sym_arrayHandle_t handle, long long * __restrict__ A, long long * __restrict__ __return, int N);
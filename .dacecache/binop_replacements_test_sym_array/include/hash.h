@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_sym_array "6cca8bca40908efee3e5c0a65939ed58908557bb20465da20b04b4c255b5e346"
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_sym_bool "bd8df8ccfb5e548e9dc0d7e40ceae0d5809ef34260a7005c62b64e5781fd3387"
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_sym_bool.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_sym_boolHandle_t handle;
+    int err;
+    int N = 42;
+    int * __restrict__ __return = (int*) calloc(1, sizeof(int));
+    long long * __restrict__ tmp = (long long*) calloc(N, sizeof(long long));
+
+
+    handle = __dace_init_binop_replacements_test_sym_bool(N);
+    __program_binop_replacements_test_sym_bool(handle, __return, tmp, N);
+    err = __dace_exit_binop_replacements_test_sym_bool(handle);
+
+    free(__return);
+    free(tmp);
+
+
+    return err;
+}
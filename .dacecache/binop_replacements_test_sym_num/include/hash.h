@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_sym_num "152945a24647a9a4a12f62edaab49c43ac0f8d2aa89ad2c5e41bb3cabb1221eb"
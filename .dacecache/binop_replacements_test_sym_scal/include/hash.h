@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_sym_scal "7704f736a07c59c242eb6693ad4f875e734adc7930c08128db2d3a724afa5c78"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_sym_symHandle_t;
+extern "C" binop_replacements_test_sym_symHandle_t __dace_init_binop_replacements_test_sym_sym(int M, int N);
+extern "C" int __dace_exit_binop_replacements_test_sym_sym(binop_replacements_test_sym_symHandle_t handle);
+extern "C" void __program_binop_replacements_test_sym_sym(binop_replacements_test_sym_symHandle_t handle, long long * __restrict__ __return, long long * __restrict__ tmp, int M, int N);
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_sym_sym "9dbe6adc831c2e24012a43faac149147e27291c2c3c29139d407a63d8bf8cfe4"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_sym_sym.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_sym_symHandle_t handle;
+    int err;
+    int M = 42;
+    int N = 42;
+    long long * __restrict__ __return = (long long*) calloc(1, sizeof(long long));
+    long long * __restrict__ tmp = (long long*) calloc((M * N), sizeof(long long));
+
+
+    handle = __dace_init_binop_replacements_test_sym_sym(M, N);
+    __program_binop_replacements_test_sym_sym(handle, __return, tmp, M, N);
+    err = __dace_exit_binop_replacements_test_sym_sym(handle);
+
+    free(__return);
+    free(tmp);
+
+
+    return err;
+}
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_symexpr_array "3063232d886429b9de647857ef5647a9ec30472e8d8ebd6c10b5b7995103b446"
@@ -0,0 +1,66 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct binop_replacements_test_symexpr_array_state_t {
+
+};
+
+void __program_binop_replacements_test_symexpr_array_internal(binop_replacements_test_symexpr_array_state_t*__state, long long * __restrict__ A, long long * __restrict__ __return, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    long long __in2 = A[__i0];
+                    long long __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = ((N + 1) + __in2);
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_symexpr_array(binop_replacements_test_symexpr_array_state_t *__state, long long * __restrict__ A, long long * __restrict__ __return, int N)
+{
+    __program_binop_replacements_test_symexpr_array_internal(__state, A, __return, N);
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_symexpr_array_repeat(binop_replacements_test_symexpr_array_state_t *__state, long long __dace_repetitions, long long * __restrict__ A, long long * __restrict__ __return, int N)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_binop_replacements_test_symexpr_array_internal(__state, A, __return, N);
+    }
+}
+
+DACE_EXPORTED binop_replacements_test_symexpr_array_state_t *__dace_init_binop_replacements_test_symexpr_array(int N)
+{
+    int __result = 0;
+    binop_replacements_test_symexpr_array_state_t *__state = new binop_replacements_test_symexpr_array_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_binop_replacements_test_symexpr_array(binop_replacements_test_symexpr_array_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
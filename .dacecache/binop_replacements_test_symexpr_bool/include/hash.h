@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_symexpr_bool "6115e157fa1f666cb155ce07dd5b6b65655b1e22355b036c03b580262683f8e0"
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_symexpr_num "99516857d960dcc9991f68ca1d3560cab2a1d902af3a6d1532450890ced47e28"
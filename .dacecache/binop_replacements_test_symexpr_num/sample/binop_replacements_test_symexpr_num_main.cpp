@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_symexpr_num.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_symexpr_numHandle_t handle;
+    int err;
+    int N = 42;
+    long long * __restrict__ __return = (long long*) calloc(1, sizeof(long long));
+    long long * __restrict__ tmp = (long long*) calloc(N, sizeof(long long));
+
+
+    handle = __dace_init_binop_replacements_test_symexpr_num(N);
+    __program_binop_replacements_test_symexpr_num(handle, __return, tmp, N);
+    err = __dace_exit_binop_replacements_test_symexpr_num(handle);
+
+    free(__return);
+    free(tmp);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_symexpr_scal.dir/root/package/.dacecache/binop_replacements_test_symexpr_scal/src/cpu/binop_replacements_test_symexpr_scal.cpp.o"
+  "CMakeFiles/binop_replacements_test_symexpr_scal.dir/root/package/.dacecache/binop_replacements_test_symexpr_scal/src/cpu/binop_replacements_test_symexpr_scal.cpp.o.d"
+  "libbinop_replacements_test_symexpr_scal.pdb"
+  "libbinop_replacements_test_symexpr_scal.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_symexpr_scal.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_symexpr_scal "d070b524bb1649b83c6fe03c45e0d5e820bc5bceb58321b2ec2d19f417462bd6"
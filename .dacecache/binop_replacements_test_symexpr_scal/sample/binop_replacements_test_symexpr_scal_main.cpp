@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_symexpr_scal.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_symexpr_scalHandle_t handle;
+    int err;
+    long long A = 42;
+    int N = 42;
+    long long * __restrict__ __return = (long long*) calloc(1, sizeof(long long));
+    long long * __restrict__ tmp = (long long*) calloc(N, sizeof(long long));
+
+
+    handle = __dace_init_binop_replacements_test_symexpr_scal(N);
+    __program_binop_replacements_test_symexpr_scal(handle, __return, tmp, A, N);
+    err = __dace_exit_binop_replacements_test_symexpr_scal(handle);
+
+    free(__return);
+    free(tmp);
+
+
+    return err;
+}
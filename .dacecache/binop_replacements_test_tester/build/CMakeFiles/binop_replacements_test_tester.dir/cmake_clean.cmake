@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/binop_replacements_test_tester.dir/root/package/.dacecache/binop_replacements_test_tester/src/cpu/binop_replacements_test_tester.cpp.o"
+  "CMakeFiles/binop_replacements_test_tester.dir/root/package/.dacecache/binop_replacements_test_tester/src/cpu/binop_replacements_test_tester.cpp.o.d"
+  "libbinop_replacements_test_tester.pdb"
+  "libbinop_replacements_test_tester.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/binop_replacements_test_tester.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * binop_replacements_test_testerHandle_t;
+extern "C" binop_replacements_test_testerHandle_t __dace_init_binop_replacements_test_tester();
+extern "C" int __dace_exit_binop_replacements_test_tester(binop_replacements_test_testerHandle_t handle);
+extern "C" void __program_binop_replacements_test_tester(binop_replacements_test_testerHandle_t handle, double * __restrict__ a);
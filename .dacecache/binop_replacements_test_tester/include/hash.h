@@ -0,0 +1 @@
+#define __HASH_binop_replacements_test_tester "a64a9962751158fdc86110fb04e237e19707c4bd98da37abfa4a05d2bb2e3914"
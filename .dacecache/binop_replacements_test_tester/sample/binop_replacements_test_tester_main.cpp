@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/binop_replacements_test_tester.h"
+
+int main(int argc, char **argv) {
+    binop_replacements_test_testerHandle_t handle;
+    int err;
+    double * __restrict__ a = (double*) calloc(800, sizeof(double));
+
+
+    handle = __dace_init_binop_replacements_test_tester();
+    __program_binop_replacements_test_tester(handle, a);
+    err = __dace_exit_binop_replacements_test_tester(handle);
+
+    free(a);
+
+
+    return err;
+}
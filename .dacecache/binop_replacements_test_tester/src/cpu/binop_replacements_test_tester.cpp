@@ -0,0 +1,65 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct binop_replacements_test_tester_state_t {
+
+};
+
+void __program_binop_replacements_test_tester_internal(binop_replacements_test_tester_state_t*__state, double * __restrict__ a)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto flat = 0; flat < 800; flat += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (assign_418_8)
+                    __out = (((int_floor(flat, 40) * 1000) + (dace::math::ifloor((flat % 40) / 2) * 100)) + (((flat % 40) + 2) % 2));
+                    ///////////////////
+
+                    a[(((flat % 2) + (40 * (flat / 40))) + (2 * ((flat % 40) / 2)))] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_tester(binop_replacements_test_tester_state_t *__state, double * __restrict__ a)
+{
+    __program_binop_replacements_test_tester_internal(__state, a);
+}
+
+DACE_EXPORTED void __program_binop_replacements_test_tester_repeat(binop_replacements_test_tester_state_t *__state, long long __dace_repetitions, double * __restrict__ a)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_binop_replacements_test_tester_internal(__state, a);
+    }
+}
+
+DACE_EXPORTED binop_replacements_test_tester_state_t *__dace_init_binop_replacements_test_tester()
+{
+    int __result = 0;
+    binop_replacements_test_tester_state_t *__state = new binop_replacements_test_tester_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_binop_replacements_test_tester(binop_replacements_test_tester_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
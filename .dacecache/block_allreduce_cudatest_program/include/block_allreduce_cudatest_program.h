@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * block_allreduce_cudatest_programHandle_t;
+extern "C" block_allreduce_cudatest_programHandle_t __dace_init_block_allreduce_cudatest_program(int M, int N);
+extern "C" int __dace_exit_block_allreduce_cudatest_program(block_allreduce_cudatest_programHandle_t handle);
+extern "C" void __program_block_allreduce_cudatest_program(block_allreduce_cudatest_programHandle_t handle, float * __restrict__ A, float * __restrict__ __return, int M, int N);
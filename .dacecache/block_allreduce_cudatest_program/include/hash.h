@@ -0,0 +1 @@
+#define __HASH_block_allreduce_cudatest_program "cfba929e8d3abb254fd091df16583f0f3f176fcbfd16d5cb26a61a5070973b36"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/block_allreduce_cudatest_program.h"
+
+int main(int argc, char **argv) {
+    block_allreduce_cudatest_programHandle_t handle;
+    int err;
+    int M = 42;
+    int N = 42;
+    float * __restrict__ A = (float*) calloc((M * N), sizeof(float));
+    float * __restrict__ __return = (float*) calloc(M, sizeof(float));
+
+
+    handle = __dace_init_block_allreduce_cudatest_program(M, N);
+    __program_block_allreduce_cudatest_program(handle, A, __return, M, N);
+    err = __dace_exit_block_allreduce_cudatest_program(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
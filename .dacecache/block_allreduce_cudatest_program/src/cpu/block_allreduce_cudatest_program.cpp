@@ -0,0 +1,75 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct block_allreduce_cudatest_program_state_t {
+    dace::cuda::Context *gpu_context;
+};
+
+
+DACE_EXPORTED void __dace_reduce_block_allreduce_cudatest_program_0_2(float *input, float *output, size_t num_segments, size_t segment_size, cudaStream_t stream);
+
+void __program_block_allreduce_cudatest_program_internal(block_allreduce_cudatest_program_state_t*__state, float * __restrict__ A, float * __restrict__ __return, int M, int N)
+{
+
+    {
+        float * gpu_A;
+        DACE_GPU_CHECK(cudaMalloc((void**)&gpu_A, (M * N) * sizeof(float)));
+        float * gpu___return;
+        DACE_GPU_CHECK(cudaMalloc((void**)&gpu___return, M * sizeof(float)));
+
+        DACE_GPU_CHECK(cudaMemcpyAsync(gpu_A, A, (M * N) * sizeof(float), cudaMemcpyHostToDevice, __state->gpu_context->streams[0]));
+        {
+            float * _in = &gpu_A[0];
+            float* _out = gpu___return;
+
+            ///////////////////
+            int __dace_current_stream_id = 0;
+            cudaStream_t __dace_current_stream = __state->gpu_context->streams[__dace_current_stream_id];
+            __dace_reduce_block_allreduce_cudatest_program_0_2(_in, _out, M, N, __dace_current_stream);
+            ///////////////////
+
+        }
+        DACE_GPU_CHECK(cudaMemcpyAsync(__return, gpu___return, M * sizeof(float), cudaMemcpyDeviceToHost, __state->gpu_context->streams[0]));
+        DACE_GPU_CHECK(cudaStreamSynchronize(__state->gpu_context->streams[0]));
+
+        DACE_GPU_CHECK(cudaFree(gpu_A));
+        DACE_GPU_CHECK(cudaFree(gpu___return));
+
+    }
+}
+
+DACE_EXPORTED void __program_block_allreduce_cudatest_program(block_allreduce_cudatest_program_state_t *__state, float * __restrict__ A, float * __restrict__ __return, int M, int N)
+{
+    __program_block_allreduce_cudatest_program_internal(__state, A, __return, M, N);
+}
+DACE_EXPORTED int __dace_init_cuda(block_allreduce_cudatest_program_state_t *__state, int M, int N);
+DACE_EXPORTED int __dace_exit_cuda(block_allreduce_cudatest_program_state_t *__state);
+
+DACE_EXPORTED block_allreduce_cudatest_program_state_t *__dace_init_block_allreduce_cudatest_program(int M, int N)
+{
+    int __result = 0;
+    block_allreduce_cudatest_program_state_t *__state = new block_allreduce_cudatest_program_state_t;
+
+
+    __result |= __dace_init_cuda(__state, M, N);
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_block_allreduce_cudatest_program(block_allreduce_cudatest_program_state_t *__state)
+{
+    int __err = 0;
+
+    int __err_cuda = __dace_exit_cuda(__state);
+    if (__err_cuda) {
+        __err = __err_cuda;
+    }
+    delete __state;
+    return __err;
+}
+
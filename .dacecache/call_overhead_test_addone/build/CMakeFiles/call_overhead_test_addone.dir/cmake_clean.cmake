@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/call_overhead_test_addone.dir/root/package/.dacecache/call_overhead_test_addone/src/cpu/call_overhead_test_addone.cpp.o"
+  "CMakeFiles/call_overhead_test_addone.dir/root/package/.dacecache/call_overhead_test_addone/src/cpu/call_overhead_test_addone.cpp.o.d"
+  "libcall_overhead_test_addone.pdb"
+  "libcall_overhead_test_addone.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/call_overhead_test_addone.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
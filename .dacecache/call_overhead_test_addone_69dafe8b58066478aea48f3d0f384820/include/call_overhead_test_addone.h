@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * call_overhead_test_addoneHandle_t;
+extern "C" call_overhead_test_addoneHandle_t __dace_init_call_overhead_test_addone(int N);
+extern "C" int __dace_exit_call_overhead_test_addone(call_overhead_test_addoneHandle_t handle);
+extern "C" void __program_call_overhead_test_addone(call_overhead_test_addoneHandle_t handle, double * __restrict__ __return, double * __restrict__ a, int N);
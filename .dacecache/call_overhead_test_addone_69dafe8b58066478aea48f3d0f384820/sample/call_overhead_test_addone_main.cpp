@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/call_overhead_test_addone.h"
+
+int main(int argc, char **argv) {
+    call_overhead_test_addoneHandle_t handle;
+    int err;
+    int N = 42;
+    double * __restrict__ __return = (double*) calloc(N, sizeof(double));
+    double * __restrict__ a = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_call_overhead_test_addone(N);
+    __program_call_overhead_test_addone(handle, __return, a, N);
+    err = __dace_exit_call_overhead_test_addone(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
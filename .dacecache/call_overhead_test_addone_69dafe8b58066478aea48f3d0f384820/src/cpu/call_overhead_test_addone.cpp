@@ -0,0 +1,59 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct call_overhead_test_addone_state_t {
+
+};
+
+void __program_call_overhead_test_addone_internal(call_overhead_test_addone_state_t*__state, double * __restrict__ __return, double * __restrict__ a, int N)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    double __in1 = a[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + dace::float64(1));
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_call_overhead_test_addone(call_overhead_test_addone_state_t *__state, double * __restrict__ __return, double * __restrict__ a, int N)
+{
+    __program_call_overhead_test_addone_internal(__state, __return, a, N);
+}
+
+DACE_EXPORTED call_overhead_test_addone_state_t *__dace_init_call_overhead_test_addone(int N)
+{
+    int __result = 0;
+    call_overhead_test_addone_state_t *__state = new call_overhead_test_addone_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_call_overhead_test_addone(call_overhead_test_addone_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_call_overhead_test_addone.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_call_overhead_test_addone.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_call_overhead_test_addone.pdb"
+  "libdacestub_call_overhead_test_addone.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_call_overhead_test_addone.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
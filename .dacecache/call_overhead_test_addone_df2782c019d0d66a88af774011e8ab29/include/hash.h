@@ -0,0 +1 @@
+#define __HASH_call_overhead_test_addone "3a3acdbd96d9cbf8e3457f223c3e984b8b57411fdc298b62e041bcd1be82a4f6"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/call_overhead_test_axpy.dir/root/package/.dacecache/call_overhead_test_axpy/src/cpu/call_overhead_test_axpy.cpp.o"
+  "CMakeFiles/call_overhead_test_axpy.dir/root/package/.dacecache/call_overhead_test_axpy/src/cpu/call_overhead_test_axpy.cpp.o.d"
+  "libcall_overhead_test_axpy.pdb"
+  "libcall_overhead_test_axpy.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/call_overhead_test_axpy.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/call_overhead_test_axpy.h"
+
+int main(int argc, char **argv) {
+    call_overhead_test_axpyHandle_t handle;
+    int err;
+    int N = 42;
+    double a = 42;
+    double * __restrict__ x = (double*) calloc(N, sizeof(double));
+    double * __restrict__ y = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_call_overhead_test_axpy(N);
+    __program_call_overhead_test_axpy(handle, x, y, N, a);
+    err = __dace_exit_call_overhead_test_axpy(handle);
+
+    free(x);
+    free(y);
+
+
+    return err;
+}
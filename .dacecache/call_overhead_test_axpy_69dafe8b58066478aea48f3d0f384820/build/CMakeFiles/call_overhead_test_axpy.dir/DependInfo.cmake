@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.dacecache/call_overhead_test_axpy_69dafe8b58066478aea48f3d0f384820/src/cpu/call_overhead_test_axpy.cpp" "CMakeFiles/call_overhead_test_axpy.dir/root/package/.dacecache/call_overhead_test_axpy_69dafe8b58066478aea48f3d0f384820/src/cpu/call_overhead_test_axpy.cpp.o" "gcc" "CMakeFiles/call_overhead_test_axpy.dir/root/package/.dacecache/call_overhead_test_axpy_69dafe8b58066478aea48f3d0f384820/src/cpu/call_overhead_test_axpy.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
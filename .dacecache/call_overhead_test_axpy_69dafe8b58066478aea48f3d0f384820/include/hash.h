@@ -0,0 +1 @@
+#define __HASH_call_overhead_test_axpy "b16ce1074a109b78790b5889345ff1815d4dc14ca03a0dd24a584c1672537f11"
@@ -0,0 +1,86 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct call_overhead_test_axpy_state_t {
+
+};
+
+void __program_call_overhead_test_axpy_internal(call_overhead_test_axpy_state_t*__state, double * __restrict__ x, double * __restrict__ y, int N, double a)
+{
+
+    {
+        double *__tmp0;
+        __tmp0 = new double DACE_ALIGN(64)[N];
+        double *__tmp1;
+        __tmp1 = new double DACE_ALIGN(64)[N];
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    double __in1 = a;
+                    double __in2 = x[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * __in2);
+                    ///////////////////
+
+                    __tmp0[__i0] = __out;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                {
+                    double __in1 = __tmp0[__i0];
+                    double __in2 = y[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __tmp1[__i0] = __out;
+                }
+            }
+        }
+
+        dace::CopyNDDynamic<double, 1, false, 1>::template ConstDst<1>::Copy(
+        __tmp1, y, N, 1);
+        delete[] __tmp0;
+        delete[] __tmp1;
+
+    }
+}
+
+DACE_EXPORTED void __program_call_overhead_test_axpy(call_overhead_test_axpy_state_t *__state, double * __restrict__ x, double * __restrict__ y, int N, double a)
+{
+    __program_call_overhead_test_axpy_internal(__state, x, y, N, a);
+}
+
+DACE_EXPORTED call_overhead_test_axpy_state_t *__dace_init_call_overhead_test_axpy(int N)
+{
+    int __result = 0;
+    call_overhead_test_axpy_state_t *__state = new call_overhead_test_axpy_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_call_overhead_test_axpy(call_overhead_test_axpy_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
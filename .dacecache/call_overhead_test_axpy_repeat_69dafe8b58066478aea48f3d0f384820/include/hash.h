@@ -0,0 +1 @@
+#define __HASH_call_overhead_test_axpy_repeat "3f294d5b8acc99668afc8d534277bb9c7e5ce6c24f9b1255c71db089dfbe1382"
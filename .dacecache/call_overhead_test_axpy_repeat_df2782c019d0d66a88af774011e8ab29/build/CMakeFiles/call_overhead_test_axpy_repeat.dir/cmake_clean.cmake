@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/call_overhead_test_axpy_repeat.dir/root/package/.dacecache/call_overhead_test_axpy_repeat_df2782c019d0d66a88af774011e8ab29/src/cpu/call_overhead_test_axpy_repeat.cpp.o"
+  "CMakeFiles/call_overhead_test_axpy_repeat.dir/root/package/.dacecache/call_overhead_test_axpy_repeat_df2782c019d0d66a88af774011e8ab29/src/cpu/call_overhead_test_axpy_repeat.cpp.o.d"
+  "libcall_overhead_test_axpy_repeat.pdb"
+  "libcall_overhead_test_axpy_repeat.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/call_overhead_test_axpy_repeat.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
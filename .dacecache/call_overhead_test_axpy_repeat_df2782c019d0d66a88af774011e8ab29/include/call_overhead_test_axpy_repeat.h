@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * call_overhead_test_axpy_repeatHandle_t;
+extern "C" call_overhead_test_axpy_repeatHandle_t __dace_init_call_overhead_test_axpy_repeat(int N);
+extern "C" int __dace_exit_call_overhead_test_axpy_repeat(call_overhead_test_axpy_repeatHandle_t handle);
+extern "C" void __program_call_overhead_test_axpy_repeat(call_overhead_test_axpy_repeatHandle_t handle, double * __restrict__ x, double * __restrict__ y, int N, double a);
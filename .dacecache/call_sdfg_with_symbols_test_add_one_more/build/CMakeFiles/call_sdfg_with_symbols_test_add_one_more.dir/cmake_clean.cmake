@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/call_sdfg_with_symbols_test_add_one_more.dir/root/package/.dacecache/call_sdfg_with_symbols_test_add_one_more/src/cpu/call_sdfg_with_symbols_test_add_one_more.cpp.o"
+  "CMakeFiles/call_sdfg_with_symbols_test_add_one_more.dir/root/package/.dacecache/call_sdfg_with_symbols_test_add_one_more/src/cpu/call_sdfg_with_symbols_test_add_one_more.cpp.o.d"
+  "libcall_sdfg_with_symbols_test_add_one_more.pdb"
+  "libcall_sdfg_with_symbols_test_add_one_more.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/call_sdfg_with_symbols_test_add_one_more.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/call_sdfg_with_symbols_test_add_one_more_0.dir/root/package/.dacecache/call_sdfg_with_symbols_test_add_one_more/src/cpu/call_sdfg_with_symbols_test_add_one_more_0.cpp.o"
+  "CMakeFiles/call_sdfg_with_symbols_test_add_one_more_0.dir/root/package/.dacecache/call_sdfg_with_symbols_test_add_one_more/src/cpu/call_sdfg_with_symbols_test_add_one_more_0.cpp.o.d"
+  "libcall_sdfg_with_symbols_test_add_one_more_0.pdb"
+  "libcall_sdfg_with_symbols_test_add_one_more_0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/call_sdfg_with_symbols_test_add_one_more_0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_call_sdfg_with_symbols_test_add_one_more.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_call_sdfg_with_symbols_test_add_one_more.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_call_sdfg_with_symbols_test_add_one_more.pdb"
+  "libdacestub_call_sdfg_with_symbols_test_add_one_more.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_call_sdfg_with_symbols_test_add_one_more.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
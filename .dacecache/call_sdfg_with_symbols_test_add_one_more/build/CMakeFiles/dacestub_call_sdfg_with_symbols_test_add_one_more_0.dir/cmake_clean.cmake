@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_call_sdfg_with_symbols_test_add_one_more_0.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_call_sdfg_with_symbols_test_add_one_more_0.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_call_sdfg_with_symbols_test_add_one_more_0.pdb"
+  "libdacestub_call_sdfg_with_symbols_test_add_one_more_0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_call_sdfg_with_symbols_test_add_one_more_0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
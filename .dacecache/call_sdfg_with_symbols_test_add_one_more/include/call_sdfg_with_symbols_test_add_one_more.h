@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * call_sdfg_with_symbols_test_add_one_moreHandle_t;
+extern "C" call_sdfg_with_symbols_test_add_one_moreHandle_t __dace_init_call_sdfg_with_symbols_test_add_one_more(int N);
+extern "C" int __dace_exit_call_sdfg_with_symbols_test_add_one_more(call_sdfg_with_symbols_test_add_one_moreHandle_t handle);
+extern "C" void __program_call_sdfg_with_symbols_test_add_one_more(call_sdfg_with_symbols_test_add_one_moreHandle_t handle, long long * __restrict__ A, long long * __restrict__ __return, int N);
@@ -0,0 +1 @@
+#define __HASH_call_sdfg_with_symbols_test_add_one_more_1 "b46ce65087522bf07ae84909b977c0a55d04b717297cebd08cf8a79b32b93769"
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/call_sdfg_with_symbols_test_add_one_more_0.h"
+
+int main(int argc, char **argv) {
+    call_sdfg_with_symbols_test_add_one_more_0Handle_t handle;
+    int err;
+    int N = 42;
+    long long * __restrict__ A = (long long*) calloc((N * N), sizeof(long long));
+    long long * __restrict__ __return = (long long*) calloc((N * N), sizeof(long long));
+
+
+    handle = __dace_init_call_sdfg_with_symbols_test_add_one_more_0(N);
+    __program_call_sdfg_with_symbols_test_add_one_more_0(handle, A, __return, N);
+    err = __dace_exit_call_sdfg_with_symbols_test_add_one_more_0(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
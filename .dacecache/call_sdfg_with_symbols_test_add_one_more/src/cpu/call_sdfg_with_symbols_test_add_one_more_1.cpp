@@ -0,0 +1,89 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct call_sdfg_with_symbols_test_add_one_more_1_state_t {
+
+};
+
+void __program_call_sdfg_with_symbols_test_add_one_more_1_internal(call_sdfg_with_symbols_test_add_one_more_1_state_t*__state, long long * __restrict__ A, long long * __restrict__ __return, int N)
+{
+
+    {
+        long long *result;
+        result = new long long DACE_ALIGN(64)[(N * N)];
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < N; __i1 += 1) {
+                    {
+                        long long __in1 = A[((N * __i0) + __i1)];
+                        long long __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (__in1 + 1);
+                        ///////////////////
+
+                        result[((N * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < N; __i1 += 1) {
+                    {
+                        long long __in1 = result[((N * __i0) + __i1)];
+                        long long __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (__in1 + 1);
+                        ///////////////////
+
+                        __return[((N * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        delete[] result;
+
+    }
+}
+
+DACE_EXPORTED void __program_call_sdfg_with_symbols_test_add_one_more_1(call_sdfg_with_symbols_test_add_one_more_1_state_t *__state, long long * __restrict__ A, long long * __restrict__ __return, int N)
+{
+    __program_call_sdfg_with_symbols_test_add_one_more_1_internal(__state, A, __return, N);
+}
+
+DACE_EXPORTED void __program_call_sdfg_with_symbols_test_add_one_more_1_repeat(call_sdfg_with_symbols_test_add_one_more_1_state_t *__state, long long __dace_repetitions, long long * __restrict__ A, long long * __restrict__ __return, int N)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_call_sdfg_with_symbols_test_add_one_more_1_internal(__state, A, __return, N);
+    }
+}
+
+DACE_EXPORTED call_sdfg_with_symbols_test_add_one_more_1_state_t *__dace_init_call_sdfg_with_symbols_test_add_one_more_1(int N)
+{
+    int __result = 0;
+    call_sdfg_with_symbols_test_add_one_more_1_state_t *__state = new call_sdfg_with_symbols_test_add_one_more_1_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_call_sdfg_with_symbols_test_add_one_more_1(call_sdfg_with_symbols_test_add_one_more_1_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_autocallback.dir/root/package/.dacecache/callback_autodetect_test_autocallback/src/cpu/callback_autodetect_test_autocallback.cpp.o"
+  "CMakeFiles/callback_autodetect_test_autocallback.dir/root/package/.dacecache/callback_autodetect_test_autocallback/src/cpu/callback_autodetect_test_autocallback.cpp.o.d"
+  "libcallback_autodetect_test_autocallback.pdb"
+  "libcallback_autodetect_test_autocallback.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_autocallback.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_autocallback_1 "39c200169ead593cc05c3420e13f92ee51a9f5a6abb100a447be684545bee853"
@@ -0,0 +1,26 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_autocallback.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_autocallbackHandle_t handle;
+    int err;
+    int N = 42;
+    void (*almost_gemm)(double const *, double const *, double const *) = 42;
+    double beta = 42;
+    void (*scale)(double const *, double) = 42;
+    double * __restrict__ A = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ C = (double*) calloc((N * N), sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_autocallback(N, almost_gemm, scale);
+    __program_callback_autodetect_test_autocallback(handle, A, B, C, N, almost_gemm, beta, scale);
+    err = __dace_exit_callback_autodetect_test_autocallback(handle);
+
+    free(A);
+    free(B);
+    free(C);
+
+
+    return err;
+}
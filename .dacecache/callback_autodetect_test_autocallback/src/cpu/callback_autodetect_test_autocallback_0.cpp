@@ -0,0 +1,133 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_autocallback_0_state_t {
+
+};
+
+void __program_callback_autodetect_test_autocallback_0_internal(callback_autodetect_test_autocallback_0_state_t*__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C, int N, void (*almost_gemm_2)(double const *, double const *, double const *, double const *), double beta, void (*scale)(double const *, double))
+{
+    int __pystate;
+    double *tmp;
+    tmp = new double DACE_ALIGN(64)[(N * N)];
+    double *tmp2;
+    tmp2 = new double DACE_ALIGN(64)[1];
+
+    {
+
+        {
+            double* __in_A = &A[0];
+            double* __in_B = &B[0];
+            int __istate = __pystate;
+            double* __out_A = A;
+            double* __out_B = B;
+            double* __out___tmp0 = tmp;
+            double* __out___tmp1 = tmp2;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_57)
+            almost_gemm_2(__out_A, __out_B, __out___tmp0, __out___tmp1);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+        double *__tmp2;
+        __tmp2 = new double DACE_ALIGN(64)[(N * N)];
+
+        {
+            double* __in_C = &C[0];
+            double __in_beta = beta;
+            int __istate = __pystate;
+            double* __out_C = C;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_58)
+            scale(__out_C, __in_beta);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < N; __i1 += 1) {
+                    {
+                        double __in1 = tmp[((N * __i0) + __i1)];
+                        double __in2 = tmp2[0];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (_Mult_)
+                        __out = (__in1 * __in2);
+                        ///////////////////
+
+                        __tmp2[((N * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < N; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < N; __i1 += 1) {
+                    {
+                        double __in1 = C[((N * __i0) + __i1)];
+                        double __in2 = __tmp2[((N * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (augassign_59_4)
+                        __out = (__in1 + __in2);
+                        ///////////////////
+
+                        C[((N * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        delete[] __tmp2;
+
+    }
+    delete[] tmp;
+    delete[] tmp2;
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_autocallback_0(callback_autodetect_test_autocallback_0_state_t *__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C, int N, void (*almost_gemm_2)(double const *, double const *, double const *, double const *), double beta, void (*scale)(double const *, double))
+{
+    __program_callback_autodetect_test_autocallback_0_internal(__state, A, B, C, N, almost_gemm_2, beta, scale);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_autocallback_0_repeat(callback_autodetect_test_autocallback_0_state_t *__state, long long __dace_repetitions, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C, int N, void (*almost_gemm_2)(double const *, double const *, double const *, double const *), double beta, void (*scale)(double const *, double))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_autocallback_0_internal(__state, A, B, C, N, almost_gemm_2, beta, scale);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_autocallback_0_state_t *__dace_init_callback_autodetect_test_autocallback_0(int N, void (*almost_gemm_2)(double const *, double const *, double const *, double const *), void (*scale)(double const *, double))
+{
+    int __result = 0;
+    callback_autodetect_test_autocallback_0_state_t *__state = new callback_autodetect_test_autocallback_0_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_autocallback_0(callback_autodetect_test_autocallback_0_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_autocallback_method.dir/root/package/.dacecache/callback_autodetect_test_autocallback_method/src/cpu/callback_autodetect_test_autocallback_method.cpp.o"
+  "CMakeFiles/callback_autodetect_test_autocallback_method.dir/root/package/.dacecache/callback_autodetect_test_autocallback_method/src/cpu/callback_autodetect_test_autocallback_method.cpp.o.d"
+  "libcallback_autodetect_test_autocallback_method.pdb"
+  "libcallback_autodetect_test_autocallback_method.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_autocallback_method.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_autocallback_methodHandle_t;
+extern "C" callback_autodetect_test_autocallback_methodHandle_t __dace_init_callback_autodetect_test_autocallback_method(int N, void (*nd_method)(double const *, double const *));
+extern "C" int __dace_exit_callback_autodetect_test_autocallback_method(callback_autodetect_test_autocallback_methodHandle_t handle);
+extern "C" void __program_callback_autodetect_test_autocallback_method(callback_autodetect_test_autocallback_methodHandle_t handle, double * __restrict__ A, double * __restrict__ __return, int N, void (*nd_method)(double const *, double const *));
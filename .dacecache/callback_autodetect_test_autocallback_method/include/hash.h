@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_autocallback_method "42aaaf83ab40055ef192d2555c8476311ae44244449966f7116761340f44f307"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_autocallback_method.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_autocallback_methodHandle_t handle;
+    int err;
+    int N = 42;
+    void (*nd_method)(double const *, double const *) = 42;
+    double * __restrict__ A = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ __return = (double*) calloc((N * N), sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_autocallback_method(N, nd_method);
+    __program_callback_autodetect_test_autocallback_method(handle, A, __return, N, nd_method);
+    err = __dace_exit_callback_autodetect_test_autocallback_method(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
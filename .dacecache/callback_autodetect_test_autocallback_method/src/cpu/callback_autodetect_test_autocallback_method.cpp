@@ -0,0 +1,65 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_autocallback_method_state_t {
+
+};
+
+void __program_callback_autodetect_test_autocallback_method_internal(callback_autodetect_test_autocallback_method_state_t*__state, double * __restrict__ A, double * __restrict__ __return, int N, void (*nd_method)(double const *, double const *))
+{
+
+    {
+        int __pystate;
+
+        {
+            double* __in_A = &A[0];
+            int __istate = __pystate;
+            double* __out_A = A;
+            double* __out___tmp0 = __return;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_128)
+            nd_method(__out_A, __out___tmp0);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_autocallback_method(callback_autodetect_test_autocallback_method_state_t *__state, double * __restrict__ A, double * __restrict__ __return, int N, void (*nd_method)(double const *, double const *))
+{
+    __program_callback_autodetect_test_autocallback_method_internal(__state, A, __return, N, nd_method);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_autocallback_method_repeat(callback_autodetect_test_autocallback_method_state_t *__state, long long __dace_repetitions, double * __restrict__ A, double * __restrict__ __return, int N, void (*nd_method)(double const *, double const *))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_autocallback_method_internal(__state, A, __return, N, nd_method);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_autocallback_method_state_t *__dace_init_callback_autodetect_test_autocallback_method(int N, void (*nd_method)(double const *, double const *))
+{
+    int __result = 0;
+    callback_autodetect_test_autocallback_method_state_t *__state = new callback_autodetect_test_autocallback_method_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_autocallback_method(callback_autodetect_test_autocallback_method_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
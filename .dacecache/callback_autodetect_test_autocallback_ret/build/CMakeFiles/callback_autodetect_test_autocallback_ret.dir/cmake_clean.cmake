@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_autocallback_ret.dir/root/package/.dacecache/callback_autodetect_test_autocallback_ret/src/cpu/callback_autodetect_test_autocallback_ret.cpp.o"
+  "CMakeFiles/callback_autodetect_test_autocallback_ret.dir/root/package/.dacecache/callback_autodetect_test_autocallback_ret/src/cpu/callback_autodetect_test_autocallback_ret.cpp.o.d"
+  "libcallback_autodetect_test_autocallback_ret.pdb"
+  "libcallback_autodetect_test_autocallback_ret.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_autocallback_ret.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_autocallback_ret_0Handle_t;
+extern "C" callback_autodetect_test_autocallback_ret_0Handle_t __dace_init_callback_autodetect_test_autocallback_ret_0(int N, void (*almost_gemm_2)(double const *, double const *, double const *, double*), void (*scale)(double const *, double));
+extern "C" int __dace_exit_callback_autodetect_test_autocallback_ret_0(callback_autodetect_test_autocallback_ret_0Handle_t handle);
+extern "C" void __program_callback_autodetect_test_autocallback_ret_0(callback_autodetect_test_autocallback_ret_0Handle_t handle, double * __restrict__ A, double * __restrict__ B, double * __restrict__ C, int N, void (*almost_gemm_2)(double const *, double const *, double const *, double*), double beta, void (*scale)(double const *, double));
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_autocallback_ret_0 "0ef2889afc1a91bc7452128123627f5287cf06c23160d6942537506fbc5e69ba"
@@ -0,0 +1,26 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_autocallback_ret_0.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_autocallback_ret_0Handle_t handle;
+    int err;
+    int N = 42;
+    void (*almost_gemm_2)(double const *, double const *, double const *, double*) = 42;
+    double beta = 42;
+    void (*scale)(double const *, double) = 42;
+    double * __restrict__ A = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ C = (double*) calloc((N * N), sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_autocallback_ret_0(N, almost_gemm_2, scale);
+    __program_callback_autodetect_test_autocallback_ret_0(handle, A, B, C, N, almost_gemm_2, beta, scale);
+    err = __dace_exit_callback_autodetect_test_autocallback_ret_0(handle);
+
+    free(A);
+    free(B);
+    free(C);
+
+
+    return err;
+}
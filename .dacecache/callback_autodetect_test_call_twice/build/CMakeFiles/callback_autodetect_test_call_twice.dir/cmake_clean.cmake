@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_call_twice.dir/root/package/.dacecache/callback_autodetect_test_call_twice/src/cpu/callback_autodetect_test_call_twice.cpp.o"
+  "CMakeFiles/callback_autodetect_test_call_twice.dir/root/package/.dacecache/callback_autodetect_test_call_twice/src/cpu/callback_autodetect_test_call_twice.cpp.o.d"
+  "libcallback_autodetect_test_call_twice.pdb"
+  "libcallback_autodetect_test_call_twice.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_call_twice.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_call_twiceHandle_t;
+extern "C" callback_autodetect_test_call_twiceHandle_t __dace_init_callback_autodetect_test_call_twice(void (*call)(double const *));
+extern "C" int __dace_exit_callback_autodetect_test_call_twice(callback_autodetect_test_call_twiceHandle_t handle);
+extern "C" void __program_callback_autodetect_test_call_twice(callback_autodetect_test_call_twiceHandle_t handle, double * __restrict__ arr, void (*call)(double const *), long long scal);
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_call_twice "fc8deef260059804d50ef55a528f8066df30b021e55b5d39a268218b0b4009f5"
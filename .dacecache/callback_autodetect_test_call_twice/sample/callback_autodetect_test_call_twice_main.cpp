@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_call_twice.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_call_twiceHandle_t handle;
+    int err;
+    void (*call)(double const *) = 42;
+    long long scal = 42;
+    double * __restrict__ arr = (double*) calloc(12, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_call_twice(call);
+    __program_callback_autodetect_test_call_twice(handle, arr, call, scal);
+    err = __dace_exit_callback_autodetect_test_call_twice(handle);
+
+    free(arr);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_call_twice_2.dir/root/package/.dacecache/callback_autodetect_test_call_twice_2/src/cpu/callback_autodetect_test_call_twice_2.cpp.o"
+  "CMakeFiles/callback_autodetect_test_call_twice_2.dir/root/package/.dacecache/callback_autodetect_test_call_twice_2/src/cpu/callback_autodetect_test_call_twice_2.cpp.o.d"
+  "libcallback_autodetect_test_call_twice_2.pdb"
+  "libcallback_autodetect_test_call_twice_2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_call_twice_2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
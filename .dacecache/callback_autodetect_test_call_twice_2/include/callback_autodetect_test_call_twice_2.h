@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_call_twice_2Handle_t;
+extern "C" callback_autodetect_test_call_twice_2Handle_t __dace_init_callback_autodetect_test_call_twice_2(void (*call)(), void (*call_0)(double const *));
+extern "C" int __dace_exit_callback_autodetect_test_call_twice_2(callback_autodetect_test_call_twice_2Handle_t handle);
+extern "C" void __program_callback_autodetect_test_call_twice_2(callback_autodetect_test_call_twice_2Handle_t handle, double * __restrict__ arr, void (*call)(), void (*call_0)(double const *), long long scal);
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_call_twice_2 "4d976dec0dbbf7e6fdc8a3bb064d236372503983180d2528977eda47ce6e1454"
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_call_twice_2.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_call_twice_2Handle_t handle;
+    int err;
+    void (*call)() = 42;
+    void (*call_0)(double const *) = 42;
+    long long scal = 42;
+    double * __restrict__ arr = (double*) calloc(12, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_call_twice_2(call, call_0);
+    __program_callback_autodetect_test_call_twice_2(handle, arr, call, call_0, scal);
+    err = __dace_exit_callback_autodetect_test_call_twice_2(handle);
+
+    free(arr);
+
+
+    return err;
+}
@@ -0,0 +1,98 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_call_twice_2_state_t {
+
+};
+
+void __program_callback_autodetect_test_call_twice_2_internal(callback_autodetect_test_call_twice_2_state_t*__state, double * __restrict__ arr, void (*call)(), void (*call_0)(double const *), long long scal)
+{
+
+    {
+        int __pystate;
+        double *__tmp0;
+        __tmp0 = new double DACE_ALIGN(64)[12];
+
+        {
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_476)
+            call();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 12; __i0 += 1) {
+                {
+                    double __in1 = arr[__i0];
+                    long long __in2 = scal;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * dace::float64(__in2));
+                    ///////////////////
+
+                    __tmp0[__i0] = __out;
+                }
+            }
+        }
+
+        dace::CopyND<double, 1, false, 12>::template ConstDst<1>::Copy(
+        __tmp0, arr, 1);
+        {
+            double* __in_arr = &arr[0];
+            int __istate = __pystate;
+            double* __out_arr = arr;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_478)
+            call_0(__out_arr);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        delete[] __tmp0;
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_call_twice_2(callback_autodetect_test_call_twice_2_state_t *__state, double * __restrict__ arr, void (*call)(), void (*call_0)(double const *), long long scal)
+{
+    __program_callback_autodetect_test_call_twice_2_internal(__state, arr, call, call_0, scal);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_call_twice_2_repeat(callback_autodetect_test_call_twice_2_state_t *__state, long long __dace_repetitions, double * __restrict__ arr, void (*call)(), void (*call_0)(double const *), long long scal)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_call_twice_2_internal(__state, arr, call, call_0, scal);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_call_twice_2_state_t *__dace_init_callback_autodetect_test_call_twice_2(void (*call)(), void (*call_0)(double const *))
+{
+    int __result = 0;
+    callback_autodetect_test_call_twice_2_state_t *__state = new callback_autodetect_test_call_twice_2_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_call_twice_2(callback_autodetect_test_call_twice_2_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
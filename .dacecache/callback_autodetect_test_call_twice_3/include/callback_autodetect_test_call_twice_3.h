@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_call_twice_3Handle_t;
+extern "C" callback_autodetect_test_call_twice_3Handle_t __dace_init_callback_autodetect_test_call_twice_3(void (*call)(double const *), void (*call_0)(int const *));
+extern "C" int __dace_exit_callback_autodetect_test_call_twice_3(callback_autodetect_test_call_twice_3Handle_t handle);
+extern "C" void __program_callback_autodetect_test_call_twice_3(callback_autodetect_test_call_twice_3Handle_t handle, double * __restrict__ arr, int * __restrict__ arr2, void (*call)(double const *), void (*call_0)(int const *));
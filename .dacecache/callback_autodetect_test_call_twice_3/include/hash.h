@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_call_twice_3 "52ba316b7f2163b79b66c3de8203dda82af16510c84c2918b5b659d09b8853a1"
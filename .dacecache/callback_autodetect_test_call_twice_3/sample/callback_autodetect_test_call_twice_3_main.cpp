@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_call_twice_3.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_call_twice_3Handle_t handle;
+    int err;
+    void (*call)(double const *) = 42;
+    void (*call_0)(int const *) = 42;
+    double * __restrict__ arr = (double*) calloc(20, sizeof(double));
+    int * __restrict__ arr2 = (int*) calloc(400, sizeof(int));
+
+
+    handle = __dace_init_callback_autodetect_test_call_twice_3(call, call_0);
+    __program_callback_autodetect_test_call_twice_3(handle, arr, arr2, call, call_0);
+    err = __dace_exit_callback_autodetect_test_call_twice_3(handle);
+
+    free(arr);
+    free(arr2);
+
+
+    return err;
+}
@@ -0,0 +1,98 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_call_twice_3_state_t {
+
+};
+
+void __program_callback_autodetect_test_call_twice_3_internal(callback_autodetect_test_call_twice_3_state_t*__state, double * __restrict__ arr, int * __restrict__ arr2, void (*call)(double const *), void (*call_0)(int const *))
+{
+    int __pystate;
+
+    {
+
+        {
+            double* __in_arr = &arr[0];
+            int __istate = __pystate;
+            double* __out_arr = arr;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_501)
+            call(__out_arr);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                {
+                    double __in1 = arr[__i0];
+                    int __in2 = arr2[(__i0 + 20)];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (augassign_502_4)
+                    __out = (__in1 * __in2);
+                    ///////////////////
+
+                    arr[__i0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            int* __in_arr2 = &arr2[0];
+            int __istate = __pystate;
+            int* __out_arr2 = arr2;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_503)
+            call_0(__out_arr2);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_call_twice_3(callback_autodetect_test_call_twice_3_state_t *__state, double * __restrict__ arr, int * __restrict__ arr2, void (*call)(double const *), void (*call_0)(int const *))
+{
+    __program_callback_autodetect_test_call_twice_3_internal(__state, arr, arr2, call, call_0);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_call_twice_3_repeat(callback_autodetect_test_call_twice_3_state_t *__state, long long __dace_repetitions, double * __restrict__ arr, int * __restrict__ arr2, void (*call)(double const *), void (*call_0)(int const *))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_call_twice_3_internal(__state, arr, arr2, call, call_0);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_call_twice_3_state_t *__dace_init_callback_autodetect_test_call_twice_3(void (*call)(double const *), void (*call_0)(int const *))
+{
+    int __result = 0;
+    callback_autodetect_test_call_twice_3_state_t *__state = new callback_autodetect_test_call_twice_3_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_call_twice_3(callback_autodetect_test_call_twice_3_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_calladd.dir/root/package/.dacecache/callback_autodetect_test_calladd/src/cpu/callback_autodetect_test_calladd.cpp.o"
+  "CMakeFiles/callback_autodetect_test_calladd.dir/root/package/.dacecache/callback_autodetect_test_calladd/src/cpu/callback_autodetect_test_calladd.cpp.o.d"
+  "libcallback_autodetect_test_calladd.pdb"
+  "libcallback_autodetect_test_calladd.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_calladd.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
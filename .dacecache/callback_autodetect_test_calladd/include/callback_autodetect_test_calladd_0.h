@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_calladd_0Handle_t;
+extern "C" callback_autodetect_test_calladd_0Handle_t __dace_init_callback_autodetect_test_calladd_0(void (*add)(double const *, double const *, double const *));
+extern "C" int __dace_exit_callback_autodetect_test_calladd_0(callback_autodetect_test_calladd_0Handle_t handle);
+extern "C" void __program_callback_autodetect_test_calladd_0(callback_autodetect_test_calladd_0Handle_t handle, double * __restrict__ A, void (*add)(double const *, double const *, double const *));
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_calladd_0 "b87f42c0d4e2272b70a80ffdd4e4847de64fe7eecebc97ee803309c05987fca1"
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_calladd_0.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_calladd_0Handle_t handle;
+    int err;
+    void (*add)(double const *, double const *, double const *) = 42;
+    double * __restrict__ A = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_calladd_0(add);
+    __program_callback_autodetect_test_calladd_0(handle, A, add);
+    err = __dace_exit_callback_autodetect_test_calladd_0(handle);
+
+    free(A);
+
+
+    return err;
+}
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_calladd.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_calladdHandle_t handle;
+    int err;
+    void (*add)(double const *, double const *, double const *) = 42;
+    double * __restrict__ A = (double*) calloc(20, sizeof(double));
+    double * __restrict__ B = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_calladd(add);
+    __program_callback_autodetect_test_calladd(handle, A, B, add);
+    err = __dace_exit_callback_autodetect_test_calladd(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
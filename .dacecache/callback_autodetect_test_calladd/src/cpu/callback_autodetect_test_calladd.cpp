@@ -0,0 +1,65 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_calladd_state_t {
+
+};
+
+void __program_callback_autodetect_test_calladd_internal(callback_autodetect_test_calladd_state_t*__state, double * __restrict__ A, double * __restrict__ B, void (*add)(double const *, double const *, double const *))
+{
+
+    {
+        int __pystate;
+
+        {
+            double* __in_A = &A[0];
+            int __istate = __pystate;
+            double* __out_A = A;
+            int __ostate;
+            double* __out___tmp0 = B;
+
+            ///////////////////
+            // Tasklet code (callback_400)
+            add(__out_A, __out_A, __out___tmp0);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_calladd(callback_autodetect_test_calladd_state_t *__state, double * __restrict__ A, double * __restrict__ B, void (*add)(double const *, double const *, double const *))
+{
+    __program_callback_autodetect_test_calladd_internal(__state, A, B, add);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_calladd_repeat(callback_autodetect_test_calladd_state_t *__state, long long __dace_repetitions, double * __restrict__ A, double * __restrict__ B, void (*add)(double const *, double const *, double const *))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_calladd_internal(__state, A, B, add);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_calladd_state_t *__dace_init_callback_autodetect_test_calladd(void (*add)(double const *, double const *, double const *))
+{
+    int __result = 0;
+    callback_autodetect_test_calladd_state_t *__state = new callback_autodetect_test_calladd_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_calladd(callback_autodetect_test_calladd_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
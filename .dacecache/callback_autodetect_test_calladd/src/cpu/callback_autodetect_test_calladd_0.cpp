@@ -0,0 +1,75 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_calladd_0_state_t {
+
+};
+
+void __program_callback_autodetect_test_calladd_0_internal(callback_autodetect_test_calladd_0_state_t*__state, double * __restrict__ A, void (*add)(double const *, double const *, double const *))
+{
+    double *__tmp0;
+    __tmp0 = new double DACE_ALIGN(64)[20];
+
+    {
+        int __pystate;
+
+        {
+            double* __in_A = &A[0];
+            int __istate = __pystate;
+            double* __out_A = A;
+            double* __out___tmp0 = __tmp0;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_416)
+            add(__out_A, __out_A, __out___tmp0);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+
+        dace::CopyND<double, 1, false, 20>::template ConstDst<1>::Copy(
+        __tmp0, A, 1);
+
+    }
+    delete[] __tmp0;
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_calladd_0(callback_autodetect_test_calladd_0_state_t *__state, double * __restrict__ A, void (*add)(double const *, double const *, double const *))
+{
+    __program_callback_autodetect_test_calladd_0_internal(__state, A, add);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_calladd_0_repeat(callback_autodetect_test_calladd_0_state_t *__state, long long __dace_repetitions, double * __restrict__ A, void (*add)(double const *, double const *, double const *))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_calladd_0_internal(__state, A, add);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_calladd_0_state_t *__dace_init_callback_autodetect_test_calladd_0(void (*add)(double const *, double const *, double const *))
+{
+    int __result = 0;
+    callback_autodetect_test_calladd_0_state_t *__state = new callback_autodetect_test_calladd_0_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_calladd_0(callback_autodetect_test_calladd_0_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_caller.dir/root/package/.dacecache/callback_autodetect_test_caller/src/cpu/callback_autodetect_test_caller.cpp.o"
+  "CMakeFiles/callback_autodetect_test_caller.dir/root/package/.dacecache/callback_autodetect_test_caller/src/cpu/callback_autodetect_test_caller.cpp.o.d"
+  "libcallback_autodetect_test_caller.pdb"
+  "libcallback_autodetect_test_caller.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_caller.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_callback_autodetect_test_caller_1.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_callback_autodetect_test_caller_1.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_callback_autodetect_test_caller_1.pdb"
+  "libdacestub_callback_autodetect_test_caller_1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_callback_autodetect_test_caller_1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
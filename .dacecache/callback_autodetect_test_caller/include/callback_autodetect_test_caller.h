@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_callerHandle_t;
+extern "C" callback_autodetect_test_callerHandle_t __dace_init_callback_autodetect_test_caller(void (*callback)(double const *, double const *, double const *));
+extern "C" int __dace_exit_callback_autodetect_test_caller(callback_autodetect_test_callerHandle_t handle);
+extern "C" void __program_callback_autodetect_test_caller(callback_autodetect_test_callerHandle_t handle, double * __restrict__ a, double * __restrict__ b, void (*callback)(double const *, double const *, double const *));
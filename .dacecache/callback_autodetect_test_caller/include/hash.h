@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_caller_1 "ea4e1e3b0bc50320687ebc914a7221c9cdc5a5aff4f9bce7b4933c91573c43a3"
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_caller_2.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_caller_2Handle_t handle;
+    int err;
+    void (*callback)(double const *, double const *, double const *, double const *, double const *, double const *) = 42;
+    double * __restrict__ a = (double*) calloc(8, sizeof(double));
+    double * __restrict__ b = (double*) calloc(8, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_caller_2(callback);
+    __program_callback_autodetect_test_caller_2(handle, a, b, callback);
+    err = __dace_exit_callback_autodetect_test_caller_2(handle);
+
+    free(a);
+    free(b);
+
+
+    return err;
+}
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_caller.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_callerHandle_t handle;
+    int err;
+    void (*callback)(double const *, double const *, double const *) = 42;
+    double * __restrict__ a = (double*) calloc(8, sizeof(double));
+    double * __restrict__ b = (double*) calloc(8, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_caller(callback);
+    __program_callback_autodetect_test_caller(handle, a, b, callback);
+    err = __dace_exit_callback_autodetect_test_caller(handle);
+
+    free(a);
+    free(b);
+
+
+    return err;
+}
@@ -0,0 +1,66 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_caller_2_state_t {
+
+};
+
+void __program_callback_autodetect_test_caller_2_internal(callback_autodetect_test_caller_2_state_t*__state, double * __restrict__ a, double * __restrict__ b, void (*callback)(double const *, double const *, double const *, double const *, double const *, double const *))
+{
+
+    {
+        int __pystate;
+
+        {
+            double* __in_a = &a[0];
+            double* __in_b = &b[0];
+            int __istate = __pystate;
+            double* __out_a = a;
+            double* __out_b = b;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_695)
+            callback(__out_a, __out_b, __out_a, __out_b, __out_b, __out_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_caller_2(callback_autodetect_test_caller_2_state_t *__state, double * __restrict__ a, double * __restrict__ b, void (*callback)(double const *, double const *, double const *, double const *, double const *, double const *))
+{
+    __program_callback_autodetect_test_caller_2_internal(__state, a, b, callback);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_caller_2_repeat(callback_autodetect_test_caller_2_state_t *__state, long long __dace_repetitions, double * __restrict__ a, double * __restrict__ b, void (*callback)(double const *, double const *, double const *, double const *, double const *, double const *))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_caller_2_internal(__state, a, b, callback);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_caller_2_state_t *__dace_init_callback_autodetect_test_caller_2(void (*callback)(double const *, double const *, double const *, double const *, double const *, double const *))
+{
+    int __result = 0;
+    callback_autodetect_test_caller_2_state_t *__state = new callback_autodetect_test_caller_2_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_caller_2(callback_autodetect_test_caller_2_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
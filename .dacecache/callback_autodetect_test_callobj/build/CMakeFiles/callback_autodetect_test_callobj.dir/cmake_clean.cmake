@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_callobj.dir/root/package/.dacecache/callback_autodetect_test_callobj/src/cpu/callback_autodetect_test_callobj.cpp.o"
+  "CMakeFiles/callback_autodetect_test_callobj.dir/root/package/.dacecache/callback_autodetect_test_callobj/src/cpu/callback_autodetect_test_callobj.cpp.o.d"
+  "libcallback_autodetect_test_callobj.pdb"
+  "libcallback_autodetect_test_callobj.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_callobj.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
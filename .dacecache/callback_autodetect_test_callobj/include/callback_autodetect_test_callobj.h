@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_callobjHandle_t;
+extern "C" callback_autodetect_test_callobjHandle_t __dace_init_callback_autodetect_test_callobj(void (*obj)(double const *, double const *));
+extern "C" int __dace_exit_callback_autodetect_test_callobj(callback_autodetect_test_callobjHandle_t handle);
+extern "C" void __program_callback_autodetect_test_callobj(callback_autodetect_test_callobjHandle_t handle, double * __restrict__ a, double * __restrict__ b, void (*obj)(double const *, double const *));
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_callobj "d3f1cb2e86be8738b1aac4f0aedc1c59c1974bffb1d076286b4d8dae32d70a6f"
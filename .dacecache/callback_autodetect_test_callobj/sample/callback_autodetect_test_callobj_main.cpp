@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_callobj.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_callobjHandle_t handle;
+    int err;
+    void (*obj)(double const *, double const *) = 42;
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+    double * __restrict__ b = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_callobj(obj);
+    __program_callback_autodetect_test_callobj(handle, a, b, obj);
+    err = __dace_exit_callback_autodetect_test_callobj(handle);
+
+    free(a);
+    free(b);
+
+
+    return err;
+}
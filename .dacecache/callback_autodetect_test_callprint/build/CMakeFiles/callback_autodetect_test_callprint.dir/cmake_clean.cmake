@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_callprint.dir/root/package/.dacecache/callback_autodetect_test_callprint/src/cpu/callback_autodetect_test_callprint.cpp.o"
+  "CMakeFiles/callback_autodetect_test_callprint.dir/root/package/.dacecache/callback_autodetect_test_callprint/src/cpu/callback_autodetect_test_callprint.cpp.o.d"
+  "libcallback_autodetect_test_callprint.pdb"
+  "libcallback_autodetect_test_callprint.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_callprint.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
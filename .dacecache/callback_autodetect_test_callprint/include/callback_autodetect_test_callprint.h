@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_callprintHandle_t;
+extern "C" callback_autodetect_test_callprintHandle_t __dace_init_callback_autodetect_test_callprint(void (*print)());
+extern "C" int __dace_exit_callback_autodetect_test_callprint(callback_autodetect_test_callprintHandle_t handle);
+extern "C" void __program_callback_autodetect_test_callprint(callback_autodetect_test_callprintHandle_t handle, void (*print)());
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_callprint "806aca2c780935a5b5d236880cd6239c762d593594ee2b42f9e9fd0802eaec3f"
@@ -0,0 +1,17 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_callprint.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_callprintHandle_t handle;
+    int err;
+    void (*print)() = 42;
+
+
+    handle = __dace_init_callback_autodetect_test_callprint(print);
+    __program_callback_autodetect_test_callprint(handle, print);
+    err = __dace_exit_callback_autodetect_test_callprint(handle);
+
+
+
+    return err;
+}
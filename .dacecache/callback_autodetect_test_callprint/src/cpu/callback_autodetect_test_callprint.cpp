@@ -0,0 +1,62 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_callprint_state_t {
+
+};
+
+void __program_callback_autodetect_test_callprint_internal(callback_autodetect_test_callprint_state_t*__state, void (*print)())
+{
+
+    {
+        int __pystate;
+
+        {
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_647)
+            print();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_callprint(callback_autodetect_test_callprint_state_t *__state, void (*print)())
+{
+    __program_callback_autodetect_test_callprint_internal(__state, print);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_callprint_repeat(callback_autodetect_test_callprint_state_t *__state, long long __dace_repetitions, void (*print)())
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_callprint_internal(__state, print);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_callprint_state_t *__dace_init_callback_autodetect_test_callprint(void (*print)())
+{
+    int __result = 0;
+    callback_autodetect_test_callprint_state_t *__state = new callback_autodetect_test_callprint_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_callprint(callback_autodetect_test_callprint_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_do_not_reorder.dir/root/package/.dacecache/callback_autodetect_test_do_not_reorder/src/cpu/callback_autodetect_test_do_not_reorder.cpp.o"
+  "CMakeFiles/callback_autodetect_test_do_not_reorder.dir/root/package/.dacecache/callback_autodetect_test_do_not_reorder/src/cpu/callback_autodetect_test_do_not_reorder.cpp.o.d"
+  "libcallback_autodetect_test_do_not_reorder.pdb"
+  "libcallback_autodetect_test_do_not_reorder.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_do_not_reorder.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_do_not_reorder "a7ab80108a265abb2a5cfb1d2cd0ecee796f69f1687a2fafcf696fb25deed608"
@@ -0,0 +1,73 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_do_not_reorder_state_t {
+
+};
+
+void __program_callback_autodetect_test_do_not_reorder_internal(callback_autodetect_test_do_not_reorder_state_t*__state, void (*a)(), void (*b)())
+{
+
+    {
+        int __pystate;
+
+        {
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_224)
+            b();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_225)
+            a();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_do_not_reorder(callback_autodetect_test_do_not_reorder_state_t *__state, void (*a)(), void (*b)())
+{
+    __program_callback_autodetect_test_do_not_reorder_internal(__state, a, b);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_do_not_reorder_repeat(callback_autodetect_test_do_not_reorder_state_t *__state, long long __dace_repetitions, void (*a)(), void (*b)())
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_do_not_reorder_internal(__state, a, b);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_do_not_reorder_state_t *__dace_init_callback_autodetect_test_do_not_reorder(void (*a)(), void (*b)())
+{
+    int __result = 0;
+    callback_autodetect_test_do_not_reorder_state_t *__state = new callback_autodetect_test_do_not_reorder_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_do_not_reorder(callback_autodetect_test_do_not_reorder_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_callback_autodetect_test_do_not_reorder_nested.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_callback_autodetect_test_do_not_reorder_nested.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_callback_autodetect_test_do_not_reorder_nested.pdb"
+  "libdacestub_callback_autodetect_test_do_not_reorder_nested.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_callback_autodetect_test_do_not_reorder_nested.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
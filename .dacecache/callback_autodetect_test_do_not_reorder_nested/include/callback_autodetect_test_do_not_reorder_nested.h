@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_do_not_reorder_nestedHandle_t;
+extern "C" callback_autodetect_test_do_not_reorder_nestedHandle_t __dace_init_callback_autodetect_test_do_not_reorder_nested(void (*a)(), void (*b)());
+extern "C" int __dace_exit_callback_autodetect_test_do_not_reorder_nested(callback_autodetect_test_do_not_reorder_nestedHandle_t handle);
+extern "C" void __program_callback_autodetect_test_do_not_reorder_nested(callback_autodetect_test_do_not_reorder_nestedHandle_t handle, void (*a)(), void (*b)());
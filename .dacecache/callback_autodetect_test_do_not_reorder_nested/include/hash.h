@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_do_not_reorder_nested "1dcedc100a9ede63859093fbee8f2e8a0097abb44872063a27314ed905bd0220"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_do_not_reorder_nested.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_do_not_reorder_nestedHandle_t handle;
+    int err;
+    void (*a)() = 42;
+    void (*b)() = 42;
+
+
+    handle = __dace_init_callback_autodetect_test_do_not_reorder_nested(a, b);
+    __program_callback_autodetect_test_do_not_reorder_nested(handle, a, b);
+    err = __dace_exit_callback_autodetect_test_do_not_reorder_nested(handle);
+
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_modcallback.dir/root/package/.dacecache/callback_autodetect_test_modcallback/src/cpu/callback_autodetect_test_modcallback.cpp.o"
+  "CMakeFiles/callback_autodetect_test_modcallback.dir/root/package/.dacecache/callback_autodetect_test_modcallback/src/cpu/callback_autodetect_test_modcallback.cpp.o.d"
+  "libcallback_autodetect_test_modcallback.pdb"
+  "libcallback_autodetect_test_modcallback.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_modcallback.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_modcallbackHandle_t;
+extern "C" callback_autodetect_test_modcallbackHandle_t __dace_init_callback_autodetect_test_modcallback(int N, void (*numpy_median)(double const *, double const *));
+extern "C" int __dace_exit_callback_autodetect_test_modcallback(callback_autodetect_test_modcallbackHandle_t handle);
+extern "C" void __program_callback_autodetect_test_modcallback(callback_autodetect_test_modcallbackHandle_t handle, double * __restrict__ A, double * __restrict__ B, int N, void (*numpy_median)(double const *, double const *));
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_modcallback "2cc254294cc5b0b11db7d497f76e7c8aa476e6f2955405ebf85444e2cd97cf20"
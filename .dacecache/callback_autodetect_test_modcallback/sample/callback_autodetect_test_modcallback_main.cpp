@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_modcallback.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_modcallbackHandle_t handle;
+    int err;
+    int N = 42;
+    void (*numpy_median)(double const *, double const *) = 42;
+    double * __restrict__ A = (double*) calloc((N * N), sizeof(double));
+    double * __restrict__ B = (double*) calloc(N, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_modcallback(N, numpy_median);
+    __program_callback_autodetect_test_modcallback(handle, A, B, N, numpy_median);
+    err = __dace_exit_callback_autodetect_test_modcallback(handle);
+
+    free(A);
+    free(B);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_myprogram.dir/root/package/.dacecache/callback_autodetect_test_myprogram/src/cpu/callback_autodetect_test_myprogram.cpp.o"
+  "CMakeFiles/callback_autodetect_test_myprogram.dir/root/package/.dacecache/callback_autodetect_test_myprogram/src/cpu/callback_autodetect_test_myprogram.cpp.o.d"
+  "libcallback_autodetect_test_myprogram.pdb"
+  "libcallback_autodetect_test_myprogram.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_myprogram.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_myprogramHandle_t;
+extern "C" callback_autodetect_test_myprogramHandle_t __dace_init_callback_autodetect_test_myprogram(void (*callback)(double const *), void (*callback_0)(double const *, double const *));
+extern "C" int __dace_exit_callback_autodetect_test_myprogram(callback_autodetect_test_myprogramHandle_t handle);
+extern "C" void __program_callback_autodetect_test_myprogram(callback_autodetect_test_myprogramHandle_t handle, double * __restrict__ a, void (*callback)(double const *), void (*callback_0)(double const *, double const *));
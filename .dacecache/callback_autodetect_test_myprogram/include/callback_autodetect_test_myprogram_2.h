@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_myprogram_2Handle_t;
+extern "C" callback_autodetect_test_myprogram_2Handle_t __dace_init_callback_autodetect_test_myprogram_2(void (*mycb)(), void (*mycb_0)());
+extern "C" int __dace_exit_callback_autodetect_test_myprogram_2(callback_autodetect_test_myprogram_2Handle_t handle);
+extern "C" void __program_callback_autodetect_test_myprogram_2(callback_autodetect_test_myprogram_2Handle_t handle, void (*mycb)(), void (*mycb_0)());
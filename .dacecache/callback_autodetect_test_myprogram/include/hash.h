@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_myprogram_1 "c3931b4cbeb9f1a972a4921e1ce01cd2792b96f5947a236c8c44debe9a96ed9b"
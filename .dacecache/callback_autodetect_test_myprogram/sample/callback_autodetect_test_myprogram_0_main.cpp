@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_myprogram_0.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_myprogram_0Handle_t handle;
+    int err;
+    double (*time_time)() = 42;
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_myprogram_0(time_time);
+    __program_callback_autodetect_test_myprogram_0(handle, a, time_time);
+    err = __dace_exit_callback_autodetect_test_myprogram_0(handle);
+
+    free(a);
+
+
+    return err;
+}
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_myprogram_1.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_myprogram_1Handle_t handle;
+    int err;
+    void (*mycb)() = 42;
+    void (*mycb_0)() = 42;
+
+
+    handle = __dace_init_callback_autodetect_test_myprogram_1(mycb, mycb_0);
+    __program_callback_autodetect_test_myprogram_1(handle, mycb, mycb_0);
+    err = __dace_exit_callback_autodetect_test_myprogram_1(handle);
+
+
+
+    return err;
+}
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_myprogram.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_myprogramHandle_t handle;
+    int err;
+    void (*callback)(double const *) = 42;
+    void (*callback_0)(double const *, double const *) = 42;
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_myprogram(callback, callback_0);
+    __program_callback_autodetect_test_myprogram(handle, a, callback, callback_0);
+    err = __dace_exit_callback_autodetect_test_myprogram(handle);
+
+    free(a);
+
+
+    return err;
+}
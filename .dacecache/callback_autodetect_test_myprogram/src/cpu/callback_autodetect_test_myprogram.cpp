@@ -0,0 +1,104 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_myprogram_state_t {
+
+};
+
+void __program_callback_autodetect_test_myprogram_internal(callback_autodetect_test_myprogram_state_t*__state, double * __restrict__ a, void (*callback)(double const *), void (*callback_0)(double const *, double const *))
+{
+    int __pystate;
+    long long i;
+
+    {
+
+        {
+            int __istate = __pystate;
+            double __in_a_0 = a[0];
+            int __ostate;
+            double* __out_a_0 = a;
+
+            ///////////////////
+            // Tasklet code (callback_545)
+            callback(__out_a_0);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+
+
+    for (i = 0; (i < 20); i = (i + 1)) {
+        {
+
+            {
+                double __in1 = a[i];
+                double __out;
+
+                ///////////////////
+                // Tasklet code (augassign_547_8)
+                __out = (__in1 + i);
+                ///////////////////
+
+                a[i] = __out;
+            }
+
+        }
+
+    }
+    {
+
+        {
+            int __istate = __pystate;
+            double __in_a_1 = a[0];
+            double __in_a_2 = a[1];
+            int __ostate;
+            double* __out_a_1 = a;
+            double* __out_a_2 = a + 1;
+
+            ///////////////////
+            // Tasklet code (callback_548)
+            callback_0(__out_a_1, __out_a_2);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_myprogram(callback_autodetect_test_myprogram_state_t *__state, double * __restrict__ a, void (*callback)(double const *), void (*callback_0)(double const *, double const *))
+{
+    __program_callback_autodetect_test_myprogram_internal(__state, a, callback, callback_0);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_myprogram_repeat(callback_autodetect_test_myprogram_state_t *__state, long long __dace_repetitions, double * __restrict__ a, void (*callback)(double const *), void (*callback_0)(double const *, double const *))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_myprogram_internal(__state, a, callback, callback_0);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_myprogram_state_t *__dace_init_callback_autodetect_test_myprogram(void (*callback)(double const *), void (*callback_0)(double const *, double const *))
+{
+    int __result = 0;
+    callback_autodetect_test_myprogram_state_t *__state = new callback_autodetect_test_myprogram_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_myprogram(callback_autodetect_test_myprogram_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
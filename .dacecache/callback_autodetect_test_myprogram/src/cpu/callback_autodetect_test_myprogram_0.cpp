@@ -0,0 +1,75 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_myprogram_0_state_t {
+
+};
+
+void __program_callback_autodetect_test_myprogram_0_internal(callback_autodetect_test_myprogram_0_state_t*__state, double * __restrict__ a, double (*time_time)())
+{
+
+    {
+        int __pystate;
+        double res;
+
+        {
+            int __istate = __pystate;
+            double* __out___tmp0 = &res;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_574)
+            __out___tmp0[0] = time_time();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            double __inp = res;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_575_4)
+            __out = __inp;
+            ///////////////////
+
+            a[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_myprogram_0(callback_autodetect_test_myprogram_0_state_t *__state, double * __restrict__ a, double (*time_time)())
+{
+    __program_callback_autodetect_test_myprogram_0_internal(__state, a, time_time);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_myprogram_0_repeat(callback_autodetect_test_myprogram_0_state_t *__state, long long __dace_repetitions, double * __restrict__ a, double (*time_time)())
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_myprogram_0_internal(__state, a, time_time);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_myprogram_0_state_t *__dace_init_callback_autodetect_test_myprogram_0(double (*time_time)())
+{
+    int __result = 0;
+    callback_autodetect_test_myprogram_0_state_t *__state = new callback_autodetect_test_myprogram_0_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_myprogram_0(callback_autodetect_test_myprogram_0_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,73 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_myprogram_1_state_t {
+
+};
+
+void __program_callback_autodetect_test_myprogram_1_internal(callback_autodetect_test_myprogram_1_state_t*__state, void (*mycb)(), void (*mycb_0)())
+{
+
+    {
+        int __pystate;
+
+        {
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_634)
+            mycb();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_635)
+            mycb_0();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_myprogram_1(callback_autodetect_test_myprogram_1_state_t *__state, void (*mycb)(), void (*mycb_0)())
+{
+    __program_callback_autodetect_test_myprogram_1_internal(__state, mycb, mycb_0);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_myprogram_1_repeat(callback_autodetect_test_myprogram_1_state_t *__state, long long __dace_repetitions, void (*mycb)(), void (*mycb_0)())
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_myprogram_1_internal(__state, mycb, mycb_0);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_myprogram_1_state_t *__dace_init_callback_autodetect_test_myprogram_1(void (*mycb)(), void (*mycb_0)())
+{
+    int __result = 0;
+    callback_autodetect_test_myprogram_1_state_t *__state = new callback_autodetect_test_myprogram_1_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_myprogram_1(callback_autodetect_test_myprogram_1_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
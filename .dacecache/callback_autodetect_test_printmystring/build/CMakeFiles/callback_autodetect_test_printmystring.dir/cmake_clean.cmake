@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_printmystring.dir/root/package/.dacecache/callback_autodetect_test_printmystring/src/cpu/callback_autodetect_test_printmystring.cpp.o"
+  "CMakeFiles/callback_autodetect_test_printmystring.dir/root/package/.dacecache/callback_autodetect_test_printmystring/src/cpu/callback_autodetect_test_printmystring.cpp.o.d"
+  "libcallback_autodetect_test_printmystring.pdb"
+  "libcallback_autodetect_test_printmystring.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_printmystring.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_printmystringHandle_t;
+extern "C" callback_autodetect_test_printmystringHandle_t __dace_init_callback_autodetect_test_printmystring(void (*cb)(char*));
+extern "C" int __dace_exit_callback_autodetect_test_printmystring(callback_autodetect_test_printmystringHandle_t handle);
+extern "C" void __program_callback_autodetect_test_printmystring(callback_autodetect_test_printmystringHandle_t handle, char* a, void (*cb)(char*));
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_printmystring "c8b4f0a0f5e31a141680dc5609beeb69b0f1bbf3619c3d5bde4e373d0bbfaea0"
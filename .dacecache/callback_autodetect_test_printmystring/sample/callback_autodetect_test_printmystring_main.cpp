@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_printmystring.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_printmystringHandle_t handle;
+    int err;
+    char* a = 42;
+    void (*cb)(char*) = 42;
+
+
+    handle = __dace_init_callback_autodetect_test_printmystring(cb);
+    __program_callback_autodetect_test_printmystring(handle, a, cb);
+    err = __dace_exit_callback_autodetect_test_printmystring(handle);
+
+
+
+    return err;
+}
@@ -0,0 +1,63 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_printmystring_state_t {
+
+};
+
+void __program_callback_autodetect_test_printmystring_internal(callback_autodetect_test_printmystring_state_t*__state, char* a, void (*cb)(char*))
+{
+
+    {
+        int __pystate;
+
+        {
+            char* __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_763)
+            cb(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_printmystring(callback_autodetect_test_printmystring_state_t *__state, char* a, void (*cb)(char*))
+{
+    __program_callback_autodetect_test_printmystring_internal(__state, a, cb);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_printmystring_repeat(callback_autodetect_test_printmystring_state_t *__state, long long __dace_repetitions, char* a, void (*cb)(char*))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_printmystring_internal(__state, a, cb);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_printmystring_state_t *__dace_init_callback_autodetect_test_printmystring(void (*cb)(char*))
+{
+    int __result = 0;
+    callback_autodetect_test_printmystring_state_t *__state = new callback_autodetect_test_printmystring_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_printmystring(callback_autodetect_test_printmystring_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_printprog.dir/root/package/.dacecache/callback_autodetect_test_printprog/src/cpu/callback_autodetect_test_printprog.cpp.o"
+  "CMakeFiles/callback_autodetect_test_printprog.dir/root/package/.dacecache/callback_autodetect_test_printprog/src/cpu/callback_autodetect_test_printprog.cpp.o.d"
+  "libcallback_autodetect_test_printprog.pdb"
+  "libcallback_autodetect_test_printprog.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_printprog.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
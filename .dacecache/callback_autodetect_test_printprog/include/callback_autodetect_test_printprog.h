@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_printprogHandle_t;
+extern "C" callback_autodetect_test_printprogHandle_t __dace_init_callback_autodetect_test_printprog(void (*print)(double const *));
+extern "C" int __dace_exit_callback_autodetect_test_printprog(callback_autodetect_test_printprogHandle_t handle);
+extern "C" void __program_callback_autodetect_test_printprog(callback_autodetect_test_printprogHandle_t handle, double * __restrict__ a, void (*print)(double const *));
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_printprog "7f140a6067de75e53137a281e40848d3cc0b4d9f5d031d13f0638cde909658f2"
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_printprog.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_printprogHandle_t handle;
+    int err;
+    void (*print)(double const *) = 42;
+    double * __restrict__ a = (double*) calloc(4, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_printprog(print);
+    __program_callback_autodetect_test_printprog(handle, a, print);
+    err = __dace_exit_callback_autodetect_test_printprog(handle);
+
+    free(a);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_prog.dir/root/package/.dacecache/callback_autodetect_test_prog/src/cpu/callback_autodetect_test_prog.cpp.o"
+  "CMakeFiles/callback_autodetect_test_prog.dir/root/package/.dacecache/callback_autodetect_test_prog/src/cpu/callback_autodetect_test_prog.cpp.o.d"
+  "libcallback_autodetect_test_prog.pdb"
+  "libcallback_autodetect_test_prog.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_prog.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
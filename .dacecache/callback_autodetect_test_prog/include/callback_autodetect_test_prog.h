@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_progHandle_t;
+extern "C" callback_autodetect_test_progHandle_t __dace_init_callback_autodetect_test_prog(void (*Obj_hello)(double const *, double const *));
+extern "C" int __dace_exit_callback_autodetect_test_prog(callback_autodetect_test_progHandle_t handle);
+extern "C" void __program_callback_autodetect_test_prog(callback_autodetect_test_progHandle_t handle, double * __restrict__ __return, double * __restrict__ a, void (*Obj_hello)(double const *, double const *));
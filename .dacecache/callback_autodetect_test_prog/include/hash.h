@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_prog "ee40f32f5242d5c84312ec0217d7fc092b327c7cb4dd2c531d5da1f0a00e8017"
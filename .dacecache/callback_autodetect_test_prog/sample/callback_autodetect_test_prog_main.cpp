@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_prog.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_progHandle_t handle;
+    int err;
+    void (*Obj_hello)(double const *, double const *) = 42;
+    double * __restrict__ __return = (double*) calloc(10, sizeof(double));
+    double * __restrict__ a = (double*) calloc(10, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_prog(Obj_hello);
+    __program_callback_autodetect_test_prog(handle, __return, a, Obj_hello);
+    err = __dace_exit_callback_autodetect_test_prog(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_same_name_nested.dir/root/package/.dacecache/callback_autodetect_test_same_name_nested/src/cpu/callback_autodetect_test_same_name_nested.cpp.o"
+  "CMakeFiles/callback_autodetect_test_same_name_nested.dir/root/package/.dacecache/callback_autodetect_test_same_name_nested/src/cpu/callback_autodetect_test_same_name_nested.cpp.o.d"
+  "libcallback_autodetect_test_same_name_nested.pdb"
+  "libcallback_autodetect_test_same_name_nested.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_same_name_nested.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_same_name_nestedHandle_t;
+extern "C" callback_autodetect_test_same_name_nestedHandle_t __dace_init_callback_autodetect_test_same_name_nested(void (*b)(), void (*b_0)());
+extern "C" int __dace_exit_callback_autodetect_test_same_name_nested(callback_autodetect_test_same_name_nestedHandle_t handle);
+extern "C" void __program_callback_autodetect_test_same_name_nested(callback_autodetect_test_same_name_nestedHandle_t handle, void (*b)(), void (*b_0)());
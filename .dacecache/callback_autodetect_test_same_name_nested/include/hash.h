@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_same_name_nested "50005818f5b9f9cfda4d5871fb5d220f793c13bb3b31ebade205ea17bfcb2d1a"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_same_name_nested.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_same_name_nestedHandle_t handle;
+    int err;
+    void (*b)() = 42;
+    void (*b_0)() = 42;
+
+
+    handle = __dace_init_callback_autodetect_test_same_name_nested(b, b_0);
+    __program_callback_autodetect_test_same_name_nested(handle, b, b_0);
+    err = __dace_exit_callback_autodetect_test_same_name_nested(handle);
+
+
+
+    return err;
+}
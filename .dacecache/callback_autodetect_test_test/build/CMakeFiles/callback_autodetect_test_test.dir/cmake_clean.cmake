@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_test.dir/root/package/.dacecache/callback_autodetect_test_test/src/cpu/callback_autodetect_test_test.cpp.o"
+  "CMakeFiles/callback_autodetect_test_test.dir/root/package/.dacecache/callback_autodetect_test_test/src/cpu/callback_autodetect_test_test.cpp.o.d"
+  "libcallback_autodetect_test_test.pdb"
+  "libcallback_autodetect_test_test.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_test.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
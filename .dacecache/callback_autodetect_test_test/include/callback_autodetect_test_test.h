@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_testHandle_t;
+extern "C" callback_autodetect_test_testHandle_t __dace_init_callback_autodetect_test_test();
+extern "C" int __dace_exit_callback_autodetect_test_test(callback_autodetect_test_testHandle_t handle);
+extern "C" void __program_callback_autodetect_test_test(callback_autodetect_test_testHandle_t handle, double * __restrict__ __return, double * __restrict__ point1, double * __restrict__ point2);
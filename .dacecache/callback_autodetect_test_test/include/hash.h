@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_test "730d0ef113604ab2ff36f8bacbd03429cbe572a72d71c24bb32f7efda00f3e06"
@@ -0,0 +1,22 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_test.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_testHandle_t handle;
+    int err;
+    double * __restrict__ __return = (double*) calloc(2, sizeof(double));
+    double * __restrict__ point1 = (double*) calloc(2, sizeof(double));
+    double * __restrict__ point2 = (double*) calloc(2, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_test();
+    __program_callback_autodetect_test_test(handle, __return, point1, point2);
+    err = __dace_exit_callback_autodetect_test_test(handle);
+
+    free(__return);
+    free(point1);
+    free(point2);
+
+
+    return err;
+}
@@ -0,0 +1,192 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_test_state_t {
+
+};
+
+void __program_callback_autodetect_test_test_internal(callback_autodetect_test_test_state_t*__state, double * __restrict__ __return, double * __restrict__ point1, double * __restrict__ point2)
+{
+    double *mid_deg;
+    mid_deg = new double DACE_ALIGN(64)[2];
+    double *mid_rad;
+    mid_rad = new double DACE_ALIGN(64)[2];
+    double __tmp2;
+
+    {
+        double *__tmp0;
+        __tmp0 = new double DACE_ALIGN(64)[2];
+        double __tmp8;
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 2; __i0 += 1) {
+                {
+                    double __in1 = point1[__i0];
+                    double __in2 = point2[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __tmp0[__i0] = __out;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 2; __i0 += 1) {
+                {
+                    double __in1 = __tmp0[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Div_)
+                    __out = (__in1 / 2.0);
+                    ///////////////////
+
+                    mid_deg[__i0] = __out;
+                }
+            }
+        }
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        mid_deg, &__tmp8, 1);
+        {
+            double __in1 = __tmp8;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (__in1 * 3.141592653589793);
+            ///////////////////
+
+            __tmp2 = __out;
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 2; __i0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_numpy_full_)
+                    __out = 0.0;
+                    ///////////////////
+
+                    mid_rad[__i0] = __out;
+                }
+            }
+        }
+        delete[] __tmp0;
+
+    }
+    {
+        double __tmp3;
+        double __tmp4;
+        double __tmp5;
+        double __tmp6;
+
+        {
+            double __in1 = __tmp2;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / 180.0);
+            ///////////////////
+
+            __tmp3 = __out;
+        }
+        {
+            double __inp = __tmp3;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_714_4)
+            __out = __inp;
+            ///////////////////
+
+            mid_rad[0] = __out;
+        }
+
+        dace::CopyND<double, 1, false, 1>::template ConstDst<1>::Copy(
+        mid_deg + 1, &__tmp4, 1);
+        {
+            double __in1 = __tmp4;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Mult_)
+            __out = (__in1 * 3.141592653589793);
+            ///////////////////
+
+            __tmp5 = __out;
+        }
+        {
+            double __in1 = __tmp5;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (_Div_)
+            __out = (__in1 / 180.0);
+            ///////////////////
+
+            __tmp6 = __out;
+        }
+        {
+            double __inp = __tmp6;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_715_4)
+            __out = __inp;
+            ///////////////////
+
+            mid_rad[1] = __out;
+        }
+
+        dace::CopyND<double, 1, false, 2>::template ConstDst<1>::Copy(
+        mid_rad, __return, 1);
+
+    }
+    delete[] mid_deg;
+    delete[] mid_rad;
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_test(callback_autodetect_test_test_state_t *__state, double * __restrict__ __return, double * __restrict__ point1, double * __restrict__ point2)
+{
+    __program_callback_autodetect_test_test_internal(__state, __return, point1, point2);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_test_repeat(callback_autodetect_test_test_state_t *__state, long long __dace_repetitions, double * __restrict__ __return, double * __restrict__ point1, double * __restrict__ point2)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_test_internal(__state, __return, point1, point2);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_test_state_t *__dace_init_callback_autodetect_test_test()
+{
+    int __result = 0;
+    callback_autodetect_test_test_state_t *__state = new callback_autodetect_test_test_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_test(callback_autodetect_test_test_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_tester.dir/root/package/.dacecache/callback_autodetect_test_tester/src/cpu/callback_autodetect_test_tester.cpp.o"
+  "CMakeFiles/callback_autodetect_test_tester.dir/root/package/.dacecache/callback_autodetect_test_tester/src/cpu/callback_autodetect_test_tester.cpp.o.d"
+  "libcallback_autodetect_test_tester.pdb"
+  "libcallback_autodetect_test_tester.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_tester.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_testerHandle_t;
+extern "C" callback_autodetect_test_testerHandle_t __dace_init_callback_autodetect_test_tester(void (*callback)(double));
+extern "C" int __dace_exit_callback_autodetect_test_tester(callback_autodetect_test_testerHandle_t handle);
+extern "C" void __program_callback_autodetect_test_tester(callback_autodetect_test_testerHandle_t handle, double * __restrict__ A, void (*callback)(double));
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_tester_0Handle_t;
+extern "C" callback_autodetect_test_tester_0Handle_t __dace_init_callback_autodetect_test_tester_0(pyobject (*MyCustomObject)(), void (*checkit)(pyobject), pyobject (*dict)());
+extern "C" int __dace_exit_callback_autodetect_test_tester_0(callback_autodetect_test_tester_0Handle_t handle);
+extern "C" void __program_callback_autodetect_test_tester_0(callback_autodetect_test_tester_0Handle_t handle, double * __restrict__ unused, pyobject (*MyCustomObject)(), void (*checkit)(pyobject), pyobject (*dict)());
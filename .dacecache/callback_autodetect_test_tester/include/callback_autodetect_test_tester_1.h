@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_tester_1Handle_t;
+extern "C" callback_autodetect_test_tester_1Handle_t __dace_init_callback_autodetect_test_tester_1(void (*MyCustomObject)(), pyobject (*MyCustomObject_0)(), pyobject (*MyCustomObject_1)());
+extern "C" int __dace_exit_callback_autodetect_test_tester_1(callback_autodetect_test_tester_1Handle_t handle);
+extern "C" void __program_callback_autodetect_test_tester_1(callback_autodetect_test_tester_1Handle_t handle, pyobject * __restrict__ __return_0, pyobject * __restrict__ __return_1, void (*MyCustomObject)(), pyobject (*MyCustomObject_0)(), pyobject (*MyCustomObject_1)());
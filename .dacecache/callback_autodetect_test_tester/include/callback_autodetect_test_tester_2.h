@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_tester_2Handle_t;
+extern "C" callback_autodetect_test_tester_2Handle_t __dace_init_callback_autodetect_test_tester_2(long long (*next)(pyobject), pyobject (*reverse_range)());
+extern "C" int __dace_exit_callback_autodetect_test_tester_2(callback_autodetect_test_tester_2Handle_t handle);
+extern "C" void __program_callback_autodetect_test_tester_2(callback_autodetect_test_tester_2Handle_t handle, double * __restrict__ a, long long (*next)(pyobject), pyobject (*reverse_range)());
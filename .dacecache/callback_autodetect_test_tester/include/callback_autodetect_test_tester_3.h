@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_tester_3Handle_t;
+extern "C" callback_autodetect_test_tester_3Handle_t __dace_init_callback_autodetect_test_tester_3(void (*my_next)(pyobject, long long*, bool*), pyobject (*reverse_range)());
+extern "C" int __dace_exit_callback_autodetect_test_tester_3(callback_autodetect_test_tester_3Handle_t handle);
+extern "C" void __program_callback_autodetect_test_tester_3(callback_autodetect_test_tester_3Handle_t handle, double * __restrict__ a, void (*my_next)(pyobject, long long*, bool*), pyobject (*reverse_range)());
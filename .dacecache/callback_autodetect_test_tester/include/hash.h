@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_tester_3 "e0fcfd9e33d585fc033b25515f9cb1ab212fccd294607247d57feeace25d8f87"
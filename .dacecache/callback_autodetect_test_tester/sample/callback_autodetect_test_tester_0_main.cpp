@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_tester_0.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_tester_0Handle_t handle;
+    int err;
+    pyobject (*MyCustomObject)() = 42;
+    void (*checkit)(pyobject) = 42;
+    pyobject (*dict)() = 42;
+    double * __restrict__ unused = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_tester_0(MyCustomObject, checkit, dict);
+    __program_callback_autodetect_test_tester_0(handle, unused, MyCustomObject, checkit, dict);
+    err = __dace_exit_callback_autodetect_test_tester_0(handle);
+
+    free(unused);
+
+
+    return err;
+}
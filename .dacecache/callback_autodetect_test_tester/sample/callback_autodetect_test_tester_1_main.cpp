@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_tester_1.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_tester_1Handle_t handle;
+    int err;
+    void (*MyCustomObject)() = 42;
+    pyobject (*MyCustomObject_0)() = 42;
+    pyobject (*MyCustomObject_1)() = 42;
+    pyobject * __restrict__ __return_0 = (pyobject*) calloc(1, sizeof(pyobject));
+    pyobject * __restrict__ __return_1 = (pyobject*) calloc(1, sizeof(pyobject));
+
+
+    handle = __dace_init_callback_autodetect_test_tester_1(MyCustomObject, MyCustomObject_0, MyCustomObject_1);
+    __program_callback_autodetect_test_tester_1(handle, __return_0, __return_1, MyCustomObject, MyCustomObject_0, MyCustomObject_1);
+    err = __dace_exit_callback_autodetect_test_tester_1(handle);
+
+    free(__return_0);
+    free(__return_1);
+
+
+    return err;
+}
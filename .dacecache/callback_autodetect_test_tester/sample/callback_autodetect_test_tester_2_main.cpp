@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_tester_2.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_tester_2Handle_t handle;
+    int err;
+    long long (*next)(pyobject) = 42;
+    pyobject (*reverse_range)() = 42;
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_tester_2(next, reverse_range);
+    __program_callback_autodetect_test_tester_2(handle, a, next, reverse_range);
+    err = __dace_exit_callback_autodetect_test_tester_2(handle);
+
+    free(a);
+
+
+    return err;
+}
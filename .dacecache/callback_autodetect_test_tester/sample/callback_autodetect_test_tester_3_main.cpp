@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_tester_3.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_tester_3Handle_t handle;
+    int err;
+    void (*my_next)(pyobject, long long*, bool*) = 42;
+    pyobject (*reverse_range)() = 42;
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_tester_3(my_next, reverse_range);
+    __program_callback_autodetect_test_tester_3(handle, a, my_next, reverse_range);
+    err = __dace_exit_callback_autodetect_test_tester_3(handle);
+
+    free(a);
+
+
+    return err;
+}
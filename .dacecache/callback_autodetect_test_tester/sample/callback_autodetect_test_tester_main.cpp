@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_tester.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_testerHandle_t handle;
+    int err;
+    void (*callback)(double) = 42;
+    double * __restrict__ A = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_tester(callback);
+    __program_callback_autodetect_test_tester(handle, A, callback);
+    err = __dace_exit_callback_autodetect_test_tester(handle);
+
+    free(A);
+
+
+    return err;
+}
@@ -0,0 +1,109 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_tester_state_t {
+
+};
+
+inline void reduce_0_0_5(callback_autodetect_test_tester_state_t *__state, double* __restrict__ _in, double* __restrict__ _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 1; _o0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (reduce_init)
+                    __out = 0;
+                    ///////////////////
+
+                    _out[_o0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 20; _i0 += 1) {
+                {
+                    double __inp = _in[_i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (identity)
+                    __out = __inp;
+                    ///////////////////
+
+                    dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(_out, __out);
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_callback_autodetect_test_tester_internal(callback_autodetect_test_tester_state_t*__state, double * __restrict__ A, void (*callback)(double))
+{
+
+    {
+        double __tmp0;
+        int __pystate;
+
+        reduce_0_0_5(__state, &A[0], &__tmp0);
+        {
+            int __istate = __pystate;
+            double __in___tmp0 = __tmp0;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_746)
+            callback(__in___tmp0);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester(callback_autodetect_test_tester_state_t *__state, double * __restrict__ A, void (*callback)(double))
+{
+    __program_callback_autodetect_test_tester_internal(__state, A, callback);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_repeat(callback_autodetect_test_tester_state_t *__state, long long __dace_repetitions, double * __restrict__ A, void (*callback)(double))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_tester_internal(__state, A, callback);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_tester_state_t *__dace_init_callback_autodetect_test_tester(void (*callback)(double))
+{
+    int __result = 0;
+    callback_autodetect_test_tester_state_t *__state = new callback_autodetect_test_tester_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_tester(callback_autodetect_test_tester_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
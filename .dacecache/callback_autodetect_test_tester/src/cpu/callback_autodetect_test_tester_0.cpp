@@ -0,0 +1,813 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_tester_0_state_t {
+
+};
+
+void __program_callback_autodetect_test_tester_0_internal(callback_autodetect_test_tester_0_state_t*__state, double * __restrict__ unused, pyobject (*MyCustomObject)(), void (*checkit)(pyobject), pyobject (*dict)())
+{
+    pyobject a;
+    int __pystate;
+    pyobject b;
+    pyobject __tmp0;
+    pyobject __tmp2;
+    pyobject __tmp3;
+    pyobject __tmp4;
+    pyobject __tmp6;
+    pyobject __tmp7;
+    pyobject __tmp8;
+    pyobject __tmp9;
+    pyobject __tmp10;
+    pyobject __tmp11;
+    pyobject __tmp12;
+    pyobject __tmp13;
+    pyobject __tmp14;
+    pyobject __tmp16;
+    pyobject __tmp17;
+
+    {
+
+        {
+            int __istate = __pystate;
+            pyobject* __out_a = &a;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out_a[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            int __istate = __pystate;
+            pyobject* __out_b = &b;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out_b[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp0 = &__tmp0;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp0[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+        pyobject __tmp1;
+
+        {
+            pyobject __inp = __tmp0;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp1 = &__tmp1;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp1[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __inp = __tmp1;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp2 = &__tmp2;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp2[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp2;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8_0)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp3 = &__tmp3;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp3[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp3;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8_0)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp4 = &__tmp4;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp4[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+        pyobject __tmp5;
+
+        {
+            pyobject __inp = __tmp4;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8_1)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp5 = &__tmp5;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp5[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __inp = __tmp5;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8_1)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp6 = &__tmp6;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp6[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp6;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8_2)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp7 = &__tmp7;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp7[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp7;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8_2)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp8 = &__tmp8;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp8[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp8;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8_3)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp9 = &__tmp9;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp9[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp9;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8_3)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp10 = &__tmp10;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp10[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp10;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8_4)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp11 = &__tmp11;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp11[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp11;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8_4)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp12 = &__tmp12;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp12[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp12;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8_5)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp13 = &__tmp13;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp13[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp13;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8_5)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp14 = &__tmp14;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp14[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+        pyobject __tmp15;
+
+        {
+            pyobject __inp = __tmp14;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8_6)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp15 = &__tmp15;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp15[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __inp = __tmp15;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8_6)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp16 = &__tmp16;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_797)
+            __out___tmp16[0] = dict();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp16;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_797_8_7)
+            __out = __inp;
+            ///////////////////
+
+            a = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___tmp17 = &__tmp17;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_798)
+            __out___tmp17[0] = MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+    {
+
+        {
+            pyobject __inp = __tmp17;
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_798_8_7)
+            __out = __inp;
+            ///////////////////
+
+            b = __out;
+        }
+        {
+            pyobject __in_a = a;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_799)
+            checkit(__in_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __in_b = b;
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_800)
+            checkit(__in_b);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_0(callback_autodetect_test_tester_0_state_t *__state, double * __restrict__ unused, pyobject (*MyCustomObject)(), void (*checkit)(pyobject), pyobject (*dict)())
+{
+    __program_callback_autodetect_test_tester_0_internal(__state, unused, MyCustomObject, checkit, dict);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_0_repeat(callback_autodetect_test_tester_0_state_t *__state, long long __dace_repetitions, double * __restrict__ unused, pyobject (*MyCustomObject)(), void (*checkit)(pyobject), pyobject (*dict)())
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_tester_0_internal(__state, unused, MyCustomObject, checkit, dict);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_tester_0_state_t *__dace_init_callback_autodetect_test_tester_0(pyobject (*MyCustomObject)(), void (*checkit)(pyobject), pyobject (*dict)())
+{
+    int __result = 0;
+    callback_autodetect_test_tester_0_state_t *__state = new callback_autodetect_test_tester_0_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_tester_0(callback_autodetect_test_tester_0_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
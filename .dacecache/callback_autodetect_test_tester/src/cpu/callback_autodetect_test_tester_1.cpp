@@ -0,0 +1,108 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_tester_1_state_t {
+
+};
+
+void __program_callback_autodetect_test_tester_1_internal(callback_autodetect_test_tester_1_state_t*__state, pyobject * __restrict__ __return_0, pyobject * __restrict__ __return_1, void (*MyCustomObject)(), pyobject (*MyCustomObject_0)(), pyobject (*MyCustomObject_1)())
+{
+
+    {
+        int __pystate;
+
+        {
+            int __istate = __pystate;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_846)
+            MyCustomObject();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___return_0 = __return_0;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_847)
+            __out___return_0[0] = MyCustomObject_0();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __inp = __return_0[0];
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_847_4)
+            __out = __inp;
+            ///////////////////
+
+            __return_0[0] = __out;
+        }
+        {
+            int __istate = __pystate;
+            pyobject* __out___return_1 = __return_1;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_847)
+            __out___return_1[0] = MyCustomObject_1();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __inp = __return_1[0];
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_847_4_0)
+            __out = __inp;
+            ///////////////////
+
+            __return_1[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_1(callback_autodetect_test_tester_1_state_t *__state, pyobject * __restrict__ __return_0, pyobject * __restrict__ __return_1, void (*MyCustomObject)(), pyobject (*MyCustomObject_0)(), pyobject (*MyCustomObject_1)())
+{
+    __program_callback_autodetect_test_tester_1_internal(__state, __return_0, __return_1, MyCustomObject, MyCustomObject_0, MyCustomObject_1);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_1_repeat(callback_autodetect_test_tester_1_state_t *__state, long long __dace_repetitions, pyobject * __restrict__ __return_0, pyobject * __restrict__ __return_1, void (*MyCustomObject)(), pyobject (*MyCustomObject_0)(), pyobject (*MyCustomObject_1)())
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_tester_1_internal(__state, __return_0, __return_1, MyCustomObject, MyCustomObject_0, MyCustomObject_1);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_tester_1_state_t *__dace_init_callback_autodetect_test_tester_1(void (*MyCustomObject)(), pyobject (*MyCustomObject_0)(), pyobject (*MyCustomObject_1)())
+{
+    int __result = 0;
+    callback_autodetect_test_tester_1_state_t *__state = new callback_autodetect_test_tester_1_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_tester_1(callback_autodetect_test_tester_1_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,100 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_tester_2_state_t {
+
+};
+
+void __program_callback_autodetect_test_tester_2_internal(callback_autodetect_test_tester_2_state_t*__state, double * __restrict__ a, long long (*next)(pyobject), pyobject (*reverse_range)())
+{
+    pyobject gen;
+    int __pystate;
+    long long i;
+
+    {
+
+        {
+            int __istate = __pystate;
+            pyobject* __out_gen = &gen;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_866)
+            __out_gen[0] = reverse_range();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+
+
+    for (i = 0; (i < 20); i = (i + 1)) {
+        {
+            long long val;
+
+            {
+                pyobject __in_gen = gen;
+                int __istate = __pystate;
+                long long* __out___tmp0 = &val;
+                int __ostate;
+
+                ///////////////////
+                // Tasklet code (callback_868)
+                __out___tmp0[0] = next(__in_gen);
+                ///////////////////
+
+                __pystate = __ostate;
+            }
+            {
+                long long __inp = val;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (assign_869_8)
+                __out = __inp;
+                ///////////////////
+
+                a[i] = __out;
+            }
+
+        }
+
+    }
+
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_2(callback_autodetect_test_tester_2_state_t *__state, double * __restrict__ a, long long (*next)(pyobject), pyobject (*reverse_range)())
+{
+    __program_callback_autodetect_test_tester_2_internal(__state, a, next, reverse_range);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_2_repeat(callback_autodetect_test_tester_2_state_t *__state, long long __dace_repetitions, double * __restrict__ a, long long (*next)(pyobject), pyobject (*reverse_range)())
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_tester_2_internal(__state, a, next, reverse_range);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_tester_2_state_t *__dace_init_callback_autodetect_test_tester_2(long long (*next)(pyobject), pyobject (*reverse_range)())
+{
+    int __result = 0;
+    callback_autodetect_test_tester_2_state_t *__state = new callback_autodetect_test_tester_2_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_tester_2(callback_autodetect_test_tester_2_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
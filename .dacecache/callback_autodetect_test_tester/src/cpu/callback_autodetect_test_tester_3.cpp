@@ -0,0 +1,121 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_tester_3_state_t {
+
+};
+
+void __program_callback_autodetect_test_tester_3_internal(callback_autodetect_test_tester_3_state_t*__state, double * __restrict__ a, void (*my_next)(pyobject, long long*, bool*), pyobject (*reverse_range)())
+{
+    pyobject gen;
+    int __pystate;
+    long long __tmp2;
+    bool __tmp3;
+    long long i;
+    long long val;
+    bool stop;
+
+    {
+
+        {
+            int __istate = __pystate;
+            pyobject* __out_gen = &gen;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_893)
+            __out_gen[0] = reverse_range();
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+
+
+    for (i = 0; (i < 21); i = (i + 1)) {
+
+        val = 0;
+        stop = true;
+        {
+
+            {
+                pyobject __in_gen = gen;
+                int __istate = __pystate;
+                long long* __out___tmp2 = &__tmp2;
+                bool* __out___tmp3 = &__tmp3;
+                int __ostate;
+
+                ///////////////////
+                // Tasklet code (callback_897)
+                my_next(__in_gen, __out___tmp2, __out___tmp3);
+                ///////////////////
+
+                __pystate = __ostate;
+            }
+
+        }
+        val = __tmp2;
+        stop = __tmp3;
+
+        if (stop) {
+            goto __state_0_endfor_894;
+        }
+        if ((! stop)) {
+            goto __state_0_assign_900_8;
+        }
+        __state_0_assign_900_8:;
+        {
+
+            {
+                double __out;
+
+                ///////////////////
+                // Tasklet code (assign_900_8)
+                __out = val;
+                ///////////////////
+
+                a[i] = __out;
+            }
+
+        }
+
+    }
+    __state_0_endfor_894:;
+
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_3(callback_autodetect_test_tester_3_state_t *__state, double * __restrict__ a, void (*my_next)(pyobject, long long*, bool*), pyobject (*reverse_range)())
+{
+    __program_callback_autodetect_test_tester_3_internal(__state, a, my_next, reverse_range);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_tester_3_repeat(callback_autodetect_test_tester_3_state_t *__state, long long __dace_repetitions, double * __restrict__ a, void (*my_next)(pyobject, long long*, bool*), pyobject (*reverse_range)())
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_tester_3_internal(__state, a, my_next, reverse_range);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_tester_3_state_t *__dace_init_callback_autodetect_test_tester_3(void (*my_next)(pyobject, long long*, bool*), pyobject (*reverse_range)())
+{
+    int __result = 0;
+    callback_autodetect_test_tester_3_state_t *__state = new callback_autodetect_test_tester_3_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_tester_3(callback_autodetect_test_tester_3_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
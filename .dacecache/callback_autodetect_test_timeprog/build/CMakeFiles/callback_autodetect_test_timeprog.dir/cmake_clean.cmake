@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callback_autodetect_test_timeprog.dir/root/package/.dacecache/callback_autodetect_test_timeprog/src/cpu/callback_autodetect_test_timeprog.cpp.o"
+  "CMakeFiles/callback_autodetect_test_timeprog.dir/root/package/.dacecache/callback_autodetect_test_timeprog/src/cpu/callback_autodetect_test_timeprog.cpp.o.d"
+  "libcallback_autodetect_test_timeprog.pdb"
+  "libcallback_autodetect_test_timeprog.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callback_autodetect_test_timeprog.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
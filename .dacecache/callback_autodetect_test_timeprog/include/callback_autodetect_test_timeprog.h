@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callback_autodetect_test_timeprogHandle_t;
+extern "C" callback_autodetect_test_timeprogHandle_t __dace_init_callback_autodetect_test_timeprog(void (*time_time)(double const *));
+extern "C" int __dace_exit_callback_autodetect_test_timeprog(callback_autodetect_test_timeprogHandle_t handle);
+extern "C" void __program_callback_autodetect_test_timeprog(callback_autodetect_test_timeprogHandle_t handle, double * __restrict__ A, void (*time_time)(double const *));
@@ -0,0 +1 @@
+#define __HASH_callback_autodetect_test_timeprog "96afe7eb716cc8162ae3498060610490b32ad9d0f63e3576d93608af8d1fd201"
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/callback_autodetect_test_timeprog.h"
+
+int main(int argc, char **argv) {
+    callback_autodetect_test_timeprogHandle_t handle;
+    int err;
+    void (*time_time)(double const *) = 42;
+    double * __restrict__ A = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callback_autodetect_test_timeprog(time_time);
+    __program_callback_autodetect_test_timeprog(handle, A, time_time);
+    err = __dace_exit_callback_autodetect_test_timeprog(handle);
+
+    free(A);
+
+
+    return err;
+}
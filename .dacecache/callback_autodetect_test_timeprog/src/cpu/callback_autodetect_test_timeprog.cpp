@@ -0,0 +1,63 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callback_autodetect_test_timeprog_state_t {
+
+};
+
+void __program_callback_autodetect_test_timeprog_internal(callback_autodetect_test_timeprog_state_t*__state, double * __restrict__ A, void (*time_time)(double const *))
+{
+
+    {
+        int __pystate;
+
+        {
+            int __istate = __pystate;
+            int __ostate;
+            double* __out___tmp0 = A;
+
+            ///////////////////
+            // Tasklet code (callback_355)
+            time_time(__out___tmp0);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_timeprog(callback_autodetect_test_timeprog_state_t *__state, double * __restrict__ A, void (*time_time)(double const *))
+{
+    __program_callback_autodetect_test_timeprog_internal(__state, A, time_time);
+}
+
+DACE_EXPORTED void __program_callback_autodetect_test_timeprog_repeat(callback_autodetect_test_timeprog_state_t *__state, long long __dace_repetitions, double * __restrict__ A, void (*time_time)(double const *))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callback_autodetect_test_timeprog_internal(__state, A, time_time);
+    }
+}
+
+DACE_EXPORTED callback_autodetect_test_timeprog_state_t *__dace_init_callback_autodetect_test_timeprog(void (*time_time)(double const *))
+{
+    int __result = 0;
+    callback_autodetect_test_timeprog_state_t *__state = new callback_autodetect_test_timeprog_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callback_autodetect_test_timeprog(callback_autodetect_test_timeprog_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
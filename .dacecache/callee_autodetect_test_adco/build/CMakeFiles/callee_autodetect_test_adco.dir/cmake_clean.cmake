@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callee_autodetect_test_adco.dir/root/package/.dacecache/callee_autodetect_test_adco/src/cpu/callee_autodetect_test_adco.cpp.o"
+  "CMakeFiles/callee_autodetect_test_adco.dir/root/package/.dacecache/callee_autodetect_test_adco/src/cpu/callee_autodetect_test_adco.cpp.o.d"
+  "libcallee_autodetect_test_adco.pdb"
+  "libcallee_autodetect_test_adco.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callee_autodetect_test_adco.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
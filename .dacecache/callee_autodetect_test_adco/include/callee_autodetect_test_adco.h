@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callee_autodetect_test_adcoHandle_t;
+extern "C" callee_autodetect_test_adcoHandle_t __dace_init_callee_autodetect_test_adco();
+extern "C" int __dace_exit_callee_autodetect_test_adco(callee_autodetect_test_adcoHandle_t handle);
+extern "C" void __program_callee_autodetect_test_adco(callee_autodetect_test_adcoHandle_t handle, double * __restrict__ A, double * __restrict__ __return);
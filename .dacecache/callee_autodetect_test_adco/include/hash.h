@@ -0,0 +1 @@
+#define __HASH_callee_autodetect_test_adco "f0ee42f118ec9eba93ce400ae6c1071dad1e18ae68e13e5ff174a2be6a29a4b6"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/callee_autodetect_test_adco.h"
+
+int main(int argc, char **argv) {
+    callee_autodetect_test_adcoHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(20, sizeof(double));
+    double * __restrict__ __return = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callee_autodetect_test_adco();
+    __program_callee_autodetect_test_adco(handle, A, __return);
+    err = __dace_exit_callee_autodetect_test_adco(handle);
+
+    free(A);
+    free(__return);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callee_autodetect_test_adf.dir/root/package/.dacecache/callee_autodetect_test_adf/src/cpu/callee_autodetect_test_adf.cpp.o"
+  "CMakeFiles/callee_autodetect_test_adf.dir/root/package/.dacecache/callee_autodetect_test_adf/src/cpu/callee_autodetect_test_adf.cpp.o.d"
+  "libcallee_autodetect_test_adf.pdb"
+  "libcallee_autodetect_test_adf.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callee_autodetect_test_adf.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
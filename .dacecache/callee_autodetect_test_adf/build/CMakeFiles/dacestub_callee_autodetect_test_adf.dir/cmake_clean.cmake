@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_callee_autodetect_test_adf.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_callee_autodetect_test_adf.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_callee_autodetect_test_adf.pdb"
+  "libdacestub_callee_autodetect_test_adf.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_callee_autodetect_test_adf.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_callee_autodetect_test_adf "1aac08c912b5a2755c33092ff30834e3a9d230c75c1da7cb7628b8942049b97e"
@@ -0,0 +1,66 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callee_autodetect_test_adf_state_t {
+
+};
+
+void __program_callee_autodetect_test_adf_internal(callee_autodetect_test_adf_state_t*__state, double * __restrict__ A, double * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                {
+                    double __in1 = A[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + dace::float64(1));
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callee_autodetect_test_adf(callee_autodetect_test_adf_state_t *__state, double * __restrict__ A, double * __restrict__ __return)
+{
+    __program_callee_autodetect_test_adf_internal(__state, A, __return);
+}
+
+DACE_EXPORTED void __program_callee_autodetect_test_adf_repeat(callee_autodetect_test_adf_state_t *__state, long long __dace_repetitions, double * __restrict__ A, double * __restrict__ __return)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callee_autodetect_test_adf_internal(__state, A, __return);
+    }
+}
+
+DACE_EXPORTED callee_autodetect_test_adf_state_t *__dace_init_callee_autodetect_test_adf()
+{
+    int __result = 0;
+    callee_autodetect_test_adf_state_t *__state = new callee_autodetect_test_adf_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callee_autodetect_test_adf(callee_autodetect_test_adf_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
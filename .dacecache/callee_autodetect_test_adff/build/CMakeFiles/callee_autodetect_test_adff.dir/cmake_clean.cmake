@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callee_autodetect_test_adff.dir/root/package/.dacecache/callee_autodetect_test_adff/src/cpu/callee_autodetect_test_adff.cpp.o"
+  "CMakeFiles/callee_autodetect_test_adff.dir/root/package/.dacecache/callee_autodetect_test_adff/src/cpu/callee_autodetect_test_adff.cpp.o.d"
+  "libcallee_autodetect_test_adff.pdb"
+  "libcallee_autodetect_test_adff.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callee_autodetect_test_adff.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
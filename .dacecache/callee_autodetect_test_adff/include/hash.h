@@ -0,0 +1 @@
+#define __HASH_callee_autodetect_test_adff "83cb8acfca6a1c1c9ca7fdaec7e8b0cbcd13885fa2c530cf29ecb3029c894bb6"
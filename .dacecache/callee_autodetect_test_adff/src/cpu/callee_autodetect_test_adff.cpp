@@ -0,0 +1,74 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callee_autodetect_test_adff_state_t {
+
+};
+
+void __program_callee_autodetect_test_adff_internal(callee_autodetect_test_adff_state_t*__state, double * __restrict__ A)
+{
+    long long _;
+
+
+
+
+    for (_ = 0; (_ < 5); _ = _ + 1) {
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                    {
+                        double __in1 = A[__i0];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (augassign_182_4)
+                        __out = (__in1 + 2);
+                        ///////////////////
+
+                        A[__i0] = __out;
+                    }
+                }
+            }
+
+        }
+
+    }
+
+}
+
+DACE_EXPORTED void __program_callee_autodetect_test_adff(callee_autodetect_test_adff_state_t *__state, double * __restrict__ A)
+{
+    __program_callee_autodetect_test_adff_internal(__state, A);
+}
+
+DACE_EXPORTED void __program_callee_autodetect_test_adff_repeat(callee_autodetect_test_adff_state_t *__state, long long __dace_repetitions, double * __restrict__ A)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callee_autodetect_test_adff_internal(__state, A);
+    }
+}
+
+DACE_EXPORTED callee_autodetect_test_adff_state_t *__dace_init_callee_autodetect_test_adff()
+{
+    int __result = 0;
+    callee_autodetect_test_adff_state_t *__state = new callee_autodetect_test_adff_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callee_autodetect_test_adff(callee_autodetect_test_adff_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callee_autodetect_test_adm.dir/root/package/.dacecache/callee_autodetect_test_adm/src/cpu/callee_autodetect_test_adm.cpp.o"
+  "CMakeFiles/callee_autodetect_test_adm.dir/root/package/.dacecache/callee_autodetect_test_adm/src/cpu/callee_autodetect_test_adm.cpp.o.d"
+  "libcallee_autodetect_test_adm.pdb"
+  "libcallee_autodetect_test_adm.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callee_autodetect_test_adm.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
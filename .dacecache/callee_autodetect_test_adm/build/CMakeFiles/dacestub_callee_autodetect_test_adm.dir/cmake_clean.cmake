@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_callee_autodetect_test_adm.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_callee_autodetect_test_adm.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_callee_autodetect_test_adm.pdb"
+  "libdacestub_callee_autodetect_test_adm.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_callee_autodetect_test_adm.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
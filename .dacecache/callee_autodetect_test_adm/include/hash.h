@@ -0,0 +1 @@
+#define __HASH_callee_autodetect_test_adm "199e7c4ffa69d2eaea507e9a3df55f696c39e1a6ff3f55ba4667b616a56559fc"
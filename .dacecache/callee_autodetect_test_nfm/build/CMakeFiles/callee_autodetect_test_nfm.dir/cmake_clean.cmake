@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callee_autodetect_test_nfm.dir/root/package/.dacecache/callee_autodetect_test_nfm/src/cpu/callee_autodetect_test_nfm.cpp.o"
+  "CMakeFiles/callee_autodetect_test_nfm.dir/root/package/.dacecache/callee_autodetect_test_nfm/src/cpu/callee_autodetect_test_nfm.cpp.o.d"
+  "libcallee_autodetect_test_nfm.pdb"
+  "libcallee_autodetect_test_nfm.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callee_autodetect_test_nfm.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callee_autodetect_test_nfmHandle_t;
+extern "C" callee_autodetect_test_nfmHandle_t __dace_init_callee_autodetect_test_nfm();
+extern "C" int __dace_exit_callee_autodetect_test_nfm(callee_autodetect_test_nfmHandle_t handle);
+extern "C" void __program_callee_autodetect_test_nfm(callee_autodetect_test_nfmHandle_t handle, double * __restrict__ __return, double * __restrict__ a);
@@ -0,0 +1 @@
+#define __HASH_callee_autodetect_test_nfm "faf87bcca6ef125c2bf44687c2a7aeb0e99b449479c897392843fdec32efb4c5"
@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/callee_autodetect_test_nfm.h"
+
+int main(int argc, char **argv) {
+    callee_autodetect_test_nfmHandle_t handle;
+    int err;
+    double * __restrict__ __return = (double*) calloc(20, sizeof(double));
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callee_autodetect_test_nfm();
+    __program_callee_autodetect_test_nfm(handle, __return, a);
+    err = __dace_exit_callee_autodetect_test_nfm(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
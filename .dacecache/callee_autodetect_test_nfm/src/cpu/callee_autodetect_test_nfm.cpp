@@ -0,0 +1,105 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callee_autodetect_test_nfm_state_t {
+
+};
+
+void __program_callee_autodetect_test_nfm_internal(callee_autodetect_test_nfm_state_t*__state, double * __restrict__ __return, double * __restrict__ a)
+{
+
+    {
+        double *__tmp0;
+        __tmp0 = new double DACE_ALIGN(64)[20];
+        double *callee_autodetect_test_TestClass_some_method_ret_0;
+        callee_autodetect_test_TestClass_some_method_ret_0 = new double DACE_ALIGN(64)[20];
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                {
+                    double __in1 = a[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + dace::float64(1));
+                    ///////////////////
+
+                    __tmp0[__i0] = __out;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                {
+                    double __in1 = a[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * dace::float64(5));
+                    ///////////////////
+
+                    callee_autodetect_test_TestClass_some_method_ret_0[__i0] = __out;
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 20; __i0 += 1) {
+                {
+                    double __in1 = __tmp0[__i0];
+                    double __in2 = callee_autodetect_test_TestClass_some_method_ret_0[__i0];
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __return[__i0] = __out;
+                }
+            }
+        }
+        delete[] __tmp0;
+        delete[] callee_autodetect_test_TestClass_some_method_ret_0;
+
+    }
+}
+
+DACE_EXPORTED void __program_callee_autodetect_test_nfm(callee_autodetect_test_nfm_state_t *__state, double * __restrict__ __return, double * __restrict__ a)
+{
+    __program_callee_autodetect_test_nfm_internal(__state, __return, a);
+}
+
+DACE_EXPORTED void __program_callee_autodetect_test_nfm_repeat(callee_autodetect_test_nfm_state_t *__state, long long __dace_repetitions, double * __restrict__ __return, double * __restrict__ a)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callee_autodetect_test_nfm_internal(__state, __return, a);
+    }
+}
+
+DACE_EXPORTED callee_autodetect_test_nfm_state_t *__dace_init_callee_autodetect_test_nfm()
+{
+    int __result = 0;
+    callee_autodetect_test_nfm_state_t *__state = new callee_autodetect_test_nfm_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callee_autodetect_test_nfm(callee_autodetect_test_nfm_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callee_autodetect_test_notworking2.dir/root/package/.dacecache/callee_autodetect_test_notworking2/src/cpu/callee_autodetect_test_notworking2.cpp.o"
+  "CMakeFiles/callee_autodetect_test_notworking2.dir/root/package/.dacecache/callee_autodetect_test_notworking2/src/cpu/callee_autodetect_test_notworking2.cpp.o.d"
+  "libcallee_autodetect_test_notworking2.pdb"
+  "libcallee_autodetect_test_notworking2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callee_autodetect_test_notworking2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callee_autodetect_test_notworking2Handle_t;
+extern "C" callee_autodetect_test_notworking2Handle_t __dace_init_callee_autodetect_test_notworking2(pyobject (*numpy_allclose)(double const *, double const *));
+extern "C" int __dace_exit_callee_autodetect_test_notworking2(callee_autodetect_test_notworking2Handle_t handle);
+extern "C" void __program_callee_autodetect_test_notworking2(callee_autodetect_test_notworking2Handle_t handle, pyobject * __restrict__ __return, double * __restrict__ a, pyobject (*numpy_allclose)(double const *, double const *));
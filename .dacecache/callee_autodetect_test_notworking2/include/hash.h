@@ -0,0 +1 @@
+#define __HASH_callee_autodetect_test_notworking2 "ca9e7cc5ef9f898b14b7ce55fa6f342f84e9ba4380621cbb2bac744ee0523dd6"
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/callee_autodetect_test_notworking2.h"
+
+int main(int argc, char **argv) {
+    callee_autodetect_test_notworking2Handle_t handle;
+    int err;
+    pyobject (*numpy_allclose)(double const *, double const *) = 42;
+    pyobject * __restrict__ __return = (pyobject*) calloc(1, sizeof(pyobject));
+    double * __restrict__ a = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callee_autodetect_test_notworking2(numpy_allclose);
+    __program_callee_autodetect_test_notworking2(handle, __return, a, numpy_allclose);
+    err = __dace_exit_callee_autodetect_test_notworking2(handle);
+
+    free(__return);
+    free(a);
+
+
+    return err;
+}
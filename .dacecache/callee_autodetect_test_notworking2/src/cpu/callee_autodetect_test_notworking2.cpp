@@ -0,0 +1,76 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct callee_autodetect_test_notworking2_state_t {
+
+};
+
+void __program_callee_autodetect_test_notworking2_internal(callee_autodetect_test_notworking2_state_t*__state, pyobject * __restrict__ __return, double * __restrict__ a, pyobject (*numpy_allclose)(double const *, double const *))
+{
+
+    {
+        int __pystate;
+
+        {
+            double* __in_a = &a[0];
+            int __istate = __pystate;
+            double* __out_a = a;
+            pyobject* __out___return = __return;
+            int __ostate;
+
+            ///////////////////
+            // Tasklet code (callback_106)
+            __out___return[0] = numpy_allclose(__out_a, __out_a);
+            ///////////////////
+
+            __pystate = __ostate;
+        }
+        {
+            pyobject __inp = __return[0];
+            pyobject __out;
+
+            ///////////////////
+            // Tasklet code (assign_106_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_callee_autodetect_test_notworking2(callee_autodetect_test_notworking2_state_t *__state, pyobject * __restrict__ __return, double * __restrict__ a, pyobject (*numpy_allclose)(double const *, double const *))
+{
+    __program_callee_autodetect_test_notworking2_internal(__state, __return, a, numpy_allclose);
+}
+
+DACE_EXPORTED void __program_callee_autodetect_test_notworking2_repeat(callee_autodetect_test_notworking2_state_t *__state, long long __dace_repetitions, pyobject * __restrict__ __return, double * __restrict__ a, pyobject (*numpy_allclose)(double const *, double const *))
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_callee_autodetect_test_notworking2_internal(__state, __return, a, numpy_allclose);
+    }
+}
+
+DACE_EXPORTED callee_autodetect_test_notworking2_state_t *__dace_init_callee_autodetect_test_notworking2(pyobject (*numpy_allclose)(double const *, double const *))
+{
+    int __result = 0;
+    callee_autodetect_test_notworking2_state_t *__state = new callee_autodetect_test_notworking2_state_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_callee_autodetect_test_notworking2(callee_autodetect_test_notworking2_state_t *__state)
+{
+    int __err = 0;
+    delete __state;
+    return __err;
+}
+
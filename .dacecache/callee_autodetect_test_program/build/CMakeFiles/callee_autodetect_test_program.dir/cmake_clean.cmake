@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/callee_autodetect_test_program.dir/root/package/.dacecache/callee_autodetect_test_program/src/cpu/callee_autodetect_test_program.cpp.o"
+  "CMakeFiles/callee_autodetect_test_program.dir/root/package/.dacecache/callee_autodetect_test_program/src/cpu/callee_autodetect_test_program.cpp.o.d"
+  "libcallee_autodetect_test_program.pdb"
+  "libcallee_autodetect_test_program.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/callee_autodetect_test_program.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
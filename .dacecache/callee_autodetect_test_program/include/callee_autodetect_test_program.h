@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * callee_autodetect_test_programHandle_t;
+extern "C" callee_autodetect_test_programHandle_t __dace_init_callee_autodetect_test_program();
+extern "C" int __dace_exit_callee_autodetect_test_program(callee_autodetect_test_programHandle_t handle);
+extern "C" void __program_callee_autodetect_test_program(callee_autodetect_test_programHandle_t handle, double * __restrict__ A);
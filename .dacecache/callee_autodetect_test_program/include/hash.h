@@ -0,0 +1 @@
+#define __HASH_callee_autodetect_test_program "a3fa1a77cd98164f1421e52801b496c09b8154b46d9d1bb726d34e213283b68a"
@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/callee_autodetect_test_program.h"
+
+int main(int argc, char **argv) {
+    callee_autodetect_test_programHandle_t handle;
+    int err;
+    double * __restrict__ A = (double*) calloc(20, sizeof(double));
+
+
+    handle = __dace_init_callee_autodetect_test_program();
+    __program_callee_autodetect_test_program(handle, A);
+    err = __dace_exit_callee_autodetect_test_program(handle);
+
+    free(A);
+
+
+    return err;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/cavity_flow_test_dace_cavity_flow.dir/root/package/.dacecache/cavity_flow_test_dace_cavity_flow/src/cpu/cavity_flow_test_dace_cavity_flow.cpp.o"
+  "CMakeFiles/cavity_flow_test_dace_cavity_flow.dir/root/package/.dacecache/cavity_flow_test_dace_cavity_flow/src/cpu/cavity_flow_test_dace_cavity_flow.cpp.o.d"
+  "libcavity_flow_test_dace_cavity_flow.pdb"
+  "libcavity_flow_test_dace_cavity_flow.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/cavity_flow_test_dace_cavity_flow.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
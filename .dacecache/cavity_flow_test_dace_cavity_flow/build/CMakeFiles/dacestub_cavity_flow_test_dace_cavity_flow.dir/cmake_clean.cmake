@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_cavity_flow_test_dace_cavity_flow.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_cavity_flow_test_dace_cavity_flow.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_cavity_flow_test_dace_cavity_flow.pdb"
+  "libdacestub_cavity_flow_test_dace_cavity_flow.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_cavity_flow_test_dace_cavity_flow.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * cavity_flow_test_dace_cavity_flowHandle_t;
+extern "C" cavity_flow_test_dace_cavity_flowHandle_t __dace_init_cavity_flow_test_dace_cavity_flow(long long nx, long long ny);
+extern "C" int __dace_exit_cavity_flow_test_dace_cavity_flow(cavity_flow_test_dace_cavity_flowHandle_t handle);
+extern "C" void __program_cavity_flow_test_dace_cavity_flow(cavity_flow_test_dace_cavity_flowHandle_t handle, double * __restrict__ p, double * __restrict__ u, double * __restrict__ v, double dt, double dx, double dy, long long nit, long long nt, double nu, long long nx, long long ny, double rho);
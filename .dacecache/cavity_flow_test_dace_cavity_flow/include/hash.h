@@ -0,0 +1 @@
+#define __HASH_cavity_flow_test_dace_cavity_flow "0b9daa393bcba0a9a59113467395d0510b05e583634132ea6dc692f21a2080e7"
@@ -0,0 +1,31 @@
+#include <cstdlib>
+#include "../include/cavity_flow_test_dace_cavity_flow.h"
+
+int main(int argc, char **argv) {
+    cavity_flow_test_dace_cavity_flowHandle_t handle;
+    int err;
+    double dt = 42;
+    double dx = 42;
+    double dy = 42;
+    long long nit = 42;
+    long long nt = 42;
+    double nu = 42;
+    long long nx = 42;
+    long long ny = 42;
+    double rho = 42;
+    double * __restrict__ p = (double*) calloc((nx * ny), sizeof(double));
+    double * __restrict__ u = (double*) calloc((nx * ny), sizeof(double));
+    double * __restrict__ v = (double*) calloc((nx * ny), sizeof(double));
+
+
+    handle = __dace_init_cavity_flow_test_dace_cavity_flow(nx, ny);
+    __program_cavity_flow_test_dace_cavity_flow(handle, p, u, v, dt, dx, dy, nit, nt, nu, nx, ny, rho);
+    err = __dace_exit_cavity_flow_test_dace_cavity_flow(handle);
+
+    free(p);
+    free(u);
+    free(v);
+
+
+    return err;
+}
@@ -0,0 +1,1746 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct cavity_flow_test_dace_cavity_flow_state_t {
+    double __0___tmp74;
+    double __0___tmp75;
+    double __0___tmp76;
+    double __0___tmp80;
+    double __0___tmp81;
+    double __0___tmp86;
+    double __0___tmp87;
+    double __0___tmp105;
+    double __0___tmp106;
+    double __0___tmp107;
+    double __0___tmp111;
+    double __0___tmp112;
+    double __0___tmp117;
+    double __0___tmp118;
+    double * __restrict__ __0_un;
+    double * __restrict__ __0_vn;
+    double * __restrict__ __0_b;
+    double * __restrict__ __0_pn;
+    double __0___tmp44;
+    double __0___tmp47;
+    double __0___tmp50;
+    double __0___tmp51;
+    double __0___tmp52;
+    double __0___tmp53;
+    double __0___tmp55;
+    double __0___tmp56;
+    double __0___tmp57;
+    double __0___tmp58;
+    double __0___tmp59;
+    double __0___tmp60;
+    double __0___tmp61;
+    double __0___tmp62;
+    double __0___tmp35;
+    double __0___tmp37;
+    double __0___tmp5;
+    double __0___tmp10;
+    double __0___tmp15;
+    double __0___tmp19;
+    double __0___tmp24;
+};
+
+void __program_cavity_flow_test_dace_cavity_flow_internal(cavity_flow_test_dace_cavity_flow_state_t*__state, double * __restrict__ p, double * __restrict__ u, double * __restrict__ v, double dt, double dx, double dy, long long nit, long long nt, double nu, long long nx, long long ny, double rho)
+{
+    long long n;
+    long long __sym_nit;
+    long long q;
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < ny; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < nx; __i1 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (_numpy_full_)
+                        __out = 0.0;
+                        ///////////////////
+
+                        __state->__0_b[((__i0 * nx) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+
+
+    for (n = 0; (n < nt); n = (n + 1)) {
+
+        __sym_nit = nit;
+        {
+
+
+            dace::CopyNDDynamic<double, 1, false, 1>::template ConstDst<1>::Copy(
+            u, __state->__0_un, (nx * ny), 1);
+
+            dace::CopyNDDynamic<double, 1, false, 1>::template ConstDst<1>::Copy(
+            v, __state->__0_vn, (nx * ny), 1);
+            {
+                double __in2 = dt;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (dace::float64(1) / __in2);
+                ///////////////////
+
+                __state->__0___tmp35 = __out;
+            }
+            {
+                double __in2 = dx;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (dace::float64(2) * __in2);
+                ///////////////////
+
+                __state->__0___tmp37 = __out;
+            }
+            {
+                double __in2 = dx;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (dace::float64(2) * __in2);
+                ///////////////////
+
+                __state->__0___tmp10 = __out;
+            }
+            {
+                double __in2 = dx;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (dace::float64(2) * __in2);
+                ///////////////////
+
+                __state->__0___tmp19 = __out;
+            }
+            {
+                double __in2 = dy;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (dace::float64(2) * __in2);
+                ///////////////////
+
+                __state->__0___tmp5 = __out;
+            }
+            {
+                double __in2 = dy;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (dace::float64(2) * __in2);
+                ///////////////////
+
+                __state->__0___tmp15 = __out;
+            }
+            {
+                double __in2 = dy;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (dace::float64(2) * __in2);
+                ///////////////////
+
+                __state->__0___tmp24 = __out;
+            }
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < (ny - 2); __i0 += 1) {
+                    for (auto __i1 = 0; __i1 < (nx - 2); __i1 += 1) {
+                        double __s1_n38__out_n39IN___tmp23;
+                        {
+                            double __in1 = v[((__i1 + (nx * (__i0 + 2))) + 1)];
+                            double __in2 = v[(((__i0 * nx) + __i1) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n38__out_n39IN___tmp23 = __out;
+                        }
+                        double __s1_n41__out_n42IN___tmp25;
+                        {
+                            const double __in1 = __s1_n38__out_n39IN___tmp23;
+                            double __in2 = __state->__0___tmp24;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s1_n41__out_n42IN___tmp25 = __out;
+                        }
+                        double __s1_n42__out_n43IN___tmp26;
+                        {
+                            const double __in1 = __s1_n41__out_n42IN___tmp25;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Pow_)
+                            __out = (dace::math::ipow(__in1, 2));
+                            ///////////////////
+
+                            __s1_n42__out_n43IN___tmp26 = __out;
+                        }
+                        double __s1_n32__out_n33IN___tmp17;
+                        {
+                            double __in1 = v[((__i1 + (nx * (__i0 + 1))) + 2)];
+                            double __in2 = v[(__i1 + (nx * (__i0 + 1)))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n32__out_n33IN___tmp17 = __out;
+                        }
+                        double __s1_n27__out_n28IN___tmp14;
+                        {
+                            double __in1 = u[((__i1 + (nx * (__i0 + 2))) + 1)];
+                            double __in2 = u[(((__i0 * nx) + __i1) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n27__out_n28IN___tmp14 = __out;
+                        }
+                        double __s1_n30__out_n31IN___tmp16;
+                        {
+                            const double __in1 = __s1_n27__out_n28IN___tmp14;
+                            double __in2 = __state->__0___tmp15;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s1_n30__out_n31IN___tmp16 = __out;
+                        }
+                        double __s1_n32__out_n33IN___tmp18;
+                        {
+                            const double __in1 = __s1_n30__out_n31IN___tmp16;
+                            const double __in2 = __s1_n32__out_n33IN___tmp17;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s1_n32__out_n33IN___tmp18 = __out;
+                        }
+                        double __s1_n35__out_n36IN___tmp20;
+                        {
+                            const double __in1 = __s1_n32__out_n33IN___tmp18;
+                            double __in2 = __state->__0___tmp19;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s1_n35__out_n36IN___tmp20 = __out;
+                        }
+                        double __s1_n36__out_n37IN___tmp21;
+                        {
+                            const double __in2 = __s1_n35__out_n36IN___tmp20;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (dace::float64(2) * __in2);
+                            ///////////////////
+
+                            __s1_n36__out_n37IN___tmp21 = __out;
+                        }
+                        double __s1_n21__out_n22IN___tmp9;
+                        {
+                            double __in1 = u[((__i1 + (nx * (__i0 + 1))) + 2)];
+                            double __in2 = u[(__i1 + (nx * (__i0 + 1)))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n21__out_n22IN___tmp9 = __out;
+                        }
+                        double __s1_n24__out_n25IN___tmp11;
+                        {
+                            const double __in1 = __s1_n21__out_n22IN___tmp9;
+                            double __in2 = __state->__0___tmp10;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s1_n24__out_n25IN___tmp11 = __out;
+                        }
+                        double __s1_n25__out_n26IN___tmp12;
+                        {
+                            const double __in1 = __s1_n24__out_n25IN___tmp11;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Pow_)
+                            __out = (dace::math::ipow(__in1, 2));
+                            ///////////////////
+
+                            __s1_n25__out_n26IN___tmp12 = __out;
+                        }
+                        double __s1_n14__out_n15IN___tmp4;
+                        {
+                            double __in1 = v[((__i1 + (nx * (__i0 + 2))) + 1)];
+                            double __in2 = v[(((__i0 * nx) + __i1) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n14__out_n15IN___tmp4 = __out;
+                        }
+                        double __s1_n18__out_n19IN___tmp6;
+                        {
+                            const double __in1 = __s1_n14__out_n15IN___tmp4;
+                            double __in2 = __state->__0___tmp5;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s1_n18__out_n19IN___tmp6 = __out;
+                        }
+                        double __s1_n8__out_n9IN___tmp1;
+                        {
+                            double __in1 = u[((__i1 + (nx * (__i0 + 1))) + 2)];
+                            double __in2 = u[(__i1 + (nx * (__i0 + 1)))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n8__out_n9IN___tmp1 = __out;
+                        }
+                        double __s1_n12__out_n13IN___tmp3;
+                        {
+                            const double __in1 = __s1_n8__out_n9IN___tmp1;
+                            double __in2 = __state->__0___tmp37;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s1_n12__out_n13IN___tmp3 = __out;
+                        }
+                        double __s1_n18__out_n19IN___tmp7;
+                        {
+                            const double __in1 = __s1_n12__out_n13IN___tmp3;
+                            const double __in2 = __s1_n18__out_n19IN___tmp6;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            __s1_n18__out_n19IN___tmp7 = __out;
+                        }
+                        double __s1_n19__out_n20IN___tmp8;
+                        {
+                            const double __in2 = __s1_n18__out_n19IN___tmp7;
+                            double __in1 = __state->__0___tmp35;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s1_n19__out_n20IN___tmp8 = __out;
+                        }
+                        double __s1_n25__out_n26IN___tmp13;
+                        {
+                            const double __in1 = __s1_n19__out_n20IN___tmp8;
+                            const double __in2 = __s1_n25__out_n26IN___tmp12;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n25__out_n26IN___tmp13 = __out;
+                        }
+                        double __s1_n36__out_n37IN___tmp22;
+                        {
+                            const double __in1 = __s1_n25__out_n26IN___tmp13;
+                            const double __in2 = __s1_n36__out_n37IN___tmp21;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n36__out_n37IN___tmp22 = __out;
+                        }
+                        double __s1_n42__out_n43IN___tmp27;
+                        {
+                            const double __in1 = __s1_n36__out_n37IN___tmp22;
+                            const double __in2 = __s1_n42__out_n43IN___tmp26;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s1_n42__out_n43IN___tmp27 = __out;
+                        }
+                        {
+                            const double __in2 = __s1_n42__out_n43IN___tmp27;
+                            double __in1 = rho;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __state->__0_b[((__i1 + (nx * (__i0 + 1))) + 1)] = __out;
+                        }
+                    }
+                }
+            }
+
+            dace::CopyNDDynamic<double, 1, false, 1>::template ConstDst<1>::Copy(
+            p, __state->__0_pn, (nx * ny), 1);
+
+        }
+
+
+        for (q = 0; (q < __sym_nit); q = (q + 1)) {
+            {
+
+
+                dace::CopyNDDynamic<double, 1, false, 1>::template ConstDst<1>::Copy(
+                p, __state->__0_pn, (nx * ny), 1);
+                {
+                    double __in1 = dy;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __state->__0___tmp44 = __out;
+                }
+                {
+                    double __in1 = dy;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __state->__0___tmp51 = __out;
+                }
+                {
+                    double __in1 = dy;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __state->__0___tmp56 = __out;
+                }
+                {
+                    double __in1 = dy;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __state->__0___tmp59 = __out;
+                }
+                {
+                    double __in1 = dx;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __state->__0___tmp47 = __out;
+                }
+                {
+                    double __in1 = dx;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __state->__0___tmp50 = __out;
+                }
+                {
+                    double __in1 = __state->__0___tmp50;
+                    double __in2 = __state->__0___tmp51;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __state->__0___tmp52 = __out;
+                }
+                {
+                    double __in2 = __state->__0___tmp52;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (dace::float64(2) * __in2);
+                    ///////////////////
+
+                    __state->__0___tmp53 = __out;
+                }
+                {
+                    double __in1 = dx;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __state->__0___tmp55 = __out;
+                }
+                {
+                    double __in2 = __state->__0___tmp56;
+                    double __in1 = __state->__0___tmp55;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (__in1 * __in2);
+                    ///////////////////
+
+                    __state->__0___tmp57 = __out;
+                }
+                {
+                    double __in1 = dx;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Pow_)
+                    __out = (dace::math::ipow(__in1, 2));
+                    ///////////////////
+
+                    __state->__0___tmp58 = __out;
+                }
+                {
+                    double __in1 = __state->__0___tmp58;
+                    double __in2 = __state->__0___tmp59;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Add_)
+                    __out = (__in1 + __in2);
+                    ///////////////////
+
+                    __state->__0___tmp60 = __out;
+                }
+                {
+                    double __in2 = __state->__0___tmp60;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Mult_)
+                    __out = (dace::float64(2) * __in2);
+                    ///////////////////
+
+                    __state->__0___tmp61 = __out;
+                }
+                {
+                    double __in1 = __state->__0___tmp57;
+                    double __in2 = __state->__0___tmp61;
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (_Div_)
+                    __out = (__in1 / __in2);
+                    ///////////////////
+
+                    __state->__0___tmp62 = __out;
+                }
+                {
+                    #pragma omp parallel for
+                    for (auto __i0 = 0; __i0 < (ny - 2); __i0 += 1) {
+                        for (auto __i1 = 0; __i1 < (nx - 2); __i1 += 1) {
+                            double __s11_n40__out_n41IN___tmp23;
+                            {
+                                double __in1 = __state->__0___tmp62;
+                                double __in2 = __state->__0_b[((__i1 + (nx * (__i0 + 1))) + 1)];
+                                double __out;
+
+                                ///////////////////
+                                // Tasklet code (_Mult_)
+                                __out = (__in1 * __in2);
+                                ///////////////////
+
+                                __s11_n40__out_n41IN___tmp23 = __out;
+                            }
+                            double __s11_n9__out_n10IN___tmp6;
+                            {
+                                double __in1 = __state->__0_pn[((__i1 + (nx * (__i0 + 2))) + 1)];
+                                double __in2 = __state->__0_pn[(((__i0 * nx) + __i1) + 1)];
+                                double __out;
+
+                                ///////////////////
+                                // Tasklet code (_Add_)
+                                __out = (__in1 + __in2);
+                                ///////////////////
+
+                                __s11_n9__out_n10IN___tmp6 = __out;
+                            }
+                            double __s11_n13__out_n14IN___tmp8;
+                            {
+                                const double __in1 = __s11_n9__out_n10IN___tmp6;
+                                double __in2 = __state->__0___tmp47;
+                                double __out;
+
+                                ///////////////////
+                                // Tasklet code (_Mult_)
+                                __out = (__in1 * __in2);
+                                ///////////////////
+
+                                __s11_n13__out_n14IN___tmp8 = __out;
+                            }
+                            double __s11_n3__out_n4IN___tmp3;
+                            {
+                                double __in1 = __state->__0_pn[((__i1 + (nx * (__i0 + 1))) + 2)];
+                                double __in2 = __state->__0_pn[(__i1 + (nx * (__i0 + 1)))];
+                                double __out;
+
+                                ///////////////////
+                                // Tasklet code (_Add_)
+                                __out = (__in1 + __in2);
+                                ///////////////////
+
+                                __s11_n3__out_n4IN___tmp3 = __out;
+                            }
+                            double __s11_n7__out_n8IN___tmp5;
+                            {
+                                const double __in1 = __s11_n3__out_n4IN___tmp3;
+                                double __in2 = __state->__0___tmp44;
+                                double __out;
+
+                                ///////////////////
+                                // Tasklet code (_Mult_)
+                                __out = (__in1 * __in2);
+                                ///////////////////
+
+                                __s11_n7__out_n8IN___tmp5 = __out;
+                            }
+                            double __s11_n13__out_n14IN___tmp9;
+                            {
+                                const double __in1 = __s11_n7__out_n8IN___tmp5;
+                                const double __in2 = __s11_n13__out_n14IN___tmp8;
+                                double __out;
+
+                                ///////////////////
+                                // Tasklet code (_Add_)
+                                __out = (__in1 + __in2);
+                                ///////////////////
+
+                                __s11_n13__out_n14IN___tmp9 = __out;
+                            }
+                            double __s11_n22__out_n23IN___tmp14;
+                            {
+                                const double __in1 = __s11_n13__out_n14IN___tmp9;
+                                double __in2 = __state->__0___tmp53;
+                                double __out;
+
+                                ///////////////////
+                                // Tasklet code (_Div_)
+                                __out = (__in1 / __in2);
+                                ///////////////////
+
+                                __s11_n22__out_n23IN___tmp14 = __out;
+                            }
+                            {
+                                const double __in1 = __s11_n22__out_n23IN___tmp14;
+                                const double __in2 = __s11_n40__out_n41IN___tmp23;
+                                double __out;
+
+                                ///////////////////
+                                // Tasklet code (_Sub_)
+                                __out = (__in1 - __in2);
+                                ///////////////////
+
+                                p[((__i1 + (nx * (__i0 + 1))) + 1)] = __out;
+                            }
+                        }
+                    }
+                }
+
+                dace::CopyNDDynamic<double, 1, false, 1>::Dynamic::Copy(
+                p + (nx - 2), p + (nx - 1), ny, nx, nx);
+
+                dace::CopyNDDynamic<double, 1, false, 1>::template ConstDst<1>::Copy(
+                p + nx, p, nx, 1);
+
+                dace::CopyNDDynamic<double, 1, false, 1>::Dynamic::Copy(
+                p + 1, p, ny, nx, nx);
+
+            }
+            {
+
+                {
+                    #pragma omp parallel for
+                    for (auto __i1 = 0; __i1 < nx; __i1 += 1) {
+                        {
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (assign_44_8)
+                            __out = 0;
+                            ///////////////////
+
+                            p[(__i1 + (nx * (ny - 1)))] = __out;
+                        }
+                    }
+                }
+
+            }
+
+        }
+        {
+
+            {
+                double __in1 = dx;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Pow_)
+                __out = (dace::math::ipow(__in1, 2));
+                ///////////////////
+
+                __state->__0___tmp80 = __out;
+            }
+            {
+                double __in2 = __state->__0___tmp80;
+                double __in1 = dt;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                __state->__0___tmp81 = __out;
+            }
+            {
+                double __in1 = dx;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Pow_)
+                __out = (dace::math::ipow(__in1, 2));
+                ///////////////////
+
+                __state->__0___tmp111 = __out;
+            }
+            {
+                double __in2 = __state->__0___tmp111;
+                double __in1 = dt;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                __state->__0___tmp112 = __out;
+            }
+            {
+                double __in1 = dy;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Pow_)
+                __out = (dace::math::ipow(__in1, 2));
+                ///////////////////
+
+                __state->__0___tmp86 = __out;
+            }
+            {
+                double __in2 = __state->__0___tmp86;
+                double __in1 = dt;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                __state->__0___tmp87 = __out;
+            }
+            {
+                double __in1 = dy;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Pow_)
+                __out = (dace::math::ipow(__in1, 2));
+                ///////////////////
+
+                __state->__0___tmp117 = __out;
+            }
+            {
+                double __in2 = __state->__0___tmp117;
+                double __in1 = dt;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                __state->__0___tmp118 = __out;
+            }
+            {
+                double __in2 = rho;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (dace::float64(2) * __in2);
+                ///////////////////
+
+                __state->__0___tmp74 = __out;
+            }
+            {
+                double __in1 = __state->__0___tmp74;
+                double __in2 = dx;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __state->__0___tmp75 = __out;
+            }
+            {
+                double __in2 = __state->__0___tmp75;
+                double __in1 = dt;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                __state->__0___tmp76 = __out;
+            }
+            {
+                double __in2 = rho;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (dace::float64(2) * __in2);
+                ///////////////////
+
+                __state->__0___tmp105 = __out;
+            }
+            {
+                double __in1 = __state->__0___tmp105;
+                double __in2 = dy;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Mult_)
+                __out = (__in1 * __in2);
+                ///////////////////
+
+                __state->__0___tmp106 = __out;
+            }
+            {
+                double __in2 = __state->__0___tmp106;
+                double __in1 = dt;
+                double __out;
+
+                ///////////////////
+                // Tasklet code (_Div_)
+                __out = (__in1 / __in2);
+                ///////////////////
+
+                __state->__0___tmp107 = __out;
+            }
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < (ny - 2); __i0 += 1) {
+                    for (auto __i1 = 0; __i1 < (nx - 2); __i1 += 1) {
+                        double __s2_n41__out_n42IN___tmp88;
+                        {
+                            double __in2 = __state->__0_un[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (dace::float64(2) * __in2);
+                            ///////////////////
+
+                            __s2_n41__out_n42IN___tmp88 = __out;
+                        }
+                        double __s2_n42__out_n43IN___tmp89;
+                        {
+                            const double __in2 = __s2_n41__out_n42IN___tmp88;
+                            double __in1 = __state->__0_un[((__i1 + (nx * (__i0 + 2))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n42__out_n43IN___tmp89 = __out;
+                        }
+                        double __s2_n43__out_n44IN___tmp90;
+                        {
+                            const double __in1 = __s2_n42__out_n43IN___tmp89;
+                            double __in2 = __state->__0_un[(((__i0 * nx) + __i1) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            __s2_n43__out_n44IN___tmp90 = __out;
+                        }
+                        double __s2_n44__out_n45IN___tmp91;
+                        {
+                            const double __in2 = __s2_n43__out_n44IN___tmp90;
+                            double __in1 = __state->__0___tmp87;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n44__out_n45IN___tmp91 = __out;
+                        }
+                        double __s2_n32__out_n33IN___tmp82;
+                        {
+                            double __in2 = __state->__0_un[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (dace::float64(2) * __in2);
+                            ///////////////////
+
+                            __s2_n32__out_n33IN___tmp82 = __out;
+                        }
+                        double __s2_n33__out_n34IN___tmp83;
+                        {
+                            const double __in2 = __s2_n32__out_n33IN___tmp82;
+                            double __in1 = __state->__0_un[((__i1 + (nx * (__i0 + 1))) + 2)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n33__out_n34IN___tmp83 = __out;
+                        }
+                        double __s2_n34__out_n35IN___tmp84;
+                        {
+                            const double __in1 = __s2_n33__out_n34IN___tmp83;
+                            double __in2 = __state->__0_un[(__i1 + (nx * (__i0 + 1)))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            __s2_n34__out_n35IN___tmp84 = __out;
+                        }
+                        double __s2_n35__out_n36IN___tmp85;
+                        {
+                            const double __in2 = __s2_n34__out_n35IN___tmp84;
+                            double __in1 = __state->__0___tmp81;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n35__out_n36IN___tmp85 = __out;
+                        }
+                        double __s2_n44__out_n45IN___tmp92;
+                        {
+                            const double __in1 = __s2_n35__out_n36IN___tmp85;
+                            const double __in2 = __s2_n44__out_n45IN___tmp91;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            __s2_n44__out_n45IN___tmp92 = __out;
+                        }
+                        double __s2_n45__out_n46IN___tmp93;
+                        {
+                            const double __in2 = __s2_n44__out_n45IN___tmp92;
+                            double __in1 = nu;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n45__out_n46IN___tmp93 = __out;
+                        }
+                        double __s2_n24__out_n25IN___tmp77;
+                        {
+                            double __in1 = p[((__i1 + (nx * (__i0 + 1))) + 2)];
+                            double __in2 = p[(__i1 + (nx * (__i0 + 1)))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n24__out_n25IN___tmp77 = __out;
+                        }
+                        double __s2_n26__out_n27IN___tmp78;
+                        {
+                            const double __in2 = __s2_n24__out_n25IN___tmp77;
+                            double __in1 = __state->__0___tmp76;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n26__out_n27IN___tmp78 = __out;
+                        }
+                        double __s2_n15__out_n16IN___tmp71;
+                        {
+                            double __in1 = __state->__0_un[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __in2 = __state->__0_un[(((__i0 * nx) + __i1) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n15__out_n16IN___tmp71 = __out;
+                        }
+                        double __s2_n10__out_n11IN___tmp69;
+                        {
+                            double __in1 = __state->__0_vn[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __in2 = dt;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n10__out_n11IN___tmp69 = __out;
+                        }
+                        double __s2_n12__out_n13IN___tmp70;
+                        {
+                            const double __in1 = __s2_n10__out_n11IN___tmp69;
+                            double __in2 = dy;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s2_n12__out_n13IN___tmp70 = __out;
+                        }
+                        double __s2_n15__out_n16IN___tmp72;
+                        {
+                            const double __in1 = __s2_n12__out_n13IN___tmp70;
+                            const double __in2 = __s2_n15__out_n16IN___tmp71;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n15__out_n16IN___tmp72 = __out;
+                        }
+                        double __s2_n7__out_n8IN___tmp66;
+                        {
+                            double __in1 = __state->__0_un[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __in2 = __state->__0_un[(__i1 + (nx * (__i0 + 1)))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n7__out_n8IN___tmp66 = __out;
+                        }
+                        double __s2_n1__out_n2IN___tmp64;
+                        {
+                            double __in2 = dt;
+                            double __in1 = __state->__0_un[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n1__out_n2IN___tmp64 = __out;
+                        }
+                        double __s2_n4__out_n5IN___tmp65;
+                        {
+                            const double __in1 = __s2_n1__out_n2IN___tmp64;
+                            double __in2 = dx;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s2_n4__out_n5IN___tmp65 = __out;
+                        }
+                        double __s2_n7__out_n8IN___tmp67;
+                        {
+                            const double __in1 = __s2_n4__out_n5IN___tmp65;
+                            const double __in2 = __s2_n7__out_n8IN___tmp66;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n7__out_n8IN___tmp67 = __out;
+                        }
+                        double __s2_n8__out_n9IN___tmp68;
+                        {
+                            const double __in2 = __s2_n7__out_n8IN___tmp67;
+                            double __in1 = __state->__0_un[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n8__out_n9IN___tmp68 = __out;
+                        }
+                        double __s2_n15__out_n16IN___tmp73;
+                        {
+                            const double __in1 = __s2_n8__out_n9IN___tmp68;
+                            const double __in2 = __s2_n15__out_n16IN___tmp72;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n15__out_n16IN___tmp73 = __out;
+                        }
+                        double __s2_n26__out_n27IN___tmp79;
+                        {
+                            const double __in1 = __s2_n15__out_n16IN___tmp73;
+                            const double __in2 = __s2_n26__out_n27IN___tmp78;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n26__out_n27IN___tmp79 = __out;
+                        }
+                        {
+                            const double __in1 = __s2_n26__out_n27IN___tmp79;
+                            const double __in2 = __s2_n45__out_n46IN___tmp93;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            u[((__i1 + (nx * (__i0 + 1))) + 1)] = __out;
+                        }
+                        double __s2_n83__out_n84IN___tmp119;
+                        {
+                            double __in2 = __state->__0_vn[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (dace::float64(2) * __in2);
+                            ///////////////////
+
+                            __s2_n83__out_n84IN___tmp119 = __out;
+                        }
+                        double __s2_n84__out_n85IN___tmp120;
+                        {
+                            const double __in2 = __s2_n83__out_n84IN___tmp119;
+                            double __in1 = __state->__0_vn[((__i1 + (nx * (__i0 + 2))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n84__out_n85IN___tmp120 = __out;
+                        }
+                        double __s2_n85__out_n86IN___tmp121;
+                        {
+                            const double __in1 = __s2_n84__out_n85IN___tmp120;
+                            double __in2 = __state->__0_vn[(((__i0 * nx) + __i1) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            __s2_n85__out_n86IN___tmp121 = __out;
+                        }
+                        double __s2_n86__out_n87IN___tmp122;
+                        {
+                            const double __in2 = __s2_n85__out_n86IN___tmp121;
+                            double __in1 = __state->__0___tmp118;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n86__out_n87IN___tmp122 = __out;
+                        }
+                        double __s2_n74__out_n75IN___tmp113;
+                        {
+                            double __in2 = __state->__0_vn[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (dace::float64(2) * __in2);
+                            ///////////////////
+
+                            __s2_n74__out_n75IN___tmp113 = __out;
+                        }
+                        double __s2_n75__out_n76IN___tmp114;
+                        {
+                            const double __in2 = __s2_n74__out_n75IN___tmp113;
+                            double __in1 = __state->__0_vn[((__i1 + (nx * (__i0 + 1))) + 2)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n75__out_n76IN___tmp114 = __out;
+                        }
+                        double __s2_n76__out_n77IN___tmp115;
+                        {
+                            const double __in1 = __s2_n75__out_n76IN___tmp114;
+                            double __in2 = __state->__0_vn[(__i1 + (nx * (__i0 + 1)))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            __s2_n76__out_n77IN___tmp115 = __out;
+                        }
+                        double __s2_n77__out_n78IN___tmp116;
+                        {
+                            const double __in2 = __s2_n76__out_n77IN___tmp115;
+                            double __in1 = __state->__0___tmp112;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n77__out_n78IN___tmp116 = __out;
+                        }
+                        double __s2_n86__out_n87IN___tmp123;
+                        {
+                            const double __in1 = __s2_n77__out_n78IN___tmp116;
+                            const double __in2 = __s2_n86__out_n87IN___tmp122;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            __s2_n86__out_n87IN___tmp123 = __out;
+                        }
+                        double __s2_n87__out_n88IN___tmp124;
+                        {
+                            const double __in2 = __s2_n86__out_n87IN___tmp123;
+                            double __in1 = nu;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n87__out_n88IN___tmp124 = __out;
+                        }
+                        double __s2_n67__out_n68IN___tmp108;
+                        {
+                            double __in1 = p[((__i1 + (nx * (__i0 + 2))) + 1)];
+                            double __in2 = p[(((__i0 * nx) + __i1) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n67__out_n68IN___tmp108 = __out;
+                        }
+                        double __s2_n68__out_n69IN___tmp109;
+                        {
+                            const double __in2 = __s2_n67__out_n68IN___tmp108;
+                            double __in1 = __state->__0___tmp107;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n68__out_n69IN___tmp109 = __out;
+                        }
+                        double __s2_n59__out_n60IN___tmp102;
+                        {
+                            double __in1 = __state->__0_vn[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __in2 = __state->__0_vn[(((__i0 * nx) + __i1) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n59__out_n60IN___tmp102 = __out;
+                        }
+                        double __s2_n56__out_n57IN___tmp100;
+                        {
+                            double __in1 = __state->__0_vn[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __in2 = dt;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n56__out_n57IN___tmp100 = __out;
+                        }
+                        double __s2_n57__out_n58IN___tmp101;
+                        {
+                            const double __in1 = __s2_n56__out_n57IN___tmp100;
+                            double __in2 = dy;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s2_n57__out_n58IN___tmp101 = __out;
+                        }
+                        double __s2_n59__out_n60IN___tmp103;
+                        {
+                            const double __in1 = __s2_n57__out_n58IN___tmp101;
+                            const double __in2 = __s2_n59__out_n60IN___tmp102;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n59__out_n60IN___tmp103 = __out;
+                        }
+                        double __s2_n53__out_n54IN___tmp97;
+                        {
+                            double __in1 = __state->__0_vn[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __in2 = __state->__0_vn[(__i1 + (nx * (__i0 + 1)))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n53__out_n54IN___tmp97 = __out;
+                        }
+                        double __s2_n50__out_n51IN___tmp95;
+                        {
+                            double __in1 = __state->__0_un[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __in2 = dt;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n50__out_n51IN___tmp95 = __out;
+                        }
+                        double __s2_n51__out_n52IN___tmp96;
+                        {
+                            const double __in1 = __s2_n50__out_n51IN___tmp95;
+                            double __in2 = dx;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            __s2_n51__out_n52IN___tmp96 = __out;
+                        }
+                        double __s2_n53__out_n54IN___tmp98;
+                        {
+                            const double __in1 = __s2_n51__out_n52IN___tmp96;
+                            const double __in2 = __s2_n53__out_n54IN___tmp97;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            __s2_n53__out_n54IN___tmp98 = __out;
+                        }
+                        double __s2_n54__out_n55IN___tmp99;
+                        {
+                            const double __in2 = __s2_n53__out_n54IN___tmp98;
+                            double __in1 = __state->__0_vn[((__i1 + (nx * (__i0 + 1))) + 1)];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n54__out_n55IN___tmp99 = __out;
+                        }
+                        double __s2_n59__out_n60IN___tmp104;
+                        {
+                            const double __in1 = __s2_n54__out_n55IN___tmp99;
+                            const double __in2 = __s2_n59__out_n60IN___tmp103;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n59__out_n60IN___tmp104 = __out;
+                        }
+                        double __s2_n68__out_n69IN___tmp110;
+                        {
+                            const double __in1 = __s2_n59__out_n60IN___tmp104;
+                            const double __in2 = __s2_n68__out_n69IN___tmp109;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            __s2_n68__out_n69IN___tmp110 = __out;
+                        }
+                        {
+                            const double __in1 = __s2_n68__out_n69IN___tmp110;
+                            const double __in2 = __s2_n87__out_n88IN___tmp124;
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            v[((__i1 + (nx * (__i0 + 1))) + 1)] = __out;
+                        }
+                    }
+                }
+            }
+            {
+                #pragma omp parallel for
+                for (auto __i1 = 0; __i1 < nx; __i1 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_74_8)
+                        __out = 0;
+                        ///////////////////
+
+                        u[__i1] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < ny; __i0 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_75_8)
+                        __out = 0;
+                        ///////////////////
+
+                        u[(__i0 * nx)] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < ny; __i0 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_76_8)
+                        __out = 0;
+                        ///////////////////
+
+                        u[(((__i0 * nx) + nx) - 1)] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i1 = 0; __i1 < nx; __i1 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_77_8)
+                        __out = 1;
+                        ///////////////////
+
+                        u[(__i1 + (nx * (ny - 1)))] = __out;
+                    }
+                }
+            }
+            {
+                #pragma omp parallel for
+                for (auto __i1 = 0; __i1 < nx; __i1 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_78_8)
+                        __out = 0;
+                        ///////////////////
+
+                        v[__i1] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i1 = 0; __i1 < nx; __i1 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_79_8)
+                        __out = 0;
+                        ///////////////////
+
+                        v[(__i1 + (nx * (ny - 1)))] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < ny; __i0 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_80_8)
+                        __out = 0;
+                        ///////////////////
+
+                        v[(__i0 * nx)] = __out;
+                    }
+                }
+            }
+
+        }
+        {
+
+            {
+                #pragma omp parallel for
+                for (auto __i0 = 0; __i0 < ny; __i0 += 1) {
+                    {
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (assign_81_8)
+                        __out = 0;
+                        ///////////////////
+
+                        v[(((__i0 * nx) + nx) - 1)] = __out;
+                    }
+                }
+            }
+
+        }
+
+    }
+
+}
+
+DACE_EXPORTED void __program_cavity_flow_test_dace_cavity_flow(cavity_flow_test_dace_cavity_flow_state_t *__state, double * __restrict__ p, double * __restrict__ u, double * __restrict__ v, double dt, double dx, double dy, long long nit, long long nt, double nu, long long nx, long long ny, double rho)
+{
+    __program_cavity_flow_test_dace_cavity_flow_internal(__state, p, u, v, dt, dx, dy, nit, nt, nu, nx, ny, rho);
+}
+
+DACE_EXPORTED void __program_cavity_flow_test_dace_cavity_flow_repeat(cavity_flow_test_dace_cavity_flow_state_t *__state, long long __dace_repetitions, double * __restrict__ p, double * __restrict__ u, double * __restrict__ v, double dt, double dx, double dy, long long nit, long long nt, double nu, long long nx, long long ny, double rho)
+{
+    for (long long __dace_rep = 0; __dace_rep < __dace_repetitions; ++__dace_rep) {
+        __program_cavity_flow_test_dace_cavity_flow_internal(__state, p, u, v, dt, dx, dy, nit, nt, nu, nx, ny, rho);
+    }
+}
+
+DACE_EXPORTED cavity_flow_test_dace_cavity_flow_state_t *__dace_init_cavity_flow_test_dace_cavity_flow(long long nx, long long ny)
+{
+    int __result = 0;
+    cavity_flow_test_dace_cavity_flow_state_t *__state = new cavity_flow_test_dace_cavity_flow_state_t;
+
+
+    __state->__0_un = new double DACE_ALIGN(64)[(nx * ny)];
+    __state->__0_vn = new double DACE_ALIGN(64)[(nx * ny)];
+    __state->__0_b = new double DACE_ALIGN(64)[(nx * ny)];
+    __state->__0_pn = new double DACE_ALIGN(64)[(nx * ny)];
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED int __dace_exit_cavity_flow_test_dace_cavity_flow(cavity_flow_test_dace_cavity_flow_state_t *__state)
+{
+    int __err = 0;
+    delete[] __state->__0_un;
+    delete[] __state->__0_vn;
+    delete[] __state->__0_b;
+    delete[] __state->__0_pn;
+    delete __state;
+    return __err;
+}
+
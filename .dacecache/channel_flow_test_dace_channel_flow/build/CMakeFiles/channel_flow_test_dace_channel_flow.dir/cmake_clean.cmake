@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/channel_flow_test_dace_channel_flow.dir/root/package/.dacecache/channel_flow_test_dace_channel_flow/src/cpu/channel_flow_test_dace_channel_flow.cpp.o"
+  "CMakeFiles/channel_flow_test_dace_channel_flow.dir/root/package/.dacecache/channel_flow_test_dace_channel_flow/src/cpu/channel_flow_test_dace_channel_flow.cpp.o.d"
+  "libchannel_flow_test_dace_channel_flow.pdb"
+  "libchannel_flow_test_dace_channel_flow.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/channel_flow_test_dace_channel_flow.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_channel_flow_test_dace_channel_flow.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_channel_flow_test_dace_channel_flow.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_channel_flow_test_dace_channel_flow.pdb"
+  "libdacestub_channel_flow_test_dace_channel_flow.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_channel_flow_test_dace_channel_flow.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
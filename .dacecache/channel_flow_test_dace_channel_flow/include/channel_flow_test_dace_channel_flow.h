@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * channel_flow_test_dace_channel_flowHandle_t;
+extern "C" channel_flow_test_dace_channel_flowHandle_t __dace_init_channel_flow_test_dace_channel_flow(long long nx, long long ny);
+extern "C" int __dace_exit_channel_flow_test_dace_channel_flow(channel_flow_test_dace_channel_flowHandle_t handle);
+extern "C" void __program_channel_flow_test_dace_channel_flow(channel_flow_test_dace_channel_flowHandle_t handle, long long * __restrict__ __return, double * __restrict__ p, double * __restrict__ u, double * __restrict__ v, double F, double dt, double dx, double dy, long long nit, double nu, long long nx, long long ny, double rho);
@@ -0,0 +1 @@
+#define __HASH_channel_flow_test_dace_channel_flow "cbc63722b995d40adfd764707eefd68983b8afb8c5925c84ecb2157b1185fc90"